@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Offline benchmark suite for code generation over the bundled example specs.
+
+Times `MCPGenerator.generate()` ("generate" mode) and
+`OpenAPIEnhancer.enhance_and_generate` with rule-based overlays ("enhance"
+mode). No network access or LLM is needed: both run on a copy of each
+example's config with LLM overlay enhancement and agent generation turned off.
+
+Every run is a fresh Python process with its own output directory, so the
+peak RSS (``ru_maxrss``) belongs to that run alone. With ``--cache cold`` (the
+default) each run also gets an empty generator cache directory; with
+``--cache warm`` the runs of a case share one cache, filled by an untimed
+warm-up run. Time is attributed to phases by wrapping the pipeline's methods;
+time spent in a nested phase is not counted again in the enclosing one:
+
+  parse     loading the spec and config (generator, enhancer, overlay constructors)
+  overlay   overlay generation
+  apply     overlay application
+  fix       parameter schema fixes
+  render    template rendering and the rest of ``generate()``
+  ruff      Ruff formatting and linting of the generated files
+  validate  ADR-005 validation suite and generated function validation
+
+Results are written as JSON (medians over ``--repeat`` runs, peak RSS is the
+maximum). ``--baseline`` compares them against an earlier result file and
+exits with status 1 when the total time or peak RSS of a case exceeds the
+baseline by more than ``--threshold`` percent. ``benchmarks/baseline.json``
+was recorded on a development machine; re-record it with ``--update-baseline``
+before comparing on other hardware.
+
+Usage:
+  python benchmarks/bench_codegen.py [--specs NAME ...] [--modes MODE ...] [--repeat N]
+                                     [--cache {cold,warm}] [--output FILE]
+                                     [--baseline FILE] [--threshold PCT] [--update-baseline]
+"""
+
+import argparse
+import datetime
+import functools
+import importlib
+import json
+import logging
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+RESULT_FORMAT = 1
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+
+SPECS = {
+  "argo-workflows": os.path.join(REPO_ROOT, "examples", "argo-workflows", "openapi-argo-workflows.json"),
+  "argo-rollouts": os.path.join(REPO_ROOT, "examples", "argo-rollouts", "openapi-argo-rollouts.json"),
+  "splunk": os.path.join(REPO_ROOT, "examples", "splunk", "openapi-splunk.json"),
+  "argocd": os.path.join(REPO_ROOT, "examples", "argocd", "openapi-argocd.json"),
+}
+MODES = ("generate", "enhance")
+
+ENHANCER = "openapi_mcp_codegen.openapi_enhancer"
+GENERATOR = "openapi_mcp_codegen.mcp_codegen"
+VALIDATORS = "openapi_mcp_codegen.validators"
+
+# phase -> (module, class or None for a module function, attribute) of the wrapped callables
+PHASES = {
+  "parse": [
+    (GENERATOR, "MCPGenerator", "__init__"),
+    (ENHANCER, "OpenAPIEnhancer", "__init__"),
+    (ENHANCER, "OpenAPIOverlayGenerator", "__init__"),
+    (ENHANCER, "OverlayApplier", "__init__"),
+    (ENHANCER, None, "load_spec_file"),
+  ],
+  "overlay": [(ENHANCER, "OpenAPIOverlayGenerator", "generate_overlay")],
+  "apply": [(ENHANCER, "OverlayApplier", "apply_overlay")],
+  "fix": [(ENHANCER, "OpenAPIEnhancer", "_fix_openapi_parameters_in_spec")],
+  "render": [(GENERATOR, "MCPGenerator", "generate")],
+  "ruff": [(GENERATOR, "MCPGenerator", "format_generated_files")],
+  "validate": [
+    (VALIDATORS, "OpenAPIValidator", "run_full_validation_suite"),
+    (GENERATOR, "MCPGenerator", "_run_function_validation"),
+  ],
+}
+
+
+class PhaseTimer:
+  """Accumulates the exclusive time spent in each phase's wrapped callables."""
+
+  def __init__(self):
+    self.totals = dict.fromkeys(PHASES, 0.0)
+    self._children = []  # Time spent in nested phases, one entry per active call
+
+  def _wrap(self, phase, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+      self._children.append(0.0)
+      start = time.perf_counter()
+      try:
+        return fn(*args, **kwargs)
+      finally:
+        elapsed = time.perf_counter() - start
+        self.totals[phase] += elapsed - self._children.pop()
+        if self._children:
+          self._children[-1] += elapsed
+    return wrapper
+
+  def install(self):
+    for phase, targets in PHASES.items():
+      for module_name, class_name, attr in targets:
+        owner = importlib.import_module(module_name)
+        if class_name:
+          owner = getattr(owner, class_name)
+        setattr(owner, attr, self._wrap(phase, getattr(owner, attr)))
+
+
+def peak_rss_mb():
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  # Linux reports kilobytes, macOS bytes
+  return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def prepare_case(spec_name, workdir):
+  """Copy an example spec and an offline version of its config into workdir."""
+  import yaml
+
+  spec_src = SPECS[spec_name]
+  spec_path = os.path.join(workdir, os.path.basename(spec_src))
+  shutil.copy(spec_src, spec_path)
+  with open(os.path.join(os.path.dirname(spec_src), "config.yaml")) as f:
+    config = yaml.safe_load(f) or {}
+  config["overlay_enhancements"] = {**(config.get("overlay_enhancements") or {}), "use_llm": False}
+  for key in ("generate_agent", "generate_eval", "enable_slim", "with_a2a_proxy"):
+    config[key] = False
+  config_path = os.path.join(workdir, "config.yaml")
+  with open(config_path, "w") as f:
+    yaml.safe_dump(config, f)
+  return spec_path, config_path
+
+
+def run_case(spec_name, mode):
+  """Run one case in this process and return its measurements."""
+  logging.disable(logging.WARNING)
+  timer = PhaseTimer()
+  timer.install()
+  from openapi_mcp_codegen.mcp_codegen import MCPGenerator
+  from openapi_mcp_codegen.openapi_enhancer import OpenAPIEnhancer
+
+  with tempfile.TemporaryDirectory() as workdir:
+    spec_path, config_path = prepare_case(spec_name, workdir)
+    output_dir = os.path.join(workdir, "out")
+    start = time.perf_counter()
+    if mode == "generate":
+      MCPGenerator(
+        script_dir=os.path.join(REPO_ROOT, "openapi_mcp_codegen"),
+        spec_path=spec_path,
+        output_dir=output_dir,
+        config_path=config_path,
+      ).generate()
+    elif not OpenAPIEnhancer(spec_path, config_path).enhance_and_generate(output_dir):
+      raise RuntimeError(f"Enhancement pipeline failed for {spec_name}")
+    total = time.perf_counter() - start
+
+  return {
+    "total_seconds": total,
+    "phases": {phase: seconds for phase, seconds in timer.totals.items() if seconds},
+    "peak_rss_mb": peak_rss_mb(),
+  }
+
+
+def measure(spec_name, mode, cache_dir):
+  """Run one case in a fresh interpreter."""
+  env = dict(os.environ, OPENAPI_MCP_CODEGEN_CACHE_DIR=cache_dir)
+  # Ruff is installed next to the interpreter
+  env["PATH"] = os.path.dirname(sys.executable) + os.pathsep + env.get("PATH", "")
+  with tempfile.NamedTemporaryFile(suffix=".json") as result_file:
+    proc = subprocess.run(
+      [sys.executable, os.path.abspath(__file__), "--run-case", spec_name, mode, result_file.name],
+      env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    if proc.returncode != 0:
+      raise RuntimeError(f"{spec_name}/{mode} failed:\n{proc.stderr[-2000:]}")
+    with open(result_file.name) as f:
+      return json.load(f)
+
+
+def run_suite(spec_names, modes, repeat, cache):
+  results = {}
+  for spec_name in spec_names:
+    for mode in modes:
+      runs = []
+      with tempfile.TemporaryDirectory() as shared_cache:
+        if cache == "warm":
+          measure(spec_name, mode, shared_cache)
+        for _ in range(repeat):
+          if cache == "warm":
+            runs.append(measure(spec_name, mode, shared_cache))
+          else:
+            with tempfile.TemporaryDirectory() as cold_cache:
+              runs.append(measure(spec_name, mode, cold_cache))
+      phases = sorted({phase for run in runs for phase in run["phases"]}, key=list(PHASES).index)
+      results[f"{spec_name}/{mode}"] = {
+        "spec": spec_name,
+        "mode": mode,
+        "spec_bytes": os.path.getsize(SPECS[spec_name]),
+        "total_seconds": round(statistics.median(run["total_seconds"] for run in runs), 4),
+        "phases": {phase: round(statistics.median(run["phases"].get(phase, 0.0) for run in runs), 4) for phase in phases},
+        "peak_rss_mb": round(max(run["peak_rss_mb"] for run in runs), 1),
+        "runs": [round(run["total_seconds"], 4) for run in runs],
+      }
+      print_case(f"{spec_name}/{mode}", results[f"{spec_name}/{mode}"])
+  return {
+    "format": RESULT_FORMAT,
+    "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    "environment": {
+      "python": platform.python_version(),
+      "platform": platform.platform(),
+      "cpu_count": os.cpu_count(),
+    },
+    "settings": {"repeat": repeat, "cache": cache},
+    "results": results,
+  }
+
+
+def print_case(name, result):
+  phases = "  ".join(f"{phase}={seconds * 1000:.0f}ms" for phase, seconds in result["phases"].items())
+  print(f"{name:<26}{result['total_seconds']:>8.2f}s{result['peak_rss_mb']:>9.0f} MB  {phases}", flush=True)
+
+
+def compare(current, baseline, threshold):
+  """Print the change from the baseline per case and return the regressions."""
+  regressions = []
+  print(f"\n{'case':<26}{'time':>10}{'baseline':>10}{'change':>9}{'rss MB':>9}{'baseline':>10}{'change':>9}")
+  for name, result in current["results"].items():
+    base = baseline.get("results", {}).get(name)
+    if base is None:
+      print(f"{name:<26}{result['total_seconds']:>9.2f}s{'-':>10}{'':>9}{result['peak_rss_mb']:>9.0f}{'-':>10}")
+      continue
+    changes = {}
+    for metric in ("total_seconds", "peak_rss_mb"):
+      changes[metric] = (result[metric] - base[metric]) / base[metric] * 100.0 if base[metric] else 0.0
+      if changes[metric] > threshold:
+        regressions.append(f"{name}: {metric} {base[metric]:.2f} -> {result[metric]:.2f} ({changes[metric]:+.1f}%)")
+    print(
+      f"{name:<26}{result['total_seconds']:>9.2f}s{base['total_seconds']:>9.2f}s{changes['total_seconds']:>+8.1f}%"
+      f"{result['peak_rss_mb']:>9.0f}{base['peak_rss_mb']:>10.0f}{changes['peak_rss_mb']:>+8.1f}%"
+    )
+  return regressions
+
+
+def main():
+  if len(sys.argv) == 5 and sys.argv[1] == "--run-case":
+    _, _, spec_name, mode, result_path = sys.argv
+    result = run_case(spec_name, mode)
+    with open(result_path, "w") as f:
+      json.dump(result, f)
+    return 0
+
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--specs", nargs="+", choices=list(SPECS), default=list(SPECS), help="Example specs to run (default: all)")
+  parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="Pipelines to run (default: both)")
+  parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: 3)")
+  parser.add_argument("--cache", choices=("cold", "warm"), default="cold", help="Generator cache state (default: cold)")
+  parser.add_argument("--output", help="Write the results to this JSON file")
+  parser.add_argument("--baseline", nargs="?", const=DEFAULT_BASELINE,
+                      help=f"Compare against a results file (default when given without a path: {DEFAULT_BASELINE})")
+  parser.add_argument("--threshold", type=float, default=25.0,
+                      help="Allowed increase over the baseline in percent (default: 25)")
+  parser.add_argument("--update-baseline", action="store_true", help="Write the results to the baseline file")
+  args = parser.parse_args()
+
+  print(f"{'case':<26}{'time':>9}{'peak RSS':>12}  phases")
+  results = run_suite(args.specs, args.modes, max(1, args.repeat), args.cache)
+
+  if args.output:
+    with open(args.output, "w") as f:
+      json.dump(results, f, indent=2)
+      f.write("\n")
+
+  status = 0
+  if args.baseline and not args.update_baseline:
+    with open(args.baseline) as f:
+      baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+      print(f"\nRegressions over {args.threshold:g}%:")
+      for regression in regressions:
+        print(f"  {regression}")
+      status = 1
+    else:
+      print(f"\nNo regressions over {args.threshold:g}%")
+
+  if args.update_baseline:
+    baseline_path = args.baseline or DEFAULT_BASELINE
+    with open(baseline_path, "w") as f:
+      json.dump(results, f, indent=2)
+      f.write("\n")
+    print(f"\nWrote baseline: {baseline_path}")
+  return status
+
+
+if __name__ == "__main__":
+  sys.exit(main())
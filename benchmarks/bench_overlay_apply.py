@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Micro-benchmark for applying overlays with `OverlayApplier`.
+
+Generates the rule-based overlay for the Argo example specs and applies it
+once with every target evaluated by jsonpath-ng (parsed per action, as before
+the fast path) and once with the direct-indexing fast path for the simple
+targets the generator emits. (The jsonpath-only mode is a timing baseline:
+it mis-resolves path keys that contain dots, such as Argo CD's
+``{application.metadata.name}`` paths.)
+
+Usage:
+  python benchmarks/bench_overlay_apply.py [--repeat N]
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from openapi_mcp_codegen import openapi_enhancer  # noqa: E402
+from openapi_mcp_codegen.openapi_enhancer import OpenAPIOverlayGenerator, OverlayApplier  # noqa: E402
+
+SPECS = {
+  "argo-workflows": os.path.join(REPO_ROOT, "examples", "argo-workflows", "openapi-argo-workflows.json"),
+  "argo-rollouts": os.path.join(REPO_ROOT, "examples", "argo-rollouts", "openapi-argo-rollouts.json"),
+  "argocd": os.path.join(REPO_ROOT, "examples", "argocd", "openapi-argocd.json"),
+}
+
+
+def jsonpath_only(target):
+  """Stand-in for parse_simple_target that sends every target through jsonpath-ng."""
+  return None
+
+
+def uncached_compile(target):
+  from jsonpath_ng.ext import parse as jsonpath_parse
+
+  return jsonpath_parse(target)
+
+
+def run(spec_path, overlay_path, fast):
+  originals = (openapi_enhancer.parse_simple_target, openapi_enhancer._compile_jsonpath)
+  if not fast:
+    openapi_enhancer.parse_simple_target = jsonpath_only
+    openapi_enhancer._compile_jsonpath = uncached_compile
+  try:
+    applier = OverlayApplier(spec_path, overlay_path)
+    start = time.perf_counter()
+    result = applier.apply_overlay()
+    return time.perf_counter() - start, result
+  finally:
+    openapi_enhancer.parse_simple_target, openapi_enhancer._compile_jsonpath = originals
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode (default: 3)")
+  args = parser.parse_args()
+  logging.disable(logging.WARNING)
+
+  print(f"{'spec':<16}{'actions':>8}{'jsonpath (ms)':>16}{'fast path (ms)':>16}{'speedup':>10}")
+  with tempfile.TemporaryDirectory() as tmp:
+    for name, spec_path in SPECS.items():
+      overlay = OpenAPIOverlayGenerator(spec_path, overlay_config={"use_llm": False}).generate_overlay()
+      overlay_path = os.path.join(tmp, f"{name}-overlay.json")
+      with open(overlay_path, "w") as f:
+        json.dump(overlay, f)
+
+      timings = {}
+      for fast in (False, True):
+        timings[fast] = statistics.median(run(spec_path, overlay_path, fast)[0] for _ in range(args.repeat)) * 1000
+      print(
+        f"{name:<16}{len(overlay['actions']):>8}{timings[False]:>16.1f}{timings[True]:>16.1f}"
+        f"{timings[False] / timings[True]:>9.1f}x"
+      )
+
+
+if __name__ == "__main__":
+  main()
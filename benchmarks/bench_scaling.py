@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Scaling benchmark on synthetic specs.
+
+Builds specs with `openapi_mcp_codegen.synth_spec` and sweeps one dimension at
+a time -- number of operations, allOf schema depth and $ref fan-out -- keeping
+the others at their base values. Every point runs in a fresh process, which
+times
+
+  parse     loading the spec (``MCPGenerator`` construction)
+  names     ``truncate_function_name`` over every tool operation
+  bodies    ``_extract_body_params`` over every request body
+  overlay   rule-based overlay generation and ``OverlayApplier.apply_overlay``
+  generate  ``MCPGenerator.generate()`` (Ruff is skipped unless ``--with-ruff``)
+
+and records the peak RSS. For each sweep the script prints the fitted scaling
+exponent of every phase (the slope of log(time) against log(size): about 1
+means linear, about 2 quadratic). ``--output`` writes all points as JSON and
+``--plot`` draws them (requires matplotlib).
+
+Usage:
+  python benchmarks/bench_scaling.py [--operations N ...] [--depths N ...] [--fanouts N ...]
+                                     [--with-ruff] [--output FILE] [--plot FILE.png]
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from bench_codegen import peak_rss_mb  # noqa: E402
+from openapi_mcp_codegen.synth_spec import synthesize_spec, synthetic_config  # noqa: E402
+
+PHASES = ("parse", "names", "bodies", "overlay", "generate")
+BASE = {"operations": 500, "schema_depth": 2, "ref_fanout": 2}
+# The sweep option and the synthesize_spec argument it varies
+SWEEPS = (("operations", "operations"), ("depths", "schema_depth"), ("fanouts", "ref_fanout"))
+
+
+def run_point(spec_path, with_ruff):
+  """Time the phases for one synthetic spec in this process."""
+  logging.disable(logging.WARNING)
+  from openapi_mcp_codegen.mcp_codegen import MCPGenerator, camel_to_snake, truncate_function_name
+  from openapi_mcp_codegen.openapi_enhancer import OpenAPIOverlayGenerator, OverlayApplier
+
+  workdir = os.path.dirname(spec_path)
+  timings = {}
+
+  start = time.perf_counter()
+  gen = MCPGenerator(
+    script_dir=os.path.join(REPO_ROOT, "openapi_mcp_codegen"),
+    spec_path=spec_path,
+    output_dir=os.path.join(workdir, "out"),
+    config_path=os.path.join(workdir, "config.yaml"),
+  )
+  operations = list(gen.ir.tool_operations())
+  timings["parse"] = time.perf_counter() - start
+
+  start = time.perf_counter()
+  used_names = set()
+  for operation in operations:
+    truncate_function_name(camel_to_snake(operation.operation_id), operation.http_method, used_names)
+  timings["names"] = time.perf_counter() - start
+
+  start = time.perf_counter()
+  for operation in operations:
+    if operation.request_body_schema:
+      gen._extract_body_params(operation.request_body_schema, prefix="body")
+  timings["bodies"] = time.perf_counter() - start
+  # generate() below starts from empty caches
+  gen._body_params_cache.clear()
+  gen._param_count_cache.clear()
+
+  start = time.perf_counter()
+  overlay = OpenAPIOverlayGenerator(spec_path, overlay_config={"use_llm": False}).generate_overlay()
+  OverlayApplier(spec_path, None, overlay=overlay).apply_overlay()
+  timings["overlay"] = time.perf_counter() - start
+
+  if not with_ruff:
+    gen.run_ruff_lint = lambda *files: None
+  start = time.perf_counter()
+  gen.generate()
+  timings["generate"] = time.perf_counter() - start
+
+  return {"tool_operations": len(operations), "phases": timings, "peak_rss_mb": peak_rss_mb()}
+
+
+def measure(params, with_ruff):
+  """Synthesize a spec and run one point in a fresh interpreter."""
+  with tempfile.TemporaryDirectory() as workdir:
+    spec = synthesize_spec(**params)
+    spec_path = os.path.join(workdir, "spec.json")
+    with open(spec_path, "w") as f:
+      json.dump(spec, f)
+    with open(os.path.join(workdir, "config.yaml"), "w") as f:
+      json.dump(synthetic_config(), f)  # JSON is valid YAML
+    result_path = os.path.join(workdir, "result.json")
+    env = dict(os.environ, OPENAPI_MCP_CODEGEN_CACHE_DIR=os.path.join(workdir, "cache"))
+    env["PATH"] = os.path.dirname(sys.executable) + os.pathsep + env.get("PATH", "")
+    command = [sys.executable, os.path.abspath(__file__), "--run-point", spec_path, result_path]
+    if with_ruff:
+      command.append("--with-ruff")
+    proc = subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if proc.returncode != 0:
+      raise RuntimeError(f"{params} failed:\n{proc.stderr[-2000:]}")
+    with open(result_path) as f:
+      result = json.load(f)
+    result.update(params=params, spec_bytes=os.path.getsize(spec_path),
+                  components=len(spec["components"]["schemas"]))
+    return result
+
+
+def scaling_exponent(sizes, seconds):
+  """Least-squares slope of log(seconds) against log(size), ignoring non-positive values."""
+  points = [(math.log(x), math.log(y)) for x, y in zip(sizes, seconds) if x > 0 and y > 0]
+  if len(points) < 2:
+    return None
+  mean_x = sum(x for x, _ in points) / len(points)
+  mean_y = sum(y for _, y in points) / len(points)
+  variance = sum((x - mean_x) ** 2 for x, _ in points)
+  if not variance:
+    return None
+  return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def plot(sweeps, path):
+  try:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+  except ImportError:
+    print("matplotlib is not installed; skipping --plot", file=sys.stderr)
+    return
+  fig, axes = plt.subplots(1, len(sweeps), figsize=(6 * len(sweeps), 4.5), squeeze=False)
+  for ax, (param, points) in zip(axes[0], sweeps.items()):
+    sizes = [point["params"][param] for point in points]
+    for phase in PHASES:
+      ax.plot(sizes, [point["phases"][phase] for point in points], marker="o", label=phase)
+    ax.set_xlabel(param)
+    ax.set_ylabel("seconds")
+    ax.set_xscale("symlog" if 0 in sizes else "log")
+    ax.set_yscale("log")
+    rss = ax.twinx()
+    rss.plot(sizes, [point["peak_rss_mb"] for point in points], color="grey", linestyle="--", label="peak RSS")
+    rss.set_ylabel("peak RSS (MB)")
+    ax.legend(loc="upper left", fontsize="small")
+  fig.tight_layout()
+  fig.savefig(path)
+  print(f"Wrote plot: {path}")
+
+
+def main():
+  if len(sys.argv) >= 4 and sys.argv[1] == "--run-point":
+    result = run_point(sys.argv[2], with_ruff="--with-ruff" in sys.argv[4:])
+    with open(sys.argv[3], "w") as f:
+      json.dump(result, f)
+    return 0
+
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--operations", nargs="*", type=int, default=[250, 500, 1000, 2000, 4000],
+                      help="Operation counts to sweep (default: 250 500 1000 2000 4000)")
+  parser.add_argument("--depths", nargs="*", type=int, default=[1, 2, 4, 8, 16],
+                      help="allOf depths to sweep (default: 1 2 4 8 16)")
+  parser.add_argument("--fanouts", nargs="*", type=int, default=[1, 2, 4, 8, 16],
+                      help="$ref fan-outs to sweep (default: 1 2 4 8 16)")
+  parser.add_argument("--seed", type=int, default=0, help="Synthesizer seed (default: 0)")
+  parser.add_argument("--with-ruff", action="store_true", help="Include Ruff formatting in generate()")
+  parser.add_argument("--output", help="Write all points to this JSON file")
+  parser.add_argument("--plot", help="Plot the sweeps to this image file (requires matplotlib)")
+  args = parser.parse_args()
+
+  sweeps = {}
+  for option, param in SWEEPS:
+    values = getattr(args, option)
+    if not values:
+      continue
+    print(f"\n{param:<14}{'ops':>7}{'schemas':>9}" + "".join(f"{phase:>10}" for phase in PHASES) + f"{'RSS MB':>9}")
+    points = []
+    for value in values:
+      params = {**BASE, param: value, "seed": args.seed}
+      # One entity schema per five operations, as in a typical CRUD API
+      params["schemas"] = max(1, params["operations"] // 5)
+      point = measure(params, args.with_ruff)
+      points.append(point)
+      print(f"{value:<14}{point['tool_operations']:>7}{point['components']:>9}"
+            + "".join(f"{point['phases'][phase]:>9.3f}s" for phase in PHASES) + f"{point['peak_rss_mb']:>9.0f}",
+            flush=True)
+    exponents = {phase: scaling_exponent([p["params"][param] for p in points], [p["phases"][phase] for p in points])
+                 for phase in PHASES}
+    print(f"{'exponent':<30}" + "".join(f"{e:>10.2f}" if e is not None else f"{'-':>10}" for e in exponents.values()))
+    sweeps[param] = points
+
+  if args.output:
+    with open(args.output, "w") as f:
+      json.dump({"base": BASE, "seed": args.seed, "with_ruff": args.with_ruff, "sweeps": sweeps}, f, indent=2)
+      f.write("\n")
+  if args.plot:
+    plot(sweeps, args.plot)
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Micro-benchmark for request-body schema flattening.
+
+Flattens the request body of every operation in the Argo Workflows and Splunk
+example specs the way `MCPGenerator.generate_tool_modules` does, once with the
+flattening caches cleared before every operation (no reuse across operations)
+and once with the caches shared for the whole run.
+
+Usage:
+  python benchmarks/bench_schema_flattening.py [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from openapi_mcp_codegen.mcp_codegen import MCPGenerator  # noqa: E402
+
+SPECS = {
+  "argo-workflows": os.path.join(REPO_ROOT, "examples", "argo-workflows", "openapi-argo-workflows.json"),
+  "splunk": os.path.join(REPO_ROOT, "examples", "splunk", "openapi-splunk.json"),
+}
+
+
+def body_schemas(gen):
+  """Yield the request body schema of every generated operation."""
+  for ops in gen.spec.get("paths", {}).values():
+    for method, op in ops.items():
+      if method.upper() not in ["GET", "POST", "PUT", "DELETE"]:
+        continue
+      for p in list(ops.get("parameters", [])) + list(op.get("parameters", [])):
+        if "$ref" in p:
+          p = gen._resolve_ref(p["$ref"])
+        if p.get("in") == "body":
+          yield p.get("schema", {})
+      request_body = op.get("requestBody")
+      if request_body:
+        if "$ref" in request_body:
+          request_body = gen._resolve_ref(request_body["$ref"]) or {}
+        content = request_body.get("content", {})
+        media = content.get("application/json") or next(iter(content.values()), {})
+        if media.get("schema"):
+          yield media["schema"]
+
+
+def clear_caches(gen):
+  gen._body_params_cache.clear()
+  gen._param_count_cache.clear()
+
+
+def run(gen, schemas, shared):
+  clear_caches(gen)
+  start = time.perf_counter()
+  for schema in schemas:
+    if not shared:
+      clear_caches(gen)
+    gen._extract_body_params(schema, prefix="body")
+  return time.perf_counter() - start
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--repeat", type=int, default=5, help="Timed runs per mode (default: 5)")
+  args = parser.parse_args()
+  logging.disable(logging.INFO)
+
+  print(f"{'spec':<16}{'bodies':>8}{'per-op cache (ms)':>20}{'shared cache (ms)':>20}{'speedup':>10}")
+  with tempfile.TemporaryDirectory() as output_dir:
+    for name, spec_path in SPECS.items():
+      gen = MCPGenerator(
+        script_dir=os.path.join(REPO_ROOT, "openapi_mcp_codegen"),
+        spec_path=spec_path,
+        output_dir=os.path.join(output_dir, name),
+        config_path=os.path.join(os.path.dirname(spec_path), "config.yaml"),
+      )
+      schemas = list(body_schemas(gen))
+      per_op = statistics.median(run(gen, schemas, shared=False) for _ in range(args.repeat))
+      shared = statistics.median(run(gen, schemas, shared=True) for _ in range(args.repeat))
+      speedup = per_op / shared if shared else float("inf")
+      print(f"{name:<16}{len(schemas):>8}{per_op * 1000:>20.2f}{shared * 1000:>20.2f}{speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+  main()
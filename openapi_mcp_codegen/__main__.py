@@ -7,20 +7,10 @@ Script to generate an MCP server from an OpenAPI specification
 """
 
 import os
-import json
 import yaml
 import click
 import dotenv
-from openapi_mcp_codegen.mcp_codegen import MCPGenerator
-from openapi_mcp_codegen.a2a_agent_codegen import A2AAgentGenerator
-
-def load_spec(spec_path):
-    """Load the OpenAPI spec from either JSON or YAML file"""
-    with open(spec_path, 'r', encoding='utf-8') as f:
-        if spec_path.endswith('.yaml') or spec_path.endswith('.yml'):
-            return yaml.safe_load(f)
-        else:
-            return json.load(f)
+from openapi_mcp_codegen.spec_loader import load_spec
 
 def get_mcp_name(spec_path):
     """Get the MCP name from the OpenAPI spec"""
@@ -99,6 +89,52 @@ def get_mcp_name(spec_path):
   default=False,
   help="Enhance generated docstrings using an LLM and add OpenAPI spec to docstring.",
 )
+@click.option(
+  "--jobs",
+  type=click.IntRange(min=0),
+  default=1,
+  show_default=True,
+  help="Worker processes for rendering tool modules and models (0 = one per CPU).",
+)
+@click.option(
+  "--tool-mode",
+  type=click.Choice(["function", "table"]),
+  default="function",
+  show_default=True,
+  help="Generate a full function body per operation, or an operation table run by one shared executor.",
+)
+@click.option(
+  "--lazy-tools",
+  is_flag=True,
+  default=False,
+  help="Register tools from a generated manifest and import each tool module on its first call.",
+)
+@click.option(
+  "--no-llm-cache",
+  is_flag=True,
+  default=False,
+  help="Do not read or write cached LLM docstrings.",
+)
+@click.option(
+  "--refresh-llm-cache",
+  is_flag=True,
+  default=False,
+  help="Ignore cached LLM docstrings and store new ones.",
+)
+@click.option(
+  "--profile",
+  "profile_path",
+  type=click.Path(dir_okay=False),
+  default=None,
+  help="Write a JSON timing report (phases, templates, files, Ruff, LLM calls) to this path.",
+)
+@click.option(
+  "--cprofile",
+  "cprofile_path",
+  type=click.Path(dir_okay=False),
+  default=None,
+  help="Dump cProfile statistics of the run to this path.",
+)
 def main(
    log_level,
    spec_file,
@@ -111,6 +147,13 @@ def main(
    generate_system_prompt,
    with_a2a_proxy,
    enable_slim,
+   jobs,
+   tool_mode,
+   lazy_tools,
+   no_llm_cache,
+   refresh_llm_cache,
+   profile_path,
+   cprofile_path,
 ):
   # Load environment variables from .env file if present
   env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
@@ -135,21 +178,30 @@ def main(
   if not os.path.exists(config_path):
     raise FileNotFoundError(f"Configuration file not found: {config_path}")
   # Create the generator and generate the MCP server
-  generator = MCPGenerator(
-      script_dir=script_dir,
-      spec_path=spec_path,
-      output_dir=output_dir,
-      config_path=config_path,
-      dry_run=dry_run,
-      enhance_docstring_with_llm=enhance_docstring_with_llm,
-      enhance_docstring_with_llm_openapi=enhance_docstring_with_llm_openapi,
-      generate_agent=generate_agent,
-      generate_eval=generate_eval,
-      generate_system_prompt=generate_system_prompt,
-      with_a2a_proxy=with_a2a_proxy,
-      enable_slim=enable_slim,
-  )
-  generator.generate()
+  from openapi_mcp_codegen import profiling
+  from openapi_mcp_codegen.mcp_codegen import MCPGenerator
+
+  with profiling.profile("generate-mcp", profile_path, cprofile_path):
+    generator = MCPGenerator(
+        script_dir=script_dir,
+        spec_path=spec_path,
+        output_dir=output_dir,
+        config_path=config_path,
+        dry_run=dry_run,
+        enhance_docstring_with_llm=enhance_docstring_with_llm,
+        enhance_docstring_with_llm_openapi=enhance_docstring_with_llm_openapi,
+        generate_agent=generate_agent,
+        generate_eval=generate_eval,
+        generate_system_prompt=generate_system_prompt,
+        with_a2a_proxy=with_a2a_proxy,
+        enable_slim=enable_slim,
+        jobs=jobs,
+        tool_mode=tool_mode,
+        lazy_tools=lazy_tools,
+        use_llm_cache=not no_llm_cache,
+        refresh_llm_cache=refresh_llm_cache,
+    )
+    generator.generate()
 
   print(f"🎉 Generated MCP server in {output_dir}")
   print("\n🚀 See the README.md to continue")
@@ -240,6 +292,8 @@ def generate_a2a_agent_with_remote_mcp(
   print(f"Using configuration file: {config_path}")
 
   # Create the A2A agent generator
+  from openapi_mcp_codegen.a2a_agent_codegen import A2AAgentGenerator
+
   generator = A2AAgentGenerator(
       script_dir=script_dir,
       spec_path=spec_path,
@@ -276,7 +330,14 @@ def generate_a2a_agent_with_remote_mcp(
   default=False,
   help="Enable verbose logging for detailed validation output.",
 )
-def validate_functions(project_root, verbose):
+@click.option(
+  "--jobs",
+  type=click.IntRange(min=0),
+  default=0,
+  show_default=True,
+  help="Worker processes for parsing changed tool files (0 = one per CPU).",
+)
+def validate_functions(project_root, verbose, jobs):
     """Validate all generated MCP functions for compliance and quality."""
     
     try:
@@ -296,7 +357,7 @@ def validate_functions(project_root, verbose):
         print("🔍 Running function validation...")
         print(f"📋 Project root: {project_root}")
         
-        validator = FunctionValidator(project_root)
+        validator = FunctionValidator(project_root, jobs=jobs)
         success = validator.validate_all_projects()
         
         if success:
@@ -317,6 +378,49 @@ def validate_functions(project_root, verbose):
         exit(1)
 
 
+@click.command(short_help="Write a synthetic OpenAPI spec for scaling tests")
+@click.option(
+  "--output",
+  "-o",
+  type=click.Path(dir_okay=False, writable=True),
+  required=True,
+  help="Spec file to write (.json, .yaml or .yml).",
+)
+@click.option("--operations", type=click.IntRange(min=1), default=100, show_default=True, help="Number of operations.")
+@click.option("--schemas", type=click.IntRange(min=1), default=50, show_default=True, help="Number of entity schemas.")
+@click.option("--schema-depth", type=click.IntRange(min=0), default=2, show_default=True, help="Length of each entity's allOf chain.")
+@click.option("--ref-fanout", type=click.IntRange(min=0), default=2, show_default=True, help="$ref properties from each entity to other entities.")
+@click.option("--enum-size", type=click.IntRange(min=0), default=10, show_default=True, help="Values of each entity's enum property.")
+@click.option("--recursive/--no-recursive", default=True, show_default=True, help="Add self references and reference cycles.")
+@click.option("--seed", type=int, default=0, show_default=True, help="Random seed.")
+def synth_spec(output, operations, schemas, schema_depth, ref_fanout, enum_size, recursive, seed):
+  """Write a seeded, deterministic synthetic spec and a config.yaml next to it (if missing)."""
+  import json
+  from openapi_mcp_codegen.synth_spec import synthesize_spec, synthetic_config
+
+  spec = synthesize_spec(
+    operations=operations,
+    schemas=schemas,
+    schema_depth=schema_depth,
+    ref_fanout=ref_fanout,
+    enum_size=enum_size,
+    recursive=recursive,
+    seed=seed,
+  )
+  output_dir = os.path.dirname(os.path.abspath(output))
+  os.makedirs(output_dir, exist_ok=True)
+  with open(output, 'w') as f:
+    if output.endswith(('.yaml', '.yml')):
+      yaml.safe_dump(spec, f, sort_keys=False)
+    else:
+      json.dump(spec, f, indent=2)
+  config_path = os.path.join(output_dir, 'config.yaml')
+  if not os.path.exists(config_path):
+    with open(config_path, 'w') as f:
+      yaml.dump(synthetic_config(), f, default_flow_style=False)
+  print(f"Wrote {output}: {operations} operations, {len(spec['components']['schemas'])} component schemas")
+
+
 # Create a multi-command CLI
 @click.group()
 def cli():
@@ -327,13 +431,14 @@ def cli():
 cli.add_command(main, name="generate-mcp")
 cli.add_command(generate_a2a_agent_with_remote_mcp)
 cli.add_command(validate_functions)
+cli.add_command(synth_spec)
 
 if __name__ == '__main__':
     # Check if this is being called as a direct command (backward compatibility)
     import sys
 
     # If first argument is not a subcommand, assume it's the original direct interface
-    if len(sys.argv) > 1 and not sys.argv[1] in ['generate-mcp', 'generate-a2a-agent-with-remote-mcp', 'validate-functions']:
+    if len(sys.argv) > 1 and not sys.argv[1] in ['generate-mcp', 'generate-a2a-agent-with-remote-mcp', 'validate-functions', 'synth-spec']:
         # Call main directly for backward compatibility
         main()
     else:
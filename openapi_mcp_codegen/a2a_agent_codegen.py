@@ -13,14 +13,16 @@ configurable to connect to any MCP server URL.
 
 import os
 import re
-import json
 import yaml
 import logging
 import datetime
-from jinja2 import Environment, FileSystemLoader
 from typing import Dict, Any
 import subprocess
 
+from openapi_mcp_codegen.ir import SpecIR
+from openapi_mcp_codegen.rendering import get_template_env
+from openapi_mcp_codegen.spec_loader import load_spec
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("a2a_agent_codegen")
@@ -242,7 +244,7 @@ class A2AAgentGenerator:
         self.spec_path = spec_path
         self.output_dir = output_dir
         self.dry_run = dry_run
-        self.env = Environment(loader=FileSystemLoader(os.path.join(script_dir, 'templates')))
+        self.env = get_template_env(os.path.join(script_dir, 'templates'))
 
         with open(config_path, encoding='utf-8') as f:
             self.config = yaml.safe_load(f)
@@ -258,11 +260,7 @@ class A2AAgentGenerator:
             Dictionary containing the parsed OpenAPI specification.
         """
         logger.info(f"Loading OpenAPI specification from {self.spec_path}")
-        with open(self.spec_path, 'r', encoding='utf-8') as f:
-            if self.spec_path.endswith('.yaml') or self.spec_path.endswith('.yml'):
-                return yaml.safe_load(f)
-            else:
-                return json.load(f)
+        return load_spec(self.spec_path)
 
     def get_file_header_kwargs(self) -> Dict[str, Any]:
         """
@@ -300,30 +298,32 @@ class A2AAgentGenerator:
             f.write(rendered_content)
         logger.info(f"Generated file: {output_path}")
 
-    def run_ruff_lint(self, input_file: str):
+    def run_ruff_lint(self, *input_files: str):
         """
-        Run Ruff linter and formatter on a file.
+        Run Ruff linter and formatter on one or more files in a single invocation.
 
         Args:
-            input_file (str): Path to the file to lint and format.
+            *input_files (str): Paths of the files to lint and format.
         """
+        if not input_files:
+            return
         if self.dry_run:
-            logger.info(f"[DRY RUN] Would run Ruff on {input_file}")
+            logger.info(f"[DRY RUN] Would run Ruff on {len(input_files)} file(s)")
             return
 
         try:
-            logger.info(f"Running Ruff format on {input_file}")
-            subprocess.run(['ruff', 'format', input_file], check=False, capture_output=True, text=True)
+            logger.info(f"Running Ruff format on {len(input_files)} file(s)")
+            subprocess.run(['ruff', 'format', *input_files], check=False, capture_output=True, text=True)
 
-            logger.info(f"Running Ruff lint on {input_file}")
-            result = subprocess.run(['ruff', 'check', '--fix', input_file], capture_output=True, text=True)
+            logger.info(f"Running Ruff lint on {len(input_files)} file(s)")
+            result = subprocess.run(['ruff', 'check', '--fix', *input_files], capture_output=True, text=True)
 
             if result.stdout:
                 logger.info(result.stdout.strip())
             if result.returncode == 0:
                 logger.info("Ruff linting completed")
             else:
-                logger.warning(f"Ruff found issues in {input_file}: {result.stderr}")
+                logger.warning(f"Ruff found issues: {result.stderr}")
         except FileNotFoundError:
             logger.warning("Ruff not found. Skipping code formatting.")
 
@@ -394,13 +394,10 @@ class A2AAgentGenerator:
                 skill_examples.extend([f"'{example}'" for example in skill.get("examples", [])])
         else:
             # Fallback to extracting from OpenAPI spec (original behavior)
-            for path, ops in self.spec.get("paths", {}).items():
-                for method, op in ops.items():
-                    if method.upper() not in {"GET", "POST", "PUT", "DELETE"}:
-                        continue
-                    operation_desc = op.get("summary") or op.get("description", "")
-                    if operation_desc:
-                        skill_examples.append(f"'{operation_desc.strip()}'")
+            for operation in SpecIR(self.spec).tool_operations():
+                operation_desc = operation.summary or operation.description
+                if operation_desc:
+                    skill_examples.append(f"'{operation_desc.strip()}'")
 
             # Limit to reasonable number of examples
             skill_examples = skill_examples[:5]
@@ -518,6 +515,5 @@ Always provide clear, actionable responses and include relevant resource names,
             os.path.join(a2a_client_dir, "agent.py"),
         ]
 
-        for file_path in python_files:
-            if not self.dry_run and os.path.exists(file_path):
-                self.run_ruff_lint(file_path)
+        if not self.dry_run:
+            self.run_ruff_lint(*[f for f in python_files if os.path.exists(f)])
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Location of the on-disk cache shared by the code generator.
+
+The cache lives in ``$OPENAPI_MCP_CODEGEN_CACHE_DIR`` when set, otherwise in
+``$XDG_CACHE_HOME/openapi_mcp_codegen`` (``~/.cache/openapi_mcp_codegen`` by
+default). Each feature keeps its entries in its own subdirectory.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR_ENV = "OPENAPI_MCP_CODEGEN_CACHE_DIR"
+
+
+def get_cache_dir(subdir: Optional[str] = None, create: bool = True) -> Path:
+    """
+    Return the generator cache directory, optionally a named subdirectory of it.
+
+    Args:
+        subdir: Subdirectory for a single feature (e.g. ``"specs"``).
+        create: Create the directory if it does not exist.
+
+    Returns:
+        Path of the cache directory.
+    """
+    root = os.environ.get(CACHE_DIR_ENV)
+    if root:
+        path = Path(root)
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        path = Path(xdg_cache) / "openapi_mcp_codegen"
+    if subdir:
+        path = path / subdir
+    if create:
+        path.mkdir(parents=True, exist_ok=True)
+    return path
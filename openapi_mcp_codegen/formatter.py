@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Batched Ruff formatting for generated code.
+
+Rendered files are written through a single :class:`RuffFormatter` per
+generation run. Files that need formatting are queued and handed to one
+``ruff format`` and one ``ruff check --fix`` invocation at the end of the run
+instead of two subprocesses per file.
+
+A small JSON cache in the output directory records, for every written file,
+the hash of the rendered source and the hash of the final (formatted) content.
+When a later run renders identical source and the file on disk still matches
+the recorded formatted hash, the file is neither rewritten nor re-formatted.
+Content derived from the rendered source before writing (e.g. LLM-enhanced
+docstrings) is cached under the hash of that source and of a *variant* naming
+the derivation, so switching the derivation on, off or to other settings
+rewrites the file instead of keeping content made by the previous one.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger("formatter")
+
+CACHE_FILE_NAME = ".mcp_codegen_format_cache.json"
+
+# Keep each ruff invocation comfortably below common ARG_MAX limits
+MAX_FILES_PER_INVOCATION = 500
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest of a text blob."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def source_hash(source: str, variant: str = "") -> str:
+    """Return the cache hash of a rendered source written through ``variant`` (plain content hash without one)."""
+    if not variant:
+        return content_hash(source)
+    return content_hash(f"{variant}\0{source}")
+
+
+def _file_hash(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def run_ruff(files: List[str], line_length: int = 140, ignore: str = "E402,E501") -> None:
+    """
+    Run ``ruff format`` and ``ruff check --fix`` over a list of files.
+
+    Files are passed to a single invocation of each command (split into
+    chunks only for very large batches).
+
+    Args:
+        files: Paths of the files to format and lint.
+        line_length: Line length passed to ``ruff format``.
+        ignore: Comma separated rule codes ignored by ``ruff check``.
+    """
+    for start in range(0, len(files), MAX_FILES_PER_INVOCATION):
+        chunk = files[start:start + MAX_FILES_PER_INVOCATION]
+        logger.info(f"Running Ruff format on {len(chunk)} file(s)")
+        subprocess.run(["ruff", "format", "--line-length", str(line_length), *chunk], check=True)
+        logger.info(f"Running Ruff lint on {len(chunk)} file(s)")
+        subprocess.run(["ruff", "check", "--fix", "--ignore", ignore, *chunk], check=True)
+
+
+class RuffFormatter:
+    """
+    Collects generated files and formats them with Ruff in one batch.
+
+    Attributes:
+        output_dir (str): Root directory of the generated project; cache keys are relative to it.
+        cache_path (str): Location of the JSON hash cache.
+        written (dict): Files written during this run mapped to their rendered source hash.
+        pending (list): Files queued for formatting during this run, in queue order.
+    """
+
+    def __init__(self, output_dir: str, cache_file: str = CACHE_FILE_NAME):
+        self.output_dir = output_dir
+        self.cache_path = os.path.join(output_dir, cache_file)
+        self.written: Dict[str, str] = {}
+        self.pending: List[str] = []
+        # Hashes of the content written this run, recorded for files Ruff does not touch
+        self._content: Dict[str, str] = {}
+        self.skipped = 0
+        self._cache = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), os.path.abspath(self.output_dir))
+
+    def is_unchanged(self, path: str, content: str, variant: str = "") -> bool:
+        """
+        Check whether writing ``content`` to ``path`` would reproduce the file already on disk.
+
+        Args:
+            path: Destination of the rendered content.
+            content: Rendered (unformatted) source.
+            variant: Identity of what derives the written content from the source, if anything.
+
+        Returns:
+            True when the same source was rendered, derived the same way and formatted
+            before, and the file on disk has not changed since.
+        """
+        entry = self._cache.get(self._key(path))
+        if not entry or entry.get("source") != source_hash(content, variant):
+            return False
+        return _file_hash(path) == entry.get("formatted")
+
+    def write(self, path: str, content: str, source: Optional[str] = None, variant: str = "") -> bool:
+        """
+        Write rendered content unless the existing file is already up to date.
+
+        Args:
+            path: Destination file.
+            content: Content to write.
+            source: Rendered source ``content`` was derived from, if different; the
+                cache is keyed by it.
+            variant: Identity of the derivation (e.g. its settings); part of the cache key.
+
+        Returns:
+            True if the file was written, False if it was skipped as unchanged.
+        """
+        if source is None:
+            source = content
+        if self.is_unchanged(path, source, variant):
+            logger.debug("Skipping unchanged file: %s", path)
+            self.skipped += 1
+            return False
+        with open(path, "w+", encoding="utf-8") as f:
+            f.write(content)
+        self.written[path] = source_hash(source, variant)
+        self._content[path] = content_hash(content)
+        return True
+
+    def queue(self, path: str) -> None:
+        """
+        Queue a written file for formatting.
+
+        Files skipped by :meth:`write` in this run are already formatted and are ignored.
+        """
+        if path in self.written and path not in self.pending:
+            self.pending.append(path)
+
+    def flush(self, runner: Optional[Callable[..., None]] = None) -> int:
+        """
+        Format all queued files at once and update the hash cache.
+
+        Args:
+            runner: Callable receiving the file paths to format. Defaults to :func:`run_ruff`.
+
+        Returns:
+            Number of files handed to Ruff.
+        """
+        files = [p for p in self.pending if os.path.exists(p)]
+        if files:
+            if runner is None:
+                run_ruff(files)
+            else:
+                runner(*files)
+        formatted = set(files)
+        for path, source in self.written.items():
+            final = _file_hash(path) if path in formatted else self._content[path]
+            self._cache[self._key(path)] = {"source": source, "formatted": final}
+        self.pending = []
+        self.written = {}
+        self._content = {}
+        self._save_cache()
+        if self.skipped:
+            logger.info(f"Skipped {self.skipped} unchanged file(s)")
+            self.skipped = 0
+        return len(files)
+
+    def _save_cache(self) -> None:
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f, indent=0, sort_keys=True)
+        except OSError as e:
+            logger.warning(f"Could not save format cache {self.cache_path}: {e}")
+
@@ -16,19 +16,29 @@ Validates all generated MCP functions to ensure:
 
 import ast
 import importlib.util
+import json
 import logging
 import os
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Any, Optional
 from dataclasses import dataclass
 
+from openapi_mcp_codegen.cache import get_cache_dir
+from openapi_mcp_codegen.tools_manifest import MANIFEST_FILE_NAME
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Bump when the cached per-file data changes shape
+FUNCTION_CACHE_FORMAT = 1
+# Below this many files to parse, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 32
+
 
 @dataclass
 class FunctionInfo:
@@ -58,11 +68,95 @@ class ValidationResult:
     naming_violations: List[FunctionInfo]
 
 
+def _parse_tool_file(file_path: str) -> Tuple[Optional[List[Tuple[str, int]]], Optional[str]]:
+    """
+    Parse a tool module and list its async functions.
+
+    Runs in worker processes, so it only takes and returns plain data.
+
+    Returns:
+        ``([(name, line_number), ...], None)`` or, if the file cannot be parsed, ``(None, error)``.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        tree = ast.parse(content, filename=file_path)
+    except SyntaxError as e:
+        return None, f"Syntax error in {file_path}: {e}"
+    except Exception as e:
+        return None, f"Error parsing {file_path}: {e}"
+    return [(node.name, node.lineno) for node in ast.walk(tree) if isinstance(node, ast.AsyncFunctionDef)], None
+
+
+class FunctionCache:
+    """
+    On-disk cache of the functions defined in each tool file.
+
+    Entries are keyed by absolute path and only used while the file's mtime and
+    size are unchanged. The cache is a JSON file in ``get_cache_dir("functions")``;
+    errors reading or writing it are logged at debug level and never fail validation.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            if self.path is None:
+                self.path = get_cache_dir("functions") / "index.json"
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') == FUNCTION_CACHE_FORMAT:
+                self.entries = data.get('files', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug(f"Function cache not loaded: {e}")
+
+    def get(self, key: str, stat: os.stat_result) -> Optional[List[Tuple[str, int]]]:
+        """Return the cached functions of a file, or None if it changed since it was cached."""
+        entry = self.entries.get(key)
+        if entry is None or entry.get('mtime_ns') != stat.st_mtime_ns or entry.get('size') != stat.st_size:
+            return None
+        return [(name, line_number) for name, line_number in entry['functions']]
+
+    def put(self, key: str, stat: os.stat_result, functions: List[Tuple[str, int]]) -> None:
+        self.entries[key] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'functions': [list(function) for function in functions],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed, dropping entries for files that no longer exist."""
+        if not self._dirty or self.path is None:
+            return
+        self.entries = {key: entry for key, entry in self.entries.items() if os.path.exists(key)}
+        try:
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'format': FUNCTION_CACHE_FORMAT, 'files': self.entries}, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not write function cache: {e}")
+
+
 class FunctionValidator:
     """Validates generated MCP functions for compliance and quality."""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, jobs: Optional[int] = None, use_cache: bool = True):
+        """
+        Args:
+            project_root: Repository root containing the ``examples`` directory.
+            jobs: Worker processes for parsing tool files (0 or None = one per CPU).
+            use_cache: Reuse parse results of unchanged files from the on-disk cache.
+        """
         self.project_root = Path(project_root)
+        self.jobs = max(1, jobs) if jobs else (os.cpu_count() or 1)
+        self.use_cache = use_cache
+        self._cache: Optional[FunctionCache] = None
         self.functions: List[FunctionInfo] = []
         self.registered_functions: Set[str] = set()
         
@@ -71,6 +165,13 @@ class FunctionValidator:
         self.max_length = 64
         self.http_methods = {'get', 'post', 'put', 'patch', 'delete', 'del', 'head', 'opts'}
         
+    @property
+    def cache(self) -> Optional[FunctionCache]:
+        """Function cache, loaded on first use; None when caching is off."""
+        if self._cache is None and self.use_cache:
+            self._cache = FunctionCache()
+        return self._cache
+
     def find_generated_projects(self) -> List[Path]:
         """Find all generated MCP projects."""
         projects = []
@@ -91,36 +192,77 @@ class FunctionValidator:
     
     def extract_functions_from_file(self, file_path: Path) -> List[FunctionInfo]:
         """Extract function definitions from a Python file."""
-        functions = []
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse the AST
-            tree = ast.parse(content, filename=str(file_path))
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.AsyncFunctionDef):
-                    func_info = FunctionInfo(
-                        name=node.name,
-                        file_path=str(file_path),
-                        line_number=node.lineno,
-                        module_name=file_path.stem
-                    )
-                    
-                    # Try to detect HTTP method from function name
-                    func_info.http_method = self._detect_http_method(node.name)
-                    
-                    functions.append(func_info)
-                    
-        except SyntaxError as e:
-            logger.error(f"Syntax error in {file_path}: {e}")
-        except Exception as e:
-            logger.error(f"Error parsing {file_path}: {e}")
-            
-        return functions
-    
+        file_path = Path(file_path)
+        return self.extract_functions_from_files([file_path])[file_path]
+
+    def extract_functions_from_files(self, file_paths: List[Path]) -> Dict[Path, List[FunctionInfo]]:
+        """
+        Extract function definitions from several Python files.
+
+        Files unchanged since they were last parsed are answered from the cache.
+        The rest are parsed on a process pool when there are at least
+        ``PARALLEL_MIN_FILES`` of them, otherwise in this process.
+
+        Returns:
+            Functions of each file, keyed by the given paths.
+        """
+        found: Dict[Path, List[Tuple[str, int]]] = {}
+        stats: Dict[Path, os.stat_result] = {}
+        pending: List[Path] = []
+        for file_path in file_paths:
+            if self.cache is not None:
+                try:
+                    stats[file_path] = stat = file_path.stat()
+                except OSError:
+                    pass
+                else:
+                    cached = self.cache.get(str(file_path.resolve()), stat)
+                    if cached is not None:
+                        found[file_path] = cached
+                        continue
+            pending.append(file_path)
+
+        if pending:
+            logger.debug(f"Parsing {len(pending)} of {len(file_paths)} tool files")
+            if self.jobs > 1 and len(pending) >= PARALLEL_MIN_FILES:
+                workers = min(self.jobs, len(pending))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    outcomes = list(executor.map(_parse_tool_file, [str(p) for p in pending],
+                                                 chunksize=max(1, len(pending) // (workers * 4))))
+            else:
+                outcomes = [_parse_tool_file(str(p)) for p in pending]
+
+            for file_path, (functions, error) in zip(pending, outcomes):
+                if error:
+                    logger.error(error)
+                    functions = []
+                elif self.cache is not None and file_path in stats:
+                    self.cache.put(str(file_path.resolve()), stats[file_path], functions)
+                found[file_path] = functions
+            if self.cache is not None:
+                self.cache.save()
+
+        return {
+            file_path: [self._function_info(name, file_path, line_number) for name, line_number in found[file_path]]
+            for file_path in file_paths
+        }
+
+    def _function_info(self, name: str, file_path: Path, line_number: int = 0) -> FunctionInfo:
+        return FunctionInfo(
+            name=name,
+            file_path=str(file_path),
+            line_number=line_number,
+            # Try to detect HTTP method from function name
+            http_method=self._detect_http_method(name),
+            module_name=file_path.stem
+        )
+
+    @staticmethod
+    def _tool_files(tools_dir: Path) -> List[Path]:
+        if not tools_dir.exists():
+            return []
+        return [tool_file for tool_file in tools_dir.glob("*.py") if tool_file.name not in ['__init__.py']]
+
     def _detect_http_method(self, function_name: str) -> Optional[str]:
         """Detect HTTP method from function name prefix."""
         for method in self.http_methods:
@@ -141,19 +283,46 @@ class FunctionValidator:
             pattern = r'mcp\.tool\(\)\([^.]+\.([^)]+)\)'
             matches = re.findall(pattern, content)
             registered.update(matches)
+
+            # Servers generated with --lazy-tools register from the tool manifest
+            if MANIFEST_FILE_NAME in content:
+                with open(server_file.parent / MANIFEST_FILE_NAME, 'r', encoding='utf-8') as f:
+                    registered.update(tool["function"] for tool in json.load(f)["tools"])
             
         except Exception as e:
             logger.error(f"Error parsing server file {server_file}: {e}")
             
         return registered
     
-    def validate_project(self, project_dir: Path) -> ValidationResult:
-        """Validate all functions in a single MCP project."""
+    def validate_project(self, project_dir: Path, tool_functions: Optional[Dict[str, List[str]]] = None) -> ValidationResult:
+        """
+        Validate all functions in a single MCP project.
+
+        Args:
+            project_dir: Generated ``mcp_*`` package directory.
+            tool_functions: Function names per tool module (file stem), as already known
+                to an in-process generator. When given, the tool files are not parsed.
+        """
+        project_dir = Path(project_dir)
+        tools_dir = project_dir / "tools"
+        if tool_functions is not None:
+            functions = [
+                self._function_info(name, tools_dir / f"{module}.py")
+                for module, names in tool_functions.items()
+                for name in names
+            ]
+        else:
+            extracted = self.extract_functions_from_files(self._tool_files(tools_dir))
+            functions = [function for file_functions in extracted.values() for function in file_functions]
+        return self._validate_functions(project_dir, functions)
+
+    def _validate_functions(self, project_dir: Path, functions: List[FunctionInfo]) -> ValidationResult:
+        """Run the validation checks on the functions extracted from a project."""
         logger.info(f"🔍 Validating MCP project: {project_dir}")
         
         errors = []
         warnings = []
-        self.functions = []
+        self.functions = functions
         
         # Find tools directory
         tools_dir = project_dir / "tools"
@@ -161,14 +330,6 @@ class FunctionValidator:
             errors.append(f"Tools directory not found: {tools_dir}")
             return ValidationResult(False, 0, errors, warnings, {}, [], [], [])
         
-        # Extract functions from all tool files
-        for tool_file in tools_dir.glob("*.py"):
-            if tool_file.name in ['__init__.py']:
-                continue
-            
-            functions = self.extract_functions_from_file(tool_file)
-            self.functions.extend(functions)
-        
         # Extract registered functions from server.py
         server_file = project_dir / "server.py"
         if server_file.exists():
@@ -414,9 +575,14 @@ class FunctionValidator:
         results = {}
         overall_success = True
         
+        # Parse the tool files of all projects together so they share one worker pool
+        tool_files = {project_dir: self._tool_files(project_dir / "tools") for project_dir in projects}
+        extracted = self.extract_functions_from_files([f for files in tool_files.values() for f in files])
+        
         for project_dir in projects:
             project_name = project_dir.name
-            result = self.validate_project(project_dir)
+            functions = [function for tool_file in tool_files[project_dir] for function in extracted[tool_file]]
+            result = self._validate_functions(project_dir, functions)
             results[project_name] = result
             
             if not result.passed:
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compact intermediate representation (IR) of the operations in an OpenAPI spec.
+
+:class:`SpecIR` is built once per spec by a single normalization pass over
+``spec['paths']``: path-item and operation parameters are merged, parameter
+``$ref``s and ``requestBody`` ``$ref``s are resolved, and the JSON request body
+schema is selected. Operations are indexed by operationId, tag and path.
+
+The MCP generator, the A2A agent generator, the overlay generator and the
+validators all iterate :attr:`SpecIR.operations` instead of walking the paths
+themselves. The generator annotates each operation with Python names and types
+(:attr:`Parameter.python_name`, :attr:`Parameter.python_type`,
+:attr:`Operation.body_fields`).
+
+The IR reflects the spec at build time. It is not cached globally: owners of a
+spec keep its IR (building one is a single cheap pass) and build a new one after
+modifying the spec.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .ref_resolver import RefResolver
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+# Methods that become MCP tools
+TOOL_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+
+@dataclass(slots=True)
+class Parameter:
+    """A path, query, header, cookie or (Swagger 2.0) body parameter with refs resolved."""
+
+    name: str
+    location: str
+    required: bool
+    description: str
+    schema: Dict[str, Any]
+    raw: Dict[str, Any]
+    python_name: str = ""
+    python_type: str = ""
+
+
+@dataclass(slots=True)
+class BodyField:
+    """One flattened request body argument of a generated tool function."""
+
+    name: str
+    python_type: str
+    description: str
+    signature: str
+
+
+@dataclass(slots=True)
+class Operation:
+    """A single HTTP operation of a path item."""
+
+    path: str
+    method: str
+    operation_id: Optional[str]
+    summary: str
+    description: str
+    tags: Tuple[str, ...]
+    parameters: List[Parameter]
+    request_body_schema: Optional[Dict[str, Any]]
+    raw: Dict[str, Any]
+    body_fields: List[BodyField] = field(default_factory=list)
+
+    @property
+    def http_method(self) -> str:
+        return self.method.upper()
+
+    @property
+    def is_tool(self) -> bool:
+        """Whether the generator turns this operation into an MCP tool."""
+        return self.http_method in TOOL_METHODS
+
+
+def _parameter(p: Dict[str, Any]) -> Parameter:
+    location = p.get("in", "")
+    if location == "query":
+        # Swagger 2.0 query parameters carry their type inline
+        schema = p.get("schema") or p
+    else:
+        schema = p.get("schema", {})
+    return Parameter(
+        name=p.get("name", "param"),
+        location=location,
+        required=bool(p.get("required")) or location == "path",
+        description=p.get("description", ""),
+        schema=schema,
+        raw=p,
+    )
+
+
+def _request_body_schema(op: Dict[str, Any], resolver: RefResolver) -> Optional[Dict[str, Any]]:
+    request_body = op.get("requestBody")
+    if not request_body:
+        return None
+    if isinstance(request_body, dict) and "$ref" in request_body:
+        request_body = resolver.resolve(request_body["$ref"]) or {}
+    content = request_body.get("content", {})
+    # Prefer JSON but fall back to the first available media type
+    media = content.get("application/json") or next(iter(content.values()), {})
+    return media.get("schema") or None
+
+
+class SpecIR:
+    """
+    Normalized operations of one OpenAPI document.
+
+    Attributes:
+        operations (list): Every operation, in spec order.
+        by_operation_id (dict): operationId -> Operation.
+        by_tag (dict): tag -> list of Operation.
+        by_path (dict): path -> list of Operation, in spec order.
+        resolver (RefResolver): Resolver used to build the IR.
+    """
+
+    __slots__ = ("spec", "resolver", "operations", "by_operation_id", "by_tag", "by_path")
+
+    def __init__(self, spec: Dict[str, Any], resolver: Optional[RefResolver] = None):
+        self.spec = spec
+        self.resolver = resolver if resolver is not None and resolver.spec is spec else RefResolver(spec)
+        self.operations: List[Operation] = []
+        self.by_operation_id: Dict[str, Operation] = {}
+        self.by_tag: Dict[str, List[Operation]] = {}
+        self.by_path: Dict[str, List[Operation]] = {}
+        self._build()
+
+    def _build(self) -> None:
+        resolve = self.resolver.resolve
+        for path, path_item in (self.spec.get("paths") or {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            path_ops = self.by_path.setdefault(path, [])
+            path_level_params = path_item.get("parameters") or []
+            for method, op in path_item.items():
+                if method.lower() not in HTTP_METHODS or not isinstance(op, dict):
+                    continue
+                parameters = []
+                for p in list(path_level_params) + list(op.get("parameters") or []):
+                    if "$ref" in p:
+                        p = resolve(p["$ref"])
+                    parameters.append(_parameter(p))
+                operation = Operation(
+                    path=path,
+                    method=method.lower(),
+                    operation_id=op.get("operationId"),
+                    summary=op.get("summary", "") or "",
+                    description=op.get("description", "") or "",
+                    tags=tuple(op.get("tags") or ()),
+                    parameters=parameters,
+                    request_body_schema=_request_body_schema(op, self.resolver),
+                    raw=op,
+                )
+                self.operations.append(operation)
+                path_ops.append(operation)
+                if operation.operation_id:
+                    self.by_operation_id.setdefault(operation.operation_id, operation)
+                for tag in operation.tags:
+                    self.by_tag.setdefault(tag, []).append(operation)
+
+    def tool_operations(self) -> Iterator[Operation]:
+        """Iterate the operations that become MCP tools, in spec order."""
+        return (op for op in self.operations if op.is_tool)
+
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Persistent, content-addressed cache of LLM responses.
+
+Responses are stored in a SQLite database in the generator cache directory
+(``get_cache_dir("llm")``), keyed by a hash of the model identifier and the
+rendered prompts. Re-running enhancement with unchanged operations, prompts
+and model therefore makes no LLM requests.
+
+Entries older than ``max_age_days`` are dropped and, once the cache holds more
+than ``max_entries`` responses, the least recently used ones are evicted.
+Cache errors are logged and never fail the caller; the cache simply turns
+itself off.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from .cache import get_cache_dir
+
+logger = logging.getLogger("llm_cache")
+
+# Bump when the key derivation changes so old entries are never returned
+CACHE_FORMAT = 1
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_AGE_DAYS = 30
+_PRUNE_EVERY = 64
+
+
+def model_identifier(llm: Any) -> str:
+    """Return a string identifying the model behind a chat model client."""
+    for attr in ("model_name", "model", "model_id", "deployment_name", "azure_deployment"):
+        value = getattr(llm, attr, None)
+        if isinstance(value, str) and value:
+            return f"{type(llm).__name__}:{value}"
+    return type(llm).__name__
+
+
+class LLMCache:
+    """
+    SQLite-backed LLM response cache, safe to share between threads.
+
+    Attributes:
+        path (Path): Database file.
+        max_entries (int): Maximum number of cached responses.
+        max_age_days (float): Age after which responses are discarded.
+        refresh (bool): Ignore cached responses but store new ones.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that required an LLM request.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        refresh: bool = False,
+    ):
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.path: Optional[Path] = Path(path) if path else None
+        try:
+            if self.path is None:
+                self.path = get_cache_dir("llm") / "responses.sqlite3"
+            self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.commit()
+            self.prune()
+        except (sqlite3.Error, OSError) as e:
+            self._disable(e)
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning(f"LLM response cache disabled: {error}")
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+        self._conn = None
+
+    @staticmethod
+    def make_key(model: str, *prompts: str) -> str:
+        """Hash a model identifier and prompts into a cache key."""
+        payload = json.dumps([CACHE_FORMAT, model, *prompts], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None."""
+        with self._lock:
+            if self._conn is None or self.refresh:
+                self.misses += 1
+                return None
+            try:
+                row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+                self._conn.commit()
+                self.hits += 1
+                return row[0]
+            except sqlite3.Error as e:
+                self._disable(e)
+                self.misses += 1
+                return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response."""
+        with self._lock:
+            if self._conn is None:
+                return
+            now = time.time()
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created, last_used) VALUES (?, ?, ?, ?)",
+                    (key, value, now, now),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return
+            self._puts += 1
+            prune = self._puts % _PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> None:
+        """Drop expired responses and evict least recently used ones above ``max_entries``."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                if self.max_age_days:
+                    cutoff = time.time() - self.max_age_days * 86400
+                    self._conn.execute("DELETE FROM responses WHERE created < ?", (cutoff,))
+                if self.max_entries:
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE key IN ("
+                        "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                        (self.max_entries,),
+                    )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
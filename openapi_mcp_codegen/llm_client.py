@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Concurrent, rate-limited LLM requests.
+
+Chat model clients block on network I/O, so running requests in a thread pool
+gives real concurrency with every provider. :class:`LLMRunner` wraps an LLM and
+
+* limits the request rate shared by all worker threads with a :class:`TokenBucket`;
+* retries rate-limit (429) and server (5xx) errors with exponential backoff and
+  full jitter;
+* maps a function over items concurrently and returns the results in input
+  order, independent of completion order.
+
+:func:`parse_json_object` reads the JSON answers of batched requests.
+"""
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from .profiling import invoke_llm
+
+logger = logging.getLogger("llm_client")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Exception class names used by provider SDKs for transient failures that carry no status code
+_RETRYABLE_ERROR_NAMES = frozenset({
+    "RateLimitError",
+    "APIConnectionError",
+    "APITimeoutError",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "ServiceUnavailableError",
+    "OverloadedError",
+    "ResourceExhausted",
+})
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum number of tokens (burst size).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until ``tokens`` are available, then take them."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for obj in (exc, getattr(exc, "response", None)):
+        for attr in ("status_code", "status"):
+            code = getattr(obj, attr, None)
+            if isinstance(code, int):
+                return code
+    return None
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Whether an LLM call failed with a rate-limit (429), server (5xx) or connection error."""
+    code = _status_code(exc)
+    if code is not None:
+        return code == 429 or 500 <= code < 600
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    return type(exc).__name__ in _RETRYABLE_ERROR_NAMES
+
+
+def parse_json_object(content: str) -> Dict[str, Any]:
+    """Parse a JSON object answer, tolerating a Markdown code fence around it."""
+    text = content.strip()
+    fence = re.match(r'^```(?:json)?\s*(.*?)\s*```$', text, re.DOTALL)
+    if fence:
+        text = fence.group(1)
+    result = json.loads(text)
+    if not isinstance(result, dict):
+        raise ValueError("batched response is not a JSON object")
+    return result
+
+
+class LLMRunner:
+    """
+    Issues LLM requests with a concurrency limit, rate limiting and retries.
+
+    Attributes:
+        llm: Chat model with an ``invoke(messages)`` method.
+        max_concurrency (int): Maximum number of requests in flight.
+        max_retries (int): Retries after the first attempt for transient errors.
+        rate_limiter (TokenBucket): Shared limiter, or None for no rate limit.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        max_concurrency: int = 4,
+        requests_per_second: Optional[float] = None,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ):
+        self.llm = llm
+        self.max_concurrency = max(1, int(max_concurrency or 1))
+        self.max_retries = max(0, int(max_retries))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+
+    def invoke(self, messages: Any) -> Any:
+        """
+        Invoke the LLM, retrying transient failures with jittered exponential backoff.
+
+        Raises:
+            Exception: The last error once retries are exhausted, or any non-transient error.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                return invoke_llm(self.llm, messages)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable_error(e):
+                    raise
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                attempt += 1
+                logger.debug(f"LLM request failed ({e}); retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+
+    def map(self, fn: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        """
+        Apply ``fn`` to every item, up to ``max_concurrency`` at a time.
+
+        Returns:
+            Results in the order of ``items``.
+        """
+        if self.max_concurrency == 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as executor:
+            return list(executor.map(fn, items))
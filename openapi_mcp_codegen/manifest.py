@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Generation manifest used for incremental regeneration.
+
+After a successful run :class:`GenerationManifest` records, in the output
+directory, a hash of everything that influences each generated tool module
+and model:
+
+* a global fingerprint (generator version, config, generator flags and the
+  template files) - any change here invalidates the whole manifest;
+* per path item: the hash of the path item plus every ``$ref`` component it
+  reaches, the module it was rendered to and the function names it produced;
+* per component schema: the hash of the schema plus every ``$ref`` it reaches.
+
+On the next run only modules whose inputs changed are rendered again, and
+modules belonging to removed paths or schemas are deleted.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from importlib import metadata
+from typing import Any, Dict, Iterable, List, Set
+
+from .ref_resolver import resolve_pointer
+
+logger = logging.getLogger("manifest")
+
+MANIFEST_FILE_NAME = ".mcp_codegen_manifest.json"
+MANIFEST_FORMAT = 1
+
+
+def generator_version() -> str:
+    """Return the installed openapi_mcp_codegen version, or ``"unknown"``."""
+    try:
+        return metadata.version("openapi_mcp_codegen")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _str_keys(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(k): _str_keys(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_str_keys(v) for v in value]
+    return value
+
+
+def stable_hash(value: Any) -> str:
+    """Hash a JSON-compatible value independently of dict key order."""
+    try:
+        encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    except TypeError:
+        # Mixed int/str keys (e.g. unquoted YAML status codes) cannot be sorted
+        encoded = json.dumps(_str_keys(value), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def directory_hash(root: str) -> str:
+    """Hash the relative paths and contents of every file below ``root``."""
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, root).encode("utf-8"))
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def reachable_refs(node: Any, spec: Dict[str, Any]) -> List[str]:
+    """
+    Collect every local ``$ref`` reachable from ``node``, following references transitively.
+
+    Args:
+        node: Any fragment of the OpenAPI document.
+        spec: The full OpenAPI document the references point into.
+
+    Returns:
+        Sorted list of reference strings.
+    """
+    seen: Set[str] = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get("$ref")
+            if isinstance(ref, str) and ref not in seen:
+                seen.add(ref)
+                stack.append(resolve_pointer(spec, ref))
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return sorted(seen)
+
+
+def fragment_hash(node: Any, spec: Dict[str, Any], *extra: Any) -> str:
+    """Hash a spec fragment together with every component it references."""
+    refs = reachable_refs(node, spec)
+    return stable_hash([node, {ref: resolve_pointer(spec, ref) for ref in refs}, list(extra)])
+
+
+class GenerationManifest:
+    """
+    Per-output-directory record of the inputs behind each generated module.
+
+    Attributes:
+        path (str): Location of the manifest file.
+        fingerprint (str): Global hash of generator version, config, flags and templates.
+        paths (dict): Path item -> ``{"hash", "module", "functions"}`` from the previous run.
+        schemas (dict): Schema name -> ``{"hash", "module"}`` from the previous run.
+    """
+
+    def __init__(self, output_dir: str, fingerprint: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+        self.fingerprint = fingerprint
+        self.paths: Dict[str, Dict[str, Any]] = {}
+        self.schemas: Dict[str, Dict[str, Any]] = {}
+        self._previous_paths: Dict[str, Dict[str, Any]] = {}
+        self._previous_schemas: Dict[str, Dict[str, Any]] = {}
+        self._reusable = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT:
+            return
+        # Previous entries are kept even when the fingerprint changed so that
+        # modules of removed paths are still cleaned up.
+        self._previous_paths = data.get("paths", {})
+        self._previous_schemas = data.get("schemas", {})
+        self._reusable = data.get("fingerprint") == self.fingerprint
+        if not self._reusable:
+            logger.info("Generator inputs changed since the last run; regenerating everything")
+
+    def _rel(self, module_path: str) -> str:
+        return os.path.relpath(os.path.abspath(module_path), os.path.abspath(self.output_dir))
+
+    def path_unchanged(self, path: str, digest: str, module_path: str, functions: Iterable[str]) -> bool:
+        """
+        Check whether a path item can reuse the module generated by the previous run.
+
+        Function names take part in the comparison because name deduplication
+        depends on the other operations in the spec.
+        """
+        previous = self._previous_paths.get(path)
+        return (
+            self._reusable
+            and previous is not None
+            and previous.get("hash") == digest
+            and previous.get("module") == self._rel(module_path)
+            and previous.get("functions") == list(functions)
+            and os.path.exists(module_path)
+        )
+
+    def schema_unchanged(self, name: str, digest: str, module_path: str) -> bool:
+        """Check whether a schema model can reuse the file generated by the previous run."""
+        previous = self._previous_schemas.get(name)
+        return (
+            self._reusable
+            and previous is not None
+            and previous.get("hash") == digest
+            and previous.get("module") == self._rel(module_path)
+            and os.path.exists(module_path)
+        )
+
+    def record_path(self, path: str, digest: str, module_path: str, functions: Iterable[str]) -> None:
+        self.paths[path] = {"hash": digest, "module": self._rel(module_path), "functions": list(functions)}
+
+    def record_schema(self, name: str, digest: str, module_path: str) -> None:
+        self.schemas[name] = {"hash": digest, "module": self._rel(module_path)}
+
+    def stale_modules(self) -> List[str]:
+        """Return files produced by the previous run that no current path or schema produces."""
+        current = {entry["module"] for entry in self.paths.values()}
+        current.update(entry["module"] for entry in self.schemas.values())
+        previous = {entry.get("module") for entry in self._previous_paths.values()}
+        previous.update(entry.get("module") for entry in self._previous_schemas.values())
+        return sorted(os.path.join(self.output_dir, p) for p in previous - current if p)
+
+    def remove_stale_modules(self) -> List[str]:
+        """Delete files of removed paths and schemas and return their paths."""
+        removed = []
+        for module_path in self.stale_modules():
+            if os.path.exists(module_path):
+                os.remove(module_path)
+                removed.append(module_path)
+                logger.info(f"Removed stale module: {module_path}")
+        return removed
+
+    def save(self) -> None:
+        """Write the manifest for the current run."""
+        data = {
+            "format": MANIFEST_FORMAT,
+            "fingerprint": self.fingerprint,
+            "paths": self.paths,
+            "schemas": self.schemas,
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        logger.info(f"Wrote generation manifest: {self.path}")
@@ -4,24 +4,53 @@
 
 import os
 import re
-import json
 import yaml
 import logging
-import concurrent.futures
-from jinja2 import Environment, FileSystemLoader
-from typing import Dict, Any
+import collections
+from typing import Callable, Dict, Any, FrozenSet, List, Tuple
 from pathlib import Path
-import subprocess
-import itertools
-
-from cnoe_agent_utils import LLMFactory
-from langchain_core.messages import SystemMessage
 import textwrap
+import threading
+import time
+
+from . import profiling
+from .cache import get_cache_dir
+from .formatter import RuffFormatter, content_hash, run_ruff
+from .manifest import GenerationManifest, directory_hash, fragment_hash, generator_version, stable_hash
+from .ir import BodyField, Operation, SpecIR
+from .ref_resolver import RefResolver
+from .llm_cache import LLMCache, model_identifier
+from .llm_client import LLMRunner, parse_json_object
+from .rendering import RenderPool, get_template_env, resolve_jobs
+from .spec_loader import load_spec
+from .tools_manifest import MANIFEST_FILE_NAME, build_tools_manifest, manifest_json
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("mcp_codegen")
 
+# "function" renders a full request-building body per operation; "table" renders an
+# operation table executed by api.client.call_operation behind thin typed wrappers
+TOOL_MODES = ("function", "table")
+
+# Sent once per batched docstring request, after the function prompts are listed
+DOCSTRING_BATCH_INSTRUCTIONS = """
+Write the docstring of each of the following functions. Apply the rules above to every function independently.
+Respond with ONLY a JSON object that maps each function key (the text after "### ") to its complete docstring text, without the enclosing triple quotes.
+"""
+
+
+def clean_llm_docstring(content: str) -> str:
+  """Strip Markdown fences and quotes from an LLM docstring and wrap it in triple single quotes."""
+  # Remove markdown-style code blocks
+  cleaned = re.sub(r"^```(?:python)?\n([\s\S]*?)\n```$", r"\1", content.strip(), flags=re.MULTILINE)
+  # Remove leading/trailing triple quotes of either type, if present
+  cleaned = re.sub(r"^([\"']{3,})", '', cleaned)
+  cleaned = re.sub(r"([\"']{3,})$", '', cleaned)
+  cleaned = cleaned.strip()
+  # Always wrap in triple single quotes for safety
+  return "'''\n" + cleaned + "\n'''"
+
 def camel_to_snake(name):
     if name.isupper():
         return "_".join(name).lower()
@@ -216,6 +245,7 @@ class MCPGenerator:
     spec (dict): Parsed OpenAPI specification loaded from the spec file.
     mcp_name (str): Name of the MCP derived from the OpenAPI specification title.
     src_output_dir (str): Directory for storing the generated MCP source code.
+    jobs (int): Number of worker processes used to render tool modules and models.
 
   Methods:
     __init__(script_dir, spec_path, output_dir, config_path):
@@ -227,11 +257,20 @@ class MCPGenerator:
     render_template(template_name, output_path, **kwargs):
       Renders a Jinja2 template and writes the output to a specified file.
 
+    render_templates(tasks):
+      Renders a batch of templates, using a process pool when `jobs` > 1, and writes them in order.
+
     _get_python_type(prop):
       Maps OpenAPI property types to corresponding Python types.
 
-    run_ruff_lint(input_file):
-      Runs Ruff linting with auto-fix enabled on a specified file.
+    run_ruff_lint(*input_files):
+      Runs Ruff formatting and linting with auto-fix enabled on the given files.
+
+    queue_ruff_lint(input_file):
+      Queues a generated file for the batched Ruff pass at the end of the run.
+
+    format_generated_files():
+      Formats every queued file with a single Ruff invocation.
 
     get_file_header_kwargs():
       Retrieves file header configuration from the configuration file.
@@ -284,7 +323,13 @@ class MCPGenerator:
       generate_eval: bool = False,
       generate_system_prompt: bool = False,
       with_a2a_proxy: bool = False,
-      enable_slim: bool = False):
+      enable_slim: bool = False,
+      jobs: int = 1,
+      tool_mode: str = "function",
+      lazy_tools: bool = False,
+      use_llm_cache: bool = True,
+      refresh_llm_cache: bool = False,
+      spec: Dict[str, Any] = None):
     """
     Initialize the MCPGenerator with paths and configuration.
 
@@ -293,6 +338,14 @@ class MCPGenerator:
       spec_path (str): Path to the OpenAPI specification file.
       output_dir (str): Directory where generated code will be stored.
       config_path (str): Path to the configuration file.
+      jobs (int): Worker processes used to render tool modules and models (0 means one per CPU).
+      tool_mode (str): How tool modules are generated, one of TOOL_MODES.
+      lazy_tools (bool): Register tools in server.py from a generated tool manifest and
+        import each tool module on its first call.
+      use_llm_cache (bool): Reuse LLM docstrings cached by earlier runs.
+      refresh_llm_cache (bool): Ignore cached LLM docstrings and replace them with new ones.
+      spec (dict): Already loaded (e.g. enhanced in memory) specification to generate from
+        instead of reading spec_path.
     """
     logger.info("Initializing MCPGenerator")
     self.script_dir = script_dir
@@ -301,28 +354,17 @@ class MCPGenerator:
     self.dry_run = dry_run
     self.should_enhance_docstring_with_llm = enhance_docstring_with_llm
     self.should_enhance_docstring_with_llm_openapi = enhance_docstring_with_llm_openapi
-    self.env = Environment(loader=FileSystemLoader(os.path.join(script_dir, 'templates')))
-    
-    # Add custom filters for MCP compatibility
-    def truncate_description(text, max_length=9000):
-      """Truncate descriptions to prevent MCP tool registration failures (10024 char limit)"""
-      if not text or len(text) <= max_length:
-        return text
-      # Find a good break point near the limit (end of sentence or paragraph)
-      truncated = text[:max_length]
-      # Look for sentence endings near the limit
-      for break_char in ['. ', '.\n', '\n\n']:
-        last_break = truncated.rfind(break_char)
-        if last_break > max_length * 0.8:  # Within 80% of limit
-          return truncated[:last_break + 1] + "\n\n[Description truncated for MCP compatibility]"
-      # Fallback: hard truncate with ellipsis
-      return truncated + "...\n\n[Description truncated for MCP compatibility]"
-    
-    self.env.filters['truncate_description'] = truncate_description
-    
+    self.env = get_template_env(os.path.join(script_dir, 'templates'))
+    self.jobs = resolve_jobs(jobs)
+    if tool_mode not in TOOL_MODES:
+      raise ValueError(f"Unknown tool mode '{tool_mode}', expected one of: {', '.join(TOOL_MODES)}")
+    self.tool_mode = tool_mode
+    self.lazy_tools = lazy_tools
+    self._render_pool = None
+
     with open(config_path, encoding='utf-8') as f:
       self.config = yaml.safe_load(f)
-    self.spec = self._load_spec()
+    self.spec = spec if spec is not None else self._load_spec()
     # Get MCP name from config (title or mcp_name) or fall back to spec title
     raw_name = (
         self.config.get('title') or
@@ -333,6 +375,7 @@ class MCPGenerator:
     self.mcp_name = raw_name.lower().replace(' ', '_').replace('-', '_')
     self.src_output_dir = os.path.join(self.output_dir, f'mcp_{self.mcp_name}')
     os.makedirs(self.src_output_dir, exist_ok=True)
+    self.formatter = RuffFormatter(self.output_dir)
     self.tools_map = {}
     self.generate_agent_flag = generate_agent
     self.generate_eval = generate_eval
@@ -340,6 +383,18 @@ class MCPGenerator:
     self.with_a2a_proxy = with_a2a_proxy
     self.enable_slim = enable_slim
     self.used_function_names = set()  # Track function names to avoid duplicates
+    self.manifest = None  # Set by generate() for incremental regeneration
+    self._ref_resolver = None
+    self._ir = None
+    # Schema flattening caches keyed by schema identity; values keep the schema alive
+    self._body_params_cache = {}
+    self._param_count_cache = {}
+    # One LLM client shared by every docstring and system prompt request, created on first use
+    self._llm_runner = None
+    self._llm_runner_lock = threading.Lock()
+    self.use_llm_cache = use_llm_cache
+    self.refresh_llm_cache = refresh_llm_cache
+    self._docstring_cache = None
     logger.debug(f"Initialized MCPGenerator with MCP name: {self.mcp_name}")
 
   def _load_spec(self) -> Dict[str, Any]:
@@ -349,45 +404,129 @@ class MCPGenerator:
     Returns:
       dict: Parsed OpenAPI specification.
     """
-    logger.info(f"Loading OpenAPI specification from {self.spec_path}")
-    with open(self.spec_path, 'r', encoding='utf-8') as f:
-      if self.spec_path.endswith(('.yaml', '.yml')):
-        spec = yaml.safe_load(f)
-      else:
-        spec = json.load(f)
-    logger.debug(f"Loaded OpenAPI specification: {spec}")
+    logger.info("Loading OpenAPI specification from %s", self.spec_path)
+    with profiling.phase("parse"):
+      spec = load_spec(self.spec_path)
+    logger.debug("Loaded OpenAPI specification with %d paths", len(spec.get('paths') or {}))
     return spec
 
-  def render_template(self, template_name: str, output_path: str, **kwargs):
+  def render_template(self, template_name: str, output_path: str, **kwargs) -> bool:
     """
     Render a Jinja2 template and write the output to a file.
 
+    Files whose rendered source and on-disk content match the previous run are
+    left untouched.
+
     Args:
       template_name (str): Name of the template file.
       output_path (str): Path to the output file.
       **kwargs: Additional context variables for the template.
+
+    Returns:
+      bool: True if the file was written, False if it was already up to date.
     """
-    logger.info(f"Rendering template: {template_name} to {output_path}")
+    logger.info("Rendering template: %s to %s", template_name, output_path)
     template = self.env.get_template(template_name)
-    logger.debug(f"Template context: {kwargs}")
+    logger.debug("Template context: %s", kwargs)
+    profiler = profiling.active_profiler()
+    if profiler is None:
+      return self._write_rendered(output_path, template.render(**kwargs))
+    wall, cpu = time.perf_counter(), time.process_time()
     rendered = template.render(**kwargs)
-    with open(output_path, 'w+', encoding='utf-8') as f:
-      f.write(rendered)
-    logger.info(f"Generated file: {output_path}")
+    profiler.record_render(template_name, output_path, time.perf_counter() - wall, time.process_time() - cpu)
+    return self._write_rendered(output_path, rendered)
+
+  def render_templates(
+      self,
+      tasks: List[Tuple[str, str, Dict[str, Any]]],
+      transform: Callable[[List[Tuple[str, str]]], List[str]] = None,
+      transform_key: str = "") -> List[bool]:
+    """
+    Render a batch of templates, in parallel when the generator runs with more than one job.
+
+    Files are written in the order of `tasks`, so the output is identical to
+    calling `render_template` for each task.
+
+    Args:
+      tasks (list): (template_name, output_path, context) tuples.
+      transform (callable): Rewrites the rendered sources before they are written, given
+        (output_path, source) pairs of the files that are not up to date. The format cache
+        stays keyed by the rendered source, so unchanged renders skip the transform next run.
+      transform_key (str): Identity of `transform` and its settings, added to the format
+        cache key. Enabling, disabling or reconfiguring the transform makes every file stale.
+
+    Returns:
+      list: For each task, True if the file was written, False if it was already up to date.
+    """
+    profiler = profiling.active_profiler()
+    if self.jobs > 1 and len(tasks) > 1:
+      if self._render_pool is None:
+        self._render_pool = RenderPool(os.path.join(self.script_dir, 'templates'), self.jobs)
+      wall = time.perf_counter()
+      contents = self._render_pool.render([(name, context) for name, _, context in tasks])
+      if profiler is not None:
+        # Per-output timings stay in the workers; record the batch per template
+        wall = time.perf_counter() - wall
+        counts = collections.Counter(name for name, _, _ in tasks)
+        for name, count in counts.items():
+          profiler.record_render(name, None, wall * count / len(tasks), 0.0, count=count)
+    elif profiler is None:
+      contents = [self.env.get_template(name).render(**context) for name, _, context in tasks]
+    else:
+      contents = []
+      for name, output_path, context in tasks:
+        wall, cpu = time.perf_counter(), time.process_time()
+        contents.append(self.env.get_template(name).render(**context))
+        profiler.record_render(name, output_path, time.perf_counter() - wall, time.process_time() - cpu)
+    if transform is None:
+      return [self._write_rendered(output_path, rendered) for (_, output_path, _), rendered in zip(tasks, contents)]
+    stale = [i for i, ((_, output_path, _), rendered) in enumerate(zip(tasks, contents))
+             if not self.formatter.is_unchanged(output_path, rendered, transform_key)]
+    if stale:
+      logger.info(f"Transforming {len(stale)} rendered file(s) before writing")
+      transformed = dict(zip(stale, transform([(tasks[i][1], contents[i]) for i in stale])))
+    else:
+      transformed = {}
+    return [
+      self._write_rendered(output_path, transformed.get(i, rendered), source=rendered, variant=transform_key)
+      for i, ((_, output_path, _), rendered) in enumerate(zip(tasks, contents))
+    ]
 
-  def _get_python_type(self, prop: Dict[str, Any]) -> str:
+  def close_render_pool(self):
+    """
+    Shut down the render worker processes, if any were started.
+    """
+    if self._render_pool is not None:
+      self._render_pool.close()
+      self._render_pool = None
+
+  def _write_rendered(self, output_path: str, rendered: str, source: str = None, variant: str = "") -> bool:
+    written = self.formatter.write(output_path, rendered, source=source, variant=variant)
+    profiler = profiling.active_profiler()
+    if profiler is not None:
+      profiler.record_file(written, len(rendered.encode('utf-8')) if written else 0)
+    if not written:
+      logger.info("Unchanged file: %s", output_path)
+      return False
+    logger.info("Generated file: %s", output_path)
+    return True
+
+  def _get_python_type(self, prop: Dict[str, Any], _seen: FrozenSet[str] = frozenset()) -> str:
     """
     Map OpenAPI property types to Python types.
 
     Args:
       prop (dict): OpenAPI property definition.
+      _seen (frozenset): References already being expanded (recursion guard).
 
     Returns:
       str: Corresponding Python type.
     """
     # Resolve component references so nested / referenced enums are visible
     if "$ref" in prop:
-        prop = self._resolve_ref(prop["$ref"]) or {}
+        ref = prop["$ref"]
+        prop = self._resolve_ref(ref, _seen) or {}
+        _seen = _seen | {ref}
     # Enumerations -------------------------------------------------------
     if prop.get("enum"):
         enum_vals = prop["enum"]
@@ -402,144 +541,315 @@ class MCPGenerator:
     elif t == "boolean":
       return "bool"
     elif t == "array":
-      return f"List[{self._get_python_type(prop.get('items', {}))}]"
+      return f"List[{self._get_python_type(prop.get('items', {}), _seen)}]"
     elif t == "object":
       return "Dict[str, Any]"
     return "str"
 
-  def run_ruff_lint(self, input_file: str):
+  def run_ruff_lint(self, *input_files: str):
+    """
+    Run Ruff formatting and linting with auto-fix enabled.
+
+    All files are handed to a single ``ruff format`` and ``ruff check`` invocation.
+
+    Args:
+      *input_files (str): Paths of the files to lint.
+    """
+    profiler = profiling.active_profiler()
+    wall = time.perf_counter()
+    run_ruff(list(input_files))
+    if profiler is not None:
+      profiler.record_ruff(len(input_files), time.perf_counter() - wall)
+    logger.info("Ruff linting completed")
+
+  def queue_ruff_lint(self, input_file: str):
     """
-    Run Ruff linting on a file with auto-fix enabled.
+    Queue a generated file for the batched Ruff pass run by `format_generated_files`.
 
     Args:
       input_file (str): Path to the file to lint.
     """
-    logger.info(f"Running Ruff format on {input_file}")
-    subprocess.run(
-      [
-      "ruff",
-      "format",
-      "--line-length",
-      "140",
-      input_file
-      ],
-      check=True,
+    self.formatter.queue(input_file)
+
+  def format_generated_files(self) -> int:
+    """
+    Format every file queued during this run with one Ruff invocation.
+
+    Returns:
+      int: Number of files formatted.
+    """
+    count = self.formatter.flush(self.run_ruff_lint)
+    logger.info(f"Formatted {count} generated file(s) with Ruff")
+    return count
+
+  def _get_llm_runner(self) -> LLMRunner:
+    """
+    Return the runner for LLM requests, creating the LLM client on first use.
+
+    Concurrency, rate limit, retries and the docstring cache come from
+    ``docstring_enhancements`` in config.yaml.
+    """
+    with self._llm_runner_lock:
+      if self._llm_runner is None:
+        from cnoe_agent_utils import LLMFactory
+
+        settings = self.config.get('docstring_enhancements') or {}
+        self._llm_runner = LLMRunner(
+          LLMFactory().get_llm(),
+          max_concurrency=settings.get('llm_concurrency', 4),
+          requests_per_second=settings.get('llm_requests_per_second'),
+          max_retries=settings.get('llm_max_retries', 3),
+        )
+        if self.use_llm_cache and settings.get('llm_cache', True):
+          self._docstring_cache = LLMCache(
+            path=str(get_cache_dir("llm") / "docstrings.sqlite3"),
+            max_entries=settings.get('llm_cache_max_entries', 10000),
+            max_age_days=settings.get('llm_cache_max_age_days', 30),
+            refresh=self.refresh_llm_cache,
+          )
+      return self._llm_runner
+
+  def _docstring_cache_key(self, system_prompt: str, function_prompt: str) -> str:
+    """Cache key of a docstring: model, prompt variant and the function's name, arguments, docstring and source."""
+    return LLMCache.make_key(model_identifier(self._llm_runner.llm), "docstring", system_prompt, function_prompt)
+
+  def _docstring_system_prompt(self) -> str:
+    if self.should_enhance_docstring_with_llm_openapi:
+      openapi_prompt = (
+        "Include an 'OpenAPI Specification:' section in the docstring and provide OpenAPI YAML under it if applicable. "
+      )
+    else:
+      openapi_prompt = ""
+    return (
+      "You are a senior API engineer. Your task is to generate Python docstrings in Google-style format for async and sync functions used in platform engineering tools. "
+      "Use this format: \"\"\" Summary line. Args: arg1 (type): Description. arg2 (type, optional): Description. Defaults to None. Returns: ReturnType: Description. Raises: ExceptionType: Description. \"\"\". "
+      + openapi_prompt +
+      "Do not include any extra commentary or markdown formatting. Return only the complete docstring, enclosed in triple quotes."
     )
-    logger.info(f"Running Ruff lint on {input_file}")
-    subprocess.run(
-      [
-      "ruff",
-      "check",
-      "--fix",
-      "--ignore",
-      "E402,E501",
-      input_file
-      ],
-      check=True,
+
+  @staticmethod
+  def _docstring_function_prompt(func_name: str, args: List[str], original_doc: str, func_code: str) -> str:
+    return (
+      f"Function Name: {func_name}\n"
+      f"Arguments: {', '.join(args)}\n"
+      f"Original Docstring:\n{original_doc or 'None'}\n"
+      f"Function Code:\n{func_code}\n"
     )
-    logger.info("Ruff linting completed")
 
-  def enhance_docstring_with_llm(self, input_path: str, output_path: str, dry_run: bool = False) -> None:
+  def _batch_docstring_functions(self, functions: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+    """
+    Split ``(key, prompt)`` pairs into batches whose prompts fit in ``llm_batch_token_budget``
+    (estimated at 4 characters per token).
+    """
+    settings = self.config.get('docstring_enhancements') or {}
+    budget = settings.get('llm_batch_token_budget', 6000)
+    batches, current, current_tokens = [], [], 0
+    for key, prompt in functions:
+      tokens = len(prompt) // 4
+      if current and current_tokens + tokens > budget:
+        batches.append(current)
+        current, current_tokens = [], 0
+      current.append((key, prompt))
+      current_tokens += tokens
+    if current:
+      batches.append(current)
+    return batches
+
+  @staticmethod
+  def _docstring_function_keys(tree) -> List[Tuple[str, Any]]:
+    """
+    Return ``(key, node)`` for every function of a module, in source order.
+
+    The key is the function's qualified name (e.g. ``outer.wrapper``), followed by its
+    line number when the module defines several functions with that qualified name.
+    Batched docstring requests and answers are matched by this key.
+    """
+    import ast
+
+    functions = []
+
+    def visit(node, prefix):
+      for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+          if not isinstance(child, ast.ClassDef):
+            functions.append((prefix + child.name, child))
+          visit(child, f"{prefix}{child.name}.")
+        else:
+          visit(child, prefix)
+
+    visit(tree, "")
+    counts = collections.Counter(qualname for qualname, _ in functions)
+    return [(qualname if counts[qualname] == 1 else f"{qualname}@{node.lineno}", node)
+            for qualname, node in functions]
+
+  def enhance_source_docstrings(self, source_code: str, label: str = "<source>") -> str:
       """
-      Enhance Python function docstrings using Azure OpenAI LLM in OpenAPI-style format.
+      Enhance the function docstrings of Python source using an LLM in OpenAPI-style format.
+
+      Docstrings cached by earlier runs for the same function source, original docstring,
+      prompt and model are reused. The remaining docstrings of a module are requested
+      together as one JSON answer, split into several requests only when the functions
+      exceed the token budget. Functions a batched answer leaves out are requested one
+      at a time.
 
       Args:
-        input_path (str): Path to the input Python file.
-        output_path (str): Path where the modified file will be saved.
-        dry_run (bool): If True, only log the changes; do not write to disk.
+        source_code (str): Python source, e.g. a rendered tool module.
+        label (str): Name of the source used in log and error messages.
+
+      Returns:
+        str: The source with enhanced docstrings.
       """
       import ast
-      import re
-      from cnoe_agent_utils import LLMFactory
       from langchain_core.messages import SystemMessage, HumanMessage
 
-      logger.info(f"Starting LLM docstring enhancement for file: {input_path}")
-
-      llm = LLMFactory().get_llm()
-
-      def get_openapi_docstring(func_name, args, original_doc, func_code):
-          if getattr(self, "should_enhance_docstring_with_llm_openapi", False):
-              openapi_prompt = (
-                  "Include an 'OpenAPI Specification:' section in the docstring and provide OpenAPI YAML under it if applicable. "
-              )
-          else:
-              openapi_prompt = ""
-
-          system_msg = SystemMessage(
-              content=(
-                  "You are a senior API engineer. Your task is to generate Python docstrings in Google-style format for async and sync functions used in platform engineering tools. "
-                  "Use this format: \"\"\" Summary line. Args: arg1 (type): Description. arg2 (type, optional): Description. Defaults to None. Returns: ReturnType: Description. Raises: ExceptionType: Description. \"\"\". "
-                  + openapi_prompt +
-                  "Do not include any extra commentary or markdown formatting. Return only the complete docstring, enclosed in triple quotes."
-              )
-          )
-          user_prompt = (
-              f"Function Name: {func_name}\n"
-              f"Arguments: {', '.join(args)}\n"
-              f"Original Docstring:\n{original_doc or 'None'}\n"
-              f"Function Code:\n{func_code}\n\n"
-              f"Rewrite or generate a detailed OpenAPI-style Python docstring. Return only the full docstring including both opening and closing triple quotes (''' or \"\"\")."
-          )
-          response = llm.invoke([system_msg, HumanMessage(content=user_prompt)])
-
-          def clean_docstring(content: str) -> str:
-              # Remove markdown-style code blocks
-              cleaned = re.sub(r"^```(?:python)?\n([\s\S]*?)\n```$", r"\1", content.strip(), flags=re.MULTILINE)
-              # Remove leading/trailing triple quotes of either type, if present
-              cleaned = re.sub(r"^([\"']{3,})", '', cleaned)
-              cleaned = re.sub(r"([\"']{3,})$", '', cleaned)
-              cleaned = cleaned.strip()
-              # Always wrap in triple single quotes for safety
-              return "'''\n" + cleaned + "\n'''"
-          return clean_docstring(response.content)
-
-      if not os.path.exists(input_path):
-          raise FileNotFoundError(f"Input file '{input_path}' not found.")
+      logger.info(f"Starting LLM docstring enhancement for: {label}")
 
-      with open(input_path, 'r', encoding='utf-8') as f:
-          source_code = f.read()
+      runner = self._get_llm_runner()
+      cache = self._docstring_cache
+      system_prompt = self._docstring_system_prompt()
+      system_msg = SystemMessage(content=system_prompt)
       source_lines = source_code.splitlines()
 
       try:
           tree = ast.parse(source_code)
       except SyntaxError as e:
-          raise SyntaxError(f"Input file '{input_path}' contains invalid Python syntax: {e}")
-
-      # Collect changes as tuples: (start_line, end_line, new_docstring_lines)
+          raise SyntaxError(f"Input file '{label}' contains invalid Python syntax: {e}")
+
+      # Functions whose docstring is replaced: (key, name, prompt, doc_start, doc_end)
+      targets = []
+      for key, node in self._docstring_function_keys(tree):
+          func_name = node.name
+          args = [arg.arg for arg in node.args.args]
+          doc = ast.get_docstring(node, clean=False)
+          if doc is not None and len(node.body) > 0:
+              doc_node = node.body[0]
+              if isinstance(doc_node, ast.Expr) and isinstance(doc_node.value, ast.Constant):
+                  doc_start = doc_node.lineno - 1
+                  doc_end = doc_start + len(doc.splitlines())
+                  func_source = "\n".join(source_lines[node.lineno - 1:node.end_lineno])
+                  prompt = self._docstring_function_prompt(func_name, args, doc, func_source)
+                  targets.append((key, func_name, prompt, doc_start, doc_end))
+
+      # Collect changes as tuples: (start_line, end_line, llm_docstring)
       docstring_replacements = []
+      pending = []
+      cache_keys = {}
+      for target in targets:
+          if cache is not None:
+              cache_keys[target[0]] = self._docstring_cache_key(system_prompt, target[2])
+              cached_doc = cache.get(cache_keys[target[0]])
+              if cached_doc is not None:
+                  docstring_replacements.append((target[3], target[4], cached_doc))
+                  continue
+          pending.append(target)
 
-      for node in ast.walk(tree):
-          if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-              func_name = node.name
-              args = [arg.arg for arg in node.args.args]
-              doc = ast.get_docstring(node, clean=False)
-              if doc is not None and len(node.body) > 0:
-                  doc_node = node.body[0]
-                  if isinstance(doc_node, ast.Expr) and isinstance(doc_node.value, ast.Constant):
-                      doc_start = doc_node.lineno - 1
-                      doc_end = doc_start + len(doc.splitlines())
-                      func_source_lines = source_lines[node.lineno - 1:node.end_lineno]
-                      func_source = "\n".join(func_source_lines)
-                      try:
-                          new_doc = get_openapi_docstring(func_name, args, doc, func_source)
-                      except Exception as enhance_error:
-                          logger.error(f"LLM enhancement failed for function '{func_name}': {enhance_error}. Raising error.")
-                          raise RuntimeError(f"LLM enhancement failed for function '{func_name}': {enhance_error}") from enhance_error
-                      indent = re.match(r'^(\s*)', source_lines[doc_start]).group(1)
-                      new_doc_lines = [(indent + line if line.strip() else line) for line in new_doc.splitlines()]
-                      docstring_replacements.append((doc_start, doc_end, new_doc_lines))
+      def store(target, content):
+          docstring_replacements.append((target[3], target[4], content))
+          if cache is not None:
+              cache.put(cache_keys[target[0]], content)
+
+      for batch in self._batch_docstring_functions([(key, prompt) for key, _, prompt, _, _ in pending]):
+          if len(batch) < 2:
+              continue
+          keys = {key for key, _ in batch}
+          user_prompt = '\n\n'.join(
+              [DOCSTRING_BATCH_INSTRUCTIONS.strip()] + [f"### {key}\n{prompt}" for key, prompt in batch]
+          )
+          try:
+              response = runner.invoke([system_msg, HumanMessage(content=user_prompt)])
+              answers = parse_json_object(response.content)
+          except Exception as e:
+              logger.warning(f"Batched docstring request for {label} failed: {e}, falling back to one request per function")
+              continue
+          # Only answers for this batch's own functions are used
+          answered = {key: value for key, value in answers.items()
+                      if key in keys and isinstance(value, str) and value.strip()}
+          logger.debug("Batched LLM request enhanced %d of %d docstrings in %s", len(answered), len(batch), label)
+          for target in [t for t in pending if t[0] in answered]:
+              pending.remove(target)
+              store(target, answered[target[0]])
+
+      # Fall back per function for anything no batch answered
+      for target in pending:
+          func_name, prompt = target[1], target[2]
+          user_prompt = (
+              f"{prompt}\n"
+              f"Rewrite or generate a detailed OpenAPI-style Python docstring. Return only the full docstring including both opening and closing triple quotes (''' or \"\"\")."
+          )
+          try:
+              response = runner.invoke([system_msg, HumanMessage(content=user_prompt)])
+          except Exception as enhance_error:
+              logger.error(f"LLM enhancement failed for function '{func_name}': {enhance_error}. Raising error.")
+              raise RuntimeError(f"LLM enhancement failed for function '{func_name}': {enhance_error}") from enhance_error
+          store(target, response.content)
 
       # Apply replacements in reverse order (bottom-up) to avoid messing up line numbers
-      for doc_start, doc_end, new_doc_lines in sorted(docstring_replacements, reverse=True):
+      for doc_start, doc_end, content in sorted(docstring_replacements, reverse=True):
+          indent = re.match(r'^(\s*)', source_lines[doc_start]).group(1)
+          new_doc_lines = [(indent + line if line.strip() else line) for line in clean_llm_docstring(content).splitlines()]
           source_lines[doc_start:doc_end] = new_doc_lines
+      return "\n".join(source_lines) + ("\n" if source_code.endswith("\n") else "")
+
+  def enhance_docstring_with_llm(self, input_path: str, output_path: str, dry_run: bool = False) -> None:
+      """
+      Enhance the function docstrings of a Python file (see `enhance_source_docstrings`).
+
+      Args:
+        input_path (str): Path to the input Python file.
+        output_path (str): Path where the modified file will be saved.
+        dry_run (bool): If True, only log the changes; do not write to disk.
+      """
+      if not os.path.exists(input_path):
+          raise FileNotFoundError(f"Input file '{input_path}' not found.")
+
+      with open(input_path, 'r', encoding='utf-8') as f:
+          enhanced = self.enhance_source_docstrings(f.read(), input_path)
 
       if dry_run:
-          logger.info(f"[Dry Run] Enhanced content for: {input_path}\n" + "\n".join(source_lines))
+          logger.info(f"[Dry Run] Enhanced content for: {input_path}\n" + enhanced)
       else:
           with open(output_path, 'w', encoding='utf-8') as f:
-              f.write("\n".join(source_lines))
+              f.write(enhanced)
           logger.info(f"Enhanced file written to: {output_path}")
 
+  def enhance_docstrings(self, sources: List[Tuple[str, str]]) -> List[str]:
+    """
+    Enhance the docstrings of several modules in memory, concurrently, sharing one
+    LLM client and its concurrency limit.
+
+    Args:
+      sources (list): (output_path, source) pairs; the path only labels log messages.
+
+    Returns:
+      list: The enhanced sources, in the order of `sources`.
+
+    Raises:
+      RuntimeError: If the enhancement of any module failed.
+    """
+    runner = self._get_llm_runner()
+    cache = self._docstring_cache
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+
+    def enhance(item):
+      path, source = item
+      try:
+        return self.enhance_source_docstrings(source, path)
+      except Exception as e:
+        logger.error(f"Error during parallel LLM docstring enhancement: {e}")
+        return e
+
+    results = runner.map(enhance, sources)
+    errors_found = [result for result in results if isinstance(result, Exception)]
+    if cache is not None:
+      hits, misses = cache.hits - hits, cache.misses - misses
+      logger.info(f"LLM docstring cache: {hits} hits, {misses} misses")
+      profiler = profiling.active_profiler()
+      if profiler is not None:
+        profiler.record_cache("docstrings", hits, misses)
+    if errors_found:
+      raise RuntimeError("One or more errors occurred during LLM docstring enhancement.") from errors_found[0]
+    return results
+
   def get_file_header_kwargs(self) -> Dict[str, Any]:
     """
     Retrieve file header configuration from the config file.
@@ -554,7 +864,7 @@ class MCPGenerator:
       "file_headers_license": file_headers_config.get("license", ""),
       "file_headers_message": file_headers_config.get("message", "")
     }
-    logger.debug(f"File header kwargs: {kwargs}")
+    logger.debug("File header kwargs: %s", kwargs)
     return kwargs
 
   def generate_model_base(self):
@@ -566,7 +876,7 @@ class MCPGenerator:
     os.makedirs(path, exist_ok=True)
     file_header_kwargs = self.get_file_header_kwargs()
     self.render_template('models/base_model.tpl', os.path.join(path, 'base.py'), **file_header_kwargs)
-    self.run_ruff_lint(os.path.join(path, 'base.py'))
+    self.queue_ruff_lint(os.path.join(path, 'base.py'))
 
   def generate_models(self):
     """
@@ -574,7 +884,16 @@ class MCPGenerator:
     """
     logger.info("Generating models")
     schemas = self.spec.get('components', {}).get('schemas', {})
+    tasks = []
     for schema_name, schema in schemas.items():
+      model_path = os.path.join(self.src_output_dir, 'models', f'{camel_to_snake(schema_name)}.py').lower()
+      if self.manifest is not None:
+        schema_digest = fragment_hash(schema, self.spec)
+        unchanged = self.manifest.schema_unchanged(schema_name, schema_digest, model_path)
+        self.manifest.record_schema(schema_name, schema_digest, model_path)
+        if unchanged:
+          logger.info(f"Skipping unchanged model: {model_path}")
+          continue
       model_name = ''.join(word.capitalize() for word in re.split(r'[_\-]+', schema_name)).replace('.', '')
       fields = []
       required_fields = schema.get('required', [])
@@ -586,14 +905,15 @@ class MCPGenerator:
           'description': prop.get('description', ''),
           'required': prop_name in required_fields
         })
-      model_path = os.path.join(self.src_output_dir, 'models', f'{camel_to_snake(schema_name)}.py')
       kwargs = self.get_file_header_kwargs()
       kwargs.update({
         'description': schema.get('description', ''),
         'fields': fields,
       })
-      self.render_template('models/schema_model.tpl', model_path.lower(), model_name=model_name, **kwargs)
-      self.run_ruff_lint(model_path)
+      tasks.append(('models/schema_model.tpl', model_path, dict(model_name=model_name, **kwargs)))
+    self.render_templates(tasks)
+    for _, model_path, _ in tasks:
+      self.queue_ruff_lint(model_path)
 
   def generate_api_client(self):
     """
@@ -609,7 +929,7 @@ class MCPGenerator:
       'api_headers': self.config.get('headers', {}),
     })
     self.render_template('api/client.tpl', os.path.join(api_dir, 'client.py'), mcp_name=self.mcp_name, **kwargs)
-    self.run_ruff_lint(os.path.join(api_dir, 'client.py'))
+    self.queue_ruff_lint(os.path.join(api_dir, 'client.py'))
     self.render_template('init_empty.tpl', os.path.join(api_dir, '__init__.py'))
 
   def generate_tool_modules(self):
@@ -620,95 +940,20 @@ class MCPGenerator:
     tools_dir = os.path.join(self.src_output_dir, 'tools')
     file_header_kwargs = self.get_file_header_kwargs()
     os.makedirs(tools_dir, exist_ok=True)
-    enhancement_futures = []
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=10)
-    for path, ops in self.spec.get('paths', {}).items():
-      logger.debug(f"Ops: {ops}")
+    spec_paths = self.spec.get('paths', {})
+    # Function names are assigned serially in spec order; rendering is batched afterwards
+    tasks = []
+    for path, operations in self.ir.by_path.items():
+      ops = spec_paths[path]
+      logger.debug("Ops: %s", ops)
       module_name = path.strip('/').replace('/', '_').replace('-', '_').replace('.', '_') or "root"
       module_name = module_name.replace("{", "").replace("}", "")
       functions = []
-      for method, op in ops.items():
-        if method.upper() not in ["GET", "POST", "PUT", "DELETE"]:
+      for operation in operations:
+        if not operation.is_tool:
           continue
-        # Merge path-item level parameters with operation-level parameters
-        path_level_params = ops.get("parameters", [])  # may be absent
-        op_level_params   = op.get("parameters", [])   # may be absent
-        all_params: list = list(
-            itertools.chain(path_level_params, op_level_params)
-        )
-        params = []
-        # Holds parameter details for documentation
-        params_infos = []
-        for p in all_params:
-          # Resolve parameter reference if the parameter itself is a $ref
-          if "$ref" in p:
-              p = self._resolve_ref(p["$ref"])
-
-          # Skip header parameters; process path and query separately
-          if p.get("in") == "header":
-              continue
-
-          if p.get("in") == "path":
-              # Prepend "path_" to the parameter name
-              pname = "path_" + p.get("name", "param").replace('.', '_')
-              schema = p.get("schema", {})
-              if "$ref" in schema:
-                  schema = self._resolve_ref(schema["$ref"])
-              ptype = self._get_python_type(schema)
-              # For path parameters, assume they are required
-              params.append(f"{pname}: {ptype}")
-              params_infos.append({
-                  "name": pname,
-                  "type": ptype,
-                  "description": p.get("description", "")
-              })
-          elif p.get("in") == "query":
-              # Apply snake_case conversion for better Python compliance
-              param_name = p.get("name", "param").replace('.', '_')
-              pname = "param_" + camel_to_snake(param_name)
-              # If the schema is not defined, use the parameter object itself
-              schema = p.get("schema") or p
-              if "$ref" in schema:
-                  schema = self._resolve_ref(schema["$ref"])
-              ptype = self._get_python_type(schema)
-              desc = p.get("description", "")
-              if p.get("required"):
-                  params.append(f"{pname}: {ptype}")
-              else:
-                  if ptype == "bool":
-                      params.append(f"{pname}: {ptype} = False")
-                  else:
-                      params.append(f"{pname}: {ptype} = None")
-              params_infos.append({
-                  "name": pname,
-                  "type": ptype,
-                  "description": desc
-              })
-          elif p.get("in") == "body":
-              schema = p.get("schema", {})
-              body_params = self._extract_body_params(schema, prefix="body")
-              for sig, info in body_params:
-                  params.append(sig)
-                  params_infos.append(info)
-        if "requestBody" in op:
-            request_body = op["requestBody"]
-            # Resolve component-level requestBodies references
-            if isinstance(request_body, dict) and "$ref" in request_body:
-                request_body = self._resolve_ref(request_body["$ref"]) or {}
-
-            # At this point request_body must be the expanded object with “content”
-            content = request_body.get("content", {})
-            # Prefer JSON but fall back to the first available media type
-            media = (
-                content.get("application/json")
-                or next(iter(content.values()), {})
-            )
-            schema = media.get("schema", {})
-            if schema:
-                body_params = self._extract_body_params(schema, prefix="body")
-                for sig, info in body_params:
-                    params.append(sig)
-                    params_infos.append(info)
+        method, op = operation.method, operation.raw
+        params, params_infos = self._operation_params(operation)
         # Reorder parameters: all non-default parameters first, then default parameters
         non_default_params = [p for p in params if "=" not in p]
         default_params = [p for p in params if "=" in p]
@@ -716,15 +961,10 @@ class MCPGenerator:
 
         # Compute formatted_path by replacing each path placeholder with one that uses the resolved ref name prefixed with "path_"
         formatted_path = path
-        for p in all_params:
-            # Resolve the parameter if it uses a $ref
-            if "$ref" in p:
-                p = self._resolve_ref(p["$ref"])
-            if p.get("in") == "path":
-                orig_name = p.get("name", "param")
-                fixed_name = "path_" + orig_name.replace(".", "_")
+        for p in operation.parameters:
+            if p.location == "path":
                 # Replace placeholder {orig_name} with {fixed_name}
-                formatted_path = formatted_path.replace("{" + orig_name + "}", "{" + fixed_name + "}")
+                formatted_path = formatted_path.replace("{" + p.name + "}", "{" + p.python_name + "}")
 
         raw_operation_id = camel_to_snake(op.get("operationId", f"{method}_{module_name}").replace(" ", "_"))
         # Remove any curly braces from the operation id
@@ -732,9 +972,10 @@ class MCPGenerator:
         # Apply 30-character target with intelligent truncation and duplicate handling
         operation_id = truncate_function_name(clean_operation_id, method.upper(), self.used_function_names)
 
-        logger.debug(f"Generating function for operation: {operation_id}, method: {method.upper()}, module: {module_name}, path: {path}")
+        logger.debug("Generating function for operation: %s, method: %s, module: %s, path: %s",
+                     operation_id, method.upper(), module_name, path)
 
-        functions.append({
+        function = {
           "operation_id": operation_id,
           "summary": op.get("summary", ""),
           "description": op.get("description", ""),
@@ -743,21 +984,32 @@ class MCPGenerator:
           "params_info": params_infos,  # <-- NEW: list of dicts with name, type, and description
           "path": path,  # original path (optional, for reference)
           "formatted_path": formatted_path
-        })
+        }
+        if self.tool_mode == "table":
+          function["query_fields"], function["body_paths"] = self._operation_table_fields(params, params_infos)
+        functions.append(function)
       if functions:
         output_path = os.path.join(tools_dir, f"{module_name.lower()}.py")
         mcp_server_base_package = self.config.get('mcp_server_base_package', '')
-        self.render_template(
-          "tools/tool.tpl",
-          output_path,
-          path=path,
-          import_path=f"mcp_{self.mcp_name}.api.client",
-          mcp_name=self.mcp_name,
-          mcp_server_base_package=mcp_server_base_package,
-          functions=functions,
-          **file_header_kwargs
-        )
-        self.run_ruff_lint(output_path)
+        unchanged = False
+        if self.manifest is not None:
+          # Names are computed for every path so deduplication stays identical to a full run
+          function_names = [function["operation_id"] for function in functions]
+          path_digest = fragment_hash(ops, self.spec)
+          unchanged = self.manifest.path_unchanged(path, path_digest, output_path, function_names)
+          self.manifest.record_path(path, path_digest, output_path, function_names)
+        if unchanged:
+          logger.info(f"Skipping unchanged tool module: {output_path}")
+        else:
+          template_name = "tools/tool_table.tpl" if self.tool_mode == "table" else "tools/tool.tpl"
+          tasks.append((template_name, output_path, dict(
+            path=path,
+            import_path=f"mcp_{self.mcp_name}.api.client",
+            mcp_name=self.mcp_name,
+            mcp_server_base_package=mcp_server_base_package,
+            functions=functions,
+            **file_header_kwargs
+          )))
         for function in functions:
           # Get the module name without .py
           stripped_module_name = output_path.split("/")[-1].split(".py")[0]
@@ -766,10 +1018,19 @@ class MCPGenerator:
             self.tools_map[stripped_module_name].append(function["operation_id"])
           else:
             self.tools_map[stripped_module_name] = [function["operation_id"]]
-        if self.should_enhance_docstring_with_llm or self.should_enhance_docstring_with_llm_openapi:
-          print("Submitting docstring enhancement for:", output_path)
-          future = executor.submit(self.enhance_docstring_with_llm, input_path=output_path, output_path=output_path)
-          enhancement_futures.append(future)
+
+    # Docstrings are enhanced in memory before the modules are written and formatted
+    enhance = self.should_enhance_docstring_with_llm or self.should_enhance_docstring_with_llm_openapi
+    if enhance:
+      # The prompt covers the OpenAPI variant; toggling either flag rewrites the modules
+      results = self.render_templates(
+        tasks, self.enhance_docstrings, transform_key=f"llm-docstrings:{content_hash(self._docstring_system_prompt())}")
+    else:
+      results = self.render_templates(tasks)
+    # Modules left unchanged on disk are already formatted
+    for (_, output_path, _), written in zip(tasks, results):
+      if written:
+        self.queue_ruff_lint(output_path)
 
     self.render_template(
       "tools/init.tpl",
@@ -777,18 +1038,96 @@ class MCPGenerator:
       **file_header_kwargs
       )
 
-    if enhancement_futures:
-        concurrent.futures.wait(enhancement_futures)
-        errors_found = []
-        for future in enhancement_futures:
-            try:
-                future.result()
-            except Exception as e:
-                logger.error(f"Error during parallel LLM docstring enhancement: {e}")
-                errors_found.append(e)
-        executor.shutdown(wait=True)
-        if errors_found:
-            raise RuntimeError("One or more errors occurred during LLM docstring enhancement.") from errors_found[0]
+  @property
+  def ir(self) -> SpecIR:
+      """
+      Intermediate representation of the currently loaded spec, rebuilt whenever `self.spec` is replaced.
+      """
+      if self._ir is None or self._ir.spec is not self.spec:
+          self._ir = SpecIR(self.spec, self.ref_resolver)
+      return self._ir
+
+  @staticmethod
+  def _operation_table_fields(params: List[str], params_infos: List[Dict[str, Any]]) -> Tuple[tuple, tuple]:
+    """
+    Compute the operation table entries of a tool function (``--tool-mode table``).
+
+    Mirrors the request building of ``tools/tool.tpl``: query parameters are sent under
+    their Python name without the ``param_`` prefix, and body arguments are split on
+    ``__`` into a key path, as ``assemble_nested_body`` does.
+
+    Returns:
+      tuple: (argument, query key) pairs and (argument, body key path) pairs.
+    """
+    query = tuple((info["name"], info["name"][6:]) for info in params_infos if info["name"].startswith("param_"))
+    body = []
+    for param in params:
+      name = param.split(':')[0].strip()
+      if name.startswith("body_"):
+        key = name[5:]
+        if key.startswith("body_"):
+          key = key[5:]
+        body.append((name, tuple(key.split("__"))))
+    return query, tuple(body)
+
+  def _operation_params(self, operation: Operation):
+    """
+    Compute the tool function parameters of an operation.
+
+    Annotates the operation's parameters with their Python names and types and
+    fills `operation.body_fields`.
+
+    Args:
+      operation (Operation): Operation from the spec IR.
+
+    Returns:
+      tuple: Signature strings and parameter info dicts (name, type, description), in spec order.
+    """
+    params = []
+    # Holds parameter details for documentation
+    params_infos = []
+    body_fields = []
+
+    def add_body(schema):
+      for sig, info in self._extract_body_params(schema, prefix="body"):
+        params.append(sig)
+        params_infos.append(info)
+        body_fields.append(BodyField(info["name"], info["type"], info["description"], sig))
+
+    for p in operation.parameters:
+      # Skip header parameters; process path and query separately
+      if p.location == "header":
+        continue
+      if p.location == "path":
+        # Prepend "path_" to the parameter name
+        p.python_name = "path_" + p.name.replace('.', '_')
+        schema = p.schema
+        if "$ref" in schema:
+          schema = self._resolve_ref(schema["$ref"])
+        p.python_type = self._get_python_type(schema)
+        # For path parameters, assume they are required
+        params.append(f"{p.python_name}: {p.python_type}")
+        params_infos.append({"name": p.python_name, "type": p.python_type, "description": p.description})
+      elif p.location == "query":
+        # Apply snake_case conversion for better Python compliance
+        p.python_name = "param_" + camel_to_snake(p.name.replace('.', '_'))
+        schema = p.schema
+        if "$ref" in schema:
+          schema = self._resolve_ref(schema["$ref"])
+        p.python_type = self._get_python_type(schema)
+        if p.required:
+          params.append(f"{p.python_name}: {p.python_type}")
+        elif p.python_type == "bool":
+          params.append(f"{p.python_name}: {p.python_type} = False")
+        else:
+          params.append(f"{p.python_name}: {p.python_type} = None")
+        params_infos.append({"name": p.python_name, "type": p.python_type, "description": p.description})
+      elif p.location == "body":
+        add_body(p.schema)
+    if operation.request_body_schema:
+      add_body(operation.request_body_schema)
+    operation.body_fields = body_fields
+    return params, params_infos
 
   def generate_server(self):
     """
@@ -804,8 +1143,25 @@ class MCPGenerator:
       mcp_package=mcp_package,
       modules=self.tools_map.keys(),
       registrations=self.tools_map,
+      lazy_tools=self.lazy_tools,
       **file_header_kwargs)
-    self.run_ruff_lint(os.path.join(self.src_output_dir, 'server.py'))
+    self.queue_ruff_lint(os.path.join(self.src_output_dir, 'server.py'))
+
+  def generate_tools_manifest(self):
+    """
+    Generate the tool manifest that a server generated with `lazy_tools` registers from.
+
+    Built from the tool modules on disk, so it must run after they are enhanced and formatted.
+    Without `lazy_tools`, a manifest left by an earlier run is removed.
+    """
+    manifest_path = os.path.join(self.src_output_dir, MANIFEST_FILE_NAME)
+    if not self.lazy_tools:
+      if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+      return
+    logger.info("Generating tool manifest")
+    manifest = build_tools_manifest(os.path.join(self.src_output_dir, 'tools'), self.tools_map)
+    self._write_rendered(manifest_path, manifest_json(manifest))
 
   def generate_agent(self):
       logger.info("Generating agent wrapper")
@@ -824,13 +1180,10 @@ class MCPGenerator:
 
       # ------------------------- build SYSTEM prompt
       tool_docs = []
-      for path, ops in self.spec.get("paths", {}).items():
-          for method, op in ops.items():
-              if method.upper() not in {"GET", "POST", "PUT", "DELETE"}:
-                  continue
-              t_name = camel_to_snake(op.get("operationId") or f"{method}_{path.strip('/')}")
-              desc   = (op.get("description") or op.get("summary") or "").strip()
-              tool_docs.append(f"- {t_name}: {desc}")
+      for operation in self.ir.tool_operations():
+          t_name = camel_to_snake(operation.operation_id or f"{operation.method}_{operation.path.strip('/')}")
+          desc   = (operation.description or operation.summary).strip()
+          tool_docs.append(f"- {t_name}: {desc}")
 
       tools_text = "\n".join(tool_docs) if tool_docs else "<no tools>"
 
@@ -851,7 +1204,8 @@ class MCPGenerator:
           logger.info("Using system prompt from config.yaml")
       elif self.generate_system_prompt:
           try:
-              llm = LLMFactory().get_llm()
+              from langchain_core.messages import SystemMessage
+
               sys_req = SystemMessage(
                   content=(
                       f"Write the SYSTEM prompt for a {self.mcp_name} assistant that "
@@ -860,7 +1214,7 @@ class MCPGenerator:
                       "Keep the prompt concise and actionable."
                   )
               )
-              system_prompt = llm.invoke([sys_req]).content.strip()
+              system_prompt = self._get_llm_runner().invoke([sys_req]).content.strip()
               logger.info("Generated system prompt using LLM")
           except Exception as e:  # noqa: BLE001
               logger.warning("LLM failed to generate system prompt: %s – using stub.", e)
@@ -972,7 +1326,7 @@ class MCPGenerator:
               mcp_name=self.mcp_name,
               **file_header_kwargs,
           )
-          self.run_ruff_lint(os.path.join(agent_dir, "eval_mode.py"))
+          self.queue_ruff_lint(os.path.join(agent_dir, "eval_mode.py"))
 
       # Render .env.example for the agent
       logger.info("Rendering agent/.env.example")
@@ -983,7 +1337,7 @@ class MCPGenerator:
           **file_header_kwargs,
       )
       logger.info("Formatting agent/agent.py with Ruff")
-      self.run_ruff_lint(os.path.join(agent_dir, "agent.py"))
+      self.queue_ruff_lint(os.path.join(agent_dir, "agent.py"))
 
       # ---------------------------------------------------------------- pyproject.toml
       logger.info("Rendering agent/pyproject.toml")
@@ -1047,13 +1401,10 @@ class MCPGenerator:
               skill_examples.extend([f"'{example}'" for example in skill.get("examples", [])])
       else:
           # Fallback to extracting from OpenAPI spec (original behavior)
-          for path, ops in self.spec.get("paths", {}).items():
-              for method, op in ops.items():
-                  if method.upper() not in {"GET", "POST", "PUT", "DELETE"}:
-                      continue
-                  operation_desc = op.get("summary") or op.get("description", "")
-                  if operation_desc:
-                      skill_examples.append(f"'{operation_desc.strip()}'")
+          for operation in self.ir.tool_operations():
+              operation_desc = operation.summary or operation.description
+              if operation_desc:
+                  skill_examples.append(f"'{operation_desc.strip()}'")
 
           # Limit to reasonable number of examples
           skill_examples = skill_examples[:5]
@@ -1079,7 +1430,7 @@ Always provide clear, actionable responses and include relevant resource names,
       os.makedirs(proto_dir, exist_ok=True)
       logger.info("Rendering protocol_bindings/__init__.py")
       self.render_template("init_empty.tpl", os.path.join(proto_dir, "__init__.py"), **fh)
-      self.run_ruff_lint(os.path.join(proto_dir, "__init__.py"))
+      self.queue_ruff_lint(os.path.join(proto_dir, "__init__.py"))
 
       logger.info("Rendering a2a_server/__init__.py")
       self.render_template("init_empty.tpl", os.path.join(a2a_dir, "__init__.py"), **fh)
@@ -1115,7 +1466,7 @@ Always provide clear, actionable responses and include relevant resource names,
       # Ruff format
       for file in ["state.py", "helpers.py", "agent.py", "agent_executor.py", "__main__.py"]:
           logger.debug(f"Formatting {file} with Ruff")
-          self.run_ruff_lint(os.path.join(a2a_dir, file))
+          self.queue_ruff_lint(os.path.join(a2a_dir, file))
 
       logger.info("A2A server scaffolding generation completed")
 
@@ -1192,18 +1543,23 @@ Always provide clear, actionable responses and include relevant resource names,
       os.makedirs(path, exist_ok=True)
       self.render_template('init_empty.tpl', os.path.join(path, '__init__.py'), **file_header_kwargs)
 
-  def _resolve_ref(self, ref: str) -> Dict[str, Any]:
+  @property
+  def ref_resolver(self) -> RefResolver:
+      """
+      Memoizing resolver for the currently loaded spec, rebuilt whenever `self.spec` is replaced.
+      """
+      if self._ref_resolver is None or self._ref_resolver.spec is not self.spec:
+          self._ref_resolver = RefResolver(self.spec)
+      return self._ref_resolver
+
+  def _resolve_ref(self, ref: str, _seen: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
       """
       Resolve a JSON reference from the OpenAPI spec.
-      Assumes refs are of the form "#/components/schemas/ModelName".
+      Refs are local JSON pointers such as "#/components/schemas/ModelName".
+      If ref is already in `_seen` (a recursive schema), a placeholder object
+      schema is returned instead of the target.
       """
-      parts = ref.lstrip("#/").split("/")
-      resolved = self.spec
-      for part in parts:
-          resolved = resolved.get(part)
-          if resolved is None:
-              break
-      return resolved if resolved is not None else {}
+      return self.ref_resolver.resolve(ref, _seen)
 
   def _count_nested_params(self, schema: Dict[str, Any]) -> int:
       """
@@ -1221,6 +1577,10 @@ Always provide clear, actionable responses and include relevant resource names,
       if "$ref" in schema:
           schema = self._resolve_ref(schema["$ref"])
 
+      cached = self._param_count_cache.get(id(schema))
+      if cached is not None:
+          return cached[1]
+
       count = 0
       if schema.get("type") == "object" and "properties" in schema:
           properties = schema.get("properties", {})
@@ -1230,18 +1590,37 @@ Always provide clear, actionable responses and include relevant resource names,
                   # Recursively count nested properties
                   count += self._count_nested_params(prop)
 
+      self._param_count_cache[id(schema)] = (schema, count)
       return count
 
-  def _extract_body_params(self, schema: Dict[str, Any], prefix: str = "body", max_params: int = 10) -> list:
+  def _extract_body_params(self, schema: Dict[str, Any], prefix: str = "body", max_params: int = 10,
+                           _seen: FrozenSet[str] = frozenset()) -> list:
       """
       Recursively extract parameters from a request body schema.
       Each parameter name is prefixed so that nested properties are flattened.
       If schema has > max_params nested properties, returns a single Dict parameter.
+      `_seen` holds the references already being expanded so recursive schemas terminate.
+      Results are cached per (resolved schema, prefix), so a body schema shared by
+      many operations is flattened once per run.
       Returns a list of tuples: (signature_string, {name, type, description})
       """
       if "$ref" in schema:
-          schema = self._resolve_ref(schema["$ref"])
-
+          ref = schema["$ref"]
+          schema = self._resolve_ref(ref, _seen)
+          _seen = _seen | {ref}
+
+      key = (id(schema), prefix, max_params, _seen)
+      cached = self._body_params_cache.get(key)
+      if cached is None:
+          cached = (schema, self._flatten_body_schema(schema, prefix, max_params, _seen))
+          self._body_params_cache[key] = cached
+      return list(cached[1])
+
+  def _flatten_body_schema(self, schema: Dict[str, Any], prefix: str, max_params: int,
+                           _seen: FrozenSet[str]) -> list:
+      """
+      Flatten an already resolved body schema; see `_extract_body_params`.
+      """
       # Check if schema is too complex - use dict mode if so
       param_count = self._count_nested_params(schema)
       if param_count > max_params:
@@ -1284,9 +1663,7 @@ Always provide clear, actionable responses and include relevant resource names,
               # Otherwise, extract params normally
               merged: list[tuple[str, dict]] = []
               for subschema in schema[key]:
-                  if "$ref" in subschema:
-                      subschema = self._resolve_ref(subschema["$ref"])
-                  merged.extend(self._extract_body_params(subschema, prefix=prefix, max_params=max_params))
+                  merged.extend(self._extract_body_params(subschema, prefix=prefix, max_params=max_params, _seen=_seen))
               # Deduplicate identical signatures that may occur when the same
               # property appears in multiple branches
               seen: set[str] = set()
@@ -1305,14 +1682,16 @@ Always provide clear, actionable responses and include relevant resource names,
               # Improved from argocon-na-2025-b: single underscore for all nesting
               delim = "_"
               param_name = f"{prefix}{delim}{camel_to_snake(prop_name)}"
+              prop_seen = _seen
               if "$ref" in prop:
-                  resolved_prop = self._resolve_ref(prop["$ref"])
+                  prop_seen = _seen | {prop["$ref"]}
+                  resolved_prop = self._resolve_ref(prop["$ref"], _seen)
                   # Use single "_" for consistent parameter naming
                   # Improved from argocon-na-2025-b: single underscore for all nesting
                   delim = "_"
                   param_name = f"{prefix}{delim}{camel_to_snake(prop_name)}"
                   if resolved_prop.get("type") == "object" and "properties" in resolved_prop:
-                      sub_params = self._extract_body_params(resolved_prop, prefix=param_name)
+                      sub_params = self._extract_body_params(resolved_prop, prefix=param_name, _seen=prop_seen)
                       for sig, info in sub_params:
                           params.append(sig)
                           params_info.append(info)
@@ -1320,14 +1699,12 @@ Always provide clear, actionable responses and include relevant resource names,
                   else:
                       prop = resolved_prop
               if prop.get("type") == "object" and "properties" in prop:
-                  sub_params = self._extract_body_params(prop, prefix=param_name)
+                  sub_params = self._extract_body_params(prop, prefix=param_name, _seen=_seen)
                   for sig, info in sub_params:
                       params.append(sig)
                       params_info.append(info)
               else:
-                  if "$ref" in prop:
-                      prop = self._resolve_ref(prop["$ref"])
-                  py_type = self._get_python_type(prop)
+                  py_type = self._get_python_type(prop, prop_seen)
                   if prop_name in required_fields:
                       sig = f"{param_name}: {py_type}"
                   else:
@@ -1345,41 +1722,92 @@ Always provide clear, actionable responses and include relevant resource names,
           if items.get("type") == "object" and "properties" in items:
               py_type = "List[Dict[str, Any]]"
           else:
-              py_type = self._get_python_type(schema)
+              py_type = self._get_python_type(schema, _seen)
           sig = f"{prefix}: {py_type}"
           info = {"name": prefix, "type": py_type, "description": schema.get("description", "")}
           return [(sig, info)]
       else:
-          if "$ref" in schema:
-              schema = self._resolve_ref(schema["$ref"])
-          py_type = self._get_python_type(schema)
+          py_type = self._get_python_type(schema, _seen)
           sig = f"{prefix}: {py_type}"
           info = {"name": prefix, "type": py_type, "description": schema.get("description", "")}
           return [(sig, info)]
 
 
+  def _manifest_fingerprint(self) -> str:
+    """
+    Hash every generator input that is shared by all generated modules.
+
+    Returns:
+      str: Hash of the generator version, config, generation flags and templates.
+    """
+    return stable_hash({
+      "version": generator_version(),
+      "config": self.config,
+      "mcp_name": self.mcp_name,
+      "flags": [
+        self.should_enhance_docstring_with_llm,
+        self.should_enhance_docstring_with_llm_openapi,
+        self.generate_agent_flag,
+        self.generate_eval,
+        self.generate_system_prompt,
+        self.with_a2a_proxy,
+        self.enable_slim,
+        self.tool_mode,
+        self.lazy_tools,
+      ],
+      "templates": directory_hash(os.path.join(self.script_dir, 'templates')),
+    })
+
   def generate(self):
     """
     Generate all components based on the OpenAPI specification and templates.
+
+    Tool modules and models whose inputs are unchanged since the previous run,
+    according to the manifest in the output directory, are not regenerated.
     """
+    with profiling.phase("generate"):
+      self._generate()
+
+  def _generate(self):
     logger.info("Starting MCP code generation")
-    self.generate_api_client()
-    self.generate_model_base()
-    self.generate_models()
-    self.generate_tool_modules()
-    self.generate_server()
-    self.generate_pyproject()
+    phase = profiling.phase
+    with phase("manifest"):
+      self.manifest = GenerationManifest(self.output_dir, self._manifest_fingerprint())
+    with phase("api_client"):
+      self.generate_api_client()
+    with phase("models"):
+      self.generate_model_base()
+      self.generate_models()
+    with phase("tool_modules"):
+      self.generate_tool_modules()
+      self.close_render_pool()
+    with phase("server"):
+      self.generate_server()
+      self.generate_pyproject()
     if self.generate_agent_flag:
+      with phase("agent"):
         self.generate_agent()
-    self.generate_init_files()
-    if not self.generate_agent_flag:
-        self.generate_env()
+    with phase("package_files"):
+      self.generate_init_files()
+      if not self.generate_agent_flag:
+          self.generate_env()
+      if not self.generate_agent_flag:
+          self.generate_readme()
+      self.manifest.remove_stale_modules()
+    with phase("ruff"):
+      self.format_generated_files()
+    with phase("tools_manifest"):
+      self.generate_tools_manifest()
+      # Records the manifest in the format cache; nothing is queued for Ruff
+      self.formatter.flush(self.run_ruff_lint)
+    with phase("manifest"):
+      self.manifest.save()
     if not self.generate_agent_flag:
-        self.generate_readme()
         logger.info("MCP code generation completed")
 
         # Run function validation
-        self._run_function_validation()
+        with phase("validate"):
+          self._run_function_validation()
 
   def _run_function_validation(self):
     """Run function validation on the generated code."""
@@ -1392,9 +1820,9 @@ Always provide clear, actionable responses and include relevant resource names,
         project_root = Path(self.output_dir).parent.parent  # Go up to project root
         validator = FunctionValidator(project_root)
 
-        # Validate the current project
+        # Validate the current project; the tool function names are already known, so no file is parsed
         current_project_path = Path(self.src_output_dir)
-        result = validator.validate_project(current_project_path)
+        result = validator.validate_project(current_project_path, tool_functions=self.tools_map)
 
         if result.passed:
             logger.info("✅ Function validation passed!")
@@ -1440,7 +1868,7 @@ Always provide clear, actionable responses and include relevant resource names,
 
       # __init__.py
       self.render_template("init_empty.tpl", os.path.join(ws_dir, "__init__.py"), **fh)
-      self.run_ruff_lint(os.path.join(ws_dir, "__init__.py"))
+      self.queue_ruff_lint(os.path.join(ws_dir, "__init__.py"))
 
       # server.py
       self.render_template(
@@ -1449,7 +1877,7 @@ Always provide clear, actionable responses and include relevant resource names,
           mcp_name=self.mcp_name,
           **fh,
       )
-      self.run_ruff_lint(os.path.join(ws_dir, "server.py"))
+      self.queue_ruff_lint(os.path.join(ws_dir, "server.py"))
 
       # __main__.py
       self.render_template(
@@ -1458,6 +1886,6 @@ Always provide clear, actionable responses and include relevant resource names,
           mcp_name=self.mcp_name,
           **fh,
       )
-      self.run_ruff_lint(os.path.join(ws_dir, "__main__.py"))
+      self.queue_ruff_lint(os.path.join(ws_dir, "__main__.py"))
 
       logger.info("WebSocket proxy generation completed")
@@ -21,31 +21,35 @@ Usage:
 """
 
 import argparse
+import importlib.util
 import json
 import logging
-import tempfile
 from ruamel.yaml import YAML
 from pathlib import Path
 import sys
 import os
 import re
-from typing import Dict, Any, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from openapi_mcp_codegen import profiling
 from openapi_mcp_codegen.mcp_codegen import MCPGenerator
 from openapi_mcp_codegen.validators import OpenAPIValidator, load_spec_file
-from jinja2 import Environment, FileSystemLoader
-import jsonpath_ng
-from jsonpath_ng.ext import parse as jsonpath_parse
-
-try:
-    from cnoe_agent_utils import LLMFactory
-    from langchain_core.messages import SystemMessage
-    LLM_AVAILABLE = True
-except ImportError:
-    LLM_AVAILABLE = False
+from openapi_mcp_codegen.spec_loader import load_spec
+from openapi_mcp_codegen.ir import Operation, SpecIR
+from openapi_mcp_codegen.llm_cache import LLMCache, model_identifier
+from openapi_mcp_codegen.llm_client import LLMRunner, parse_json_object
+from openapi_mcp_codegen.rendering import get_template_env
+
+# The LLM stack takes seconds to import, so only check that it is installed
+# here and import it when LLM enhancement is actually used.
+LLM_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None
+    for module in ('cnoe_agent_utils', 'langchain_core')
+)
 
 # Configure logging
 logging.basicConfig(
@@ -54,6 +58,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger("openapi_enhancer")
 
+# Operations that receive overlay enhancements
+OVERLAY_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'options', 'head')
+
+# Appended to the user prompt when several operations are described in one request
+# (overridable with operation_description.batch_instructions in prompt.yaml)
+BATCH_DESCRIPTION_INSTRUCTIONS = """
+Describe each of the following API operations. Apply the rules above to every operation independently.
+Respond with ONLY a JSON object that maps each operation key (the text after "### ") to its description string.
+"""
+
 
 class OpenAPIOverlayGenerator:
     """
@@ -61,7 +75,8 @@ class OpenAPIOverlayGenerator:
     for better AI agent understanding and MCP server code generation.
     """
 
-    def __init__(self, spec_path: str, use_llm: bool = False, llm_config: Optional[Dict] = None, overlay_config: Optional[Dict] = None):
+    def __init__(self, spec_path: str, use_llm: bool = False, llm_config: Optional[Dict] = None, overlay_config: Optional[Dict] = None,
+                 use_llm_cache: bool = True, refresh_llm_cache: bool = False):
         """
         Initialize the overlay generator.
 
@@ -70,6 +85,8 @@ class OpenAPIOverlayGenerator:
             use_llm: Whether to use LLM for generating enhanced descriptions
             llm_config: Configuration for LLM (if use_llm is True)
             overlay_config: Configuration for overlay enhancements from config.yaml
+            use_llm_cache: Reuse LLM descriptions cached by earlier runs
+            refresh_llm_cache: Ignore cached LLM descriptions and replace them with new ones
         """
         self.spec_path = spec_path
         self.spec = self._load_spec()
@@ -84,12 +101,23 @@ class OpenAPIOverlayGenerator:
         self.add_param_guidance = self.overlay_config.get('add_parameter_guidance', True)
         self.agentic_focus = self.overlay_config.get('agentic_focus', True)
 
+        # LLM request concurrency, rate limit (requests/second, unset for none) and retries
+        self.llm_concurrency = self.overlay_config.get('llm_concurrency', 4)
+        self.llm_requests_per_second = self.overlay_config.get('llm_requests_per_second')
+        self.llm_max_retries = self.overlay_config.get('llm_max_retries', 3)
+
+        # Operations per LLM request (1 disables batching) and user prompt token budget per batch
+        self.llm_batch_size = self.overlay_config.get('llm_batch_size', 1)
+        self.llm_batch_token_budget = self.overlay_config.get('llm_batch_token_budget', 6000)
+
         # Determine if LLM should be used - prefer LLM when available
         use_llm_from_config = self.overlay_config.get('use_llm', True)  # Default to True
         self.use_llm = (use_llm or use_llm_from_config) and LLM_AVAILABLE
         self.llm_config = llm_config or {}
         self.overlay_actions = []
         self.llm = None
+        self._llm_runner = None
+        self.llm_cache = None
 
         if self.use_llm:
             if not LLM_AVAILABLE:
@@ -97,20 +125,35 @@ class OpenAPIOverlayGenerator:
                 self.use_llm = False
             else:
                 try:
+                    from cnoe_agent_utils import LLMFactory
+
                     self.llm = LLMFactory().get_llm()
                     logger.info("LLM initialized for enhanced description generation")
                 except Exception as e:
                     logger.warning(f"Failed to initialize LLM: {e}, falling back to rule-based generation")
                     self.use_llm = False
 
+        if self.use_llm and use_llm_cache and self.overlay_config.get('llm_cache', True):
+            self.llm_cache = LLMCache(
+                max_entries=self.overlay_config.get('llm_cache_max_entries', 10000),
+                max_age_days=self.overlay_config.get('llm_cache_max_age_days', 30),
+                refresh=refresh_llm_cache,
+            )
+
     def _load_spec(self) -> Dict[str, Any]:
-        """Load the OpenAPI specification from file."""
-        with open(self.spec_path, 'r') as f:
-            if self.spec_path.endswith('.json'):
-                return json.load(f)
-            else:
-                yaml = YAML(typ='safe', pure=True)
-                return yaml.load(f)
+        """Load the OpenAPI specification from file (shared, read-only)."""
+        return load_spec(self.spec_path)
+
+    def _get_llm_runner(self) -> LLMRunner:
+        """Return the runner that issues LLM requests, rebuilt if ``self.llm`` was replaced."""
+        if self._llm_runner is None or self._llm_runner.llm is not self.llm:
+            self._llm_runner = LLMRunner(
+                self.llm,
+                max_concurrency=self.llm_concurrency,
+                requests_per_second=self.llm_requests_per_second,
+                max_retries=self.llm_max_retries,
+            )
+        return self._llm_runner
 
     def _load_prompts(self) -> Dict[str, Any]:
         """Load prompt templates from prompt.yaml"""
@@ -173,6 +216,59 @@ class OpenAPIOverlayGenerator:
 
         return summary or f"Perform {method.upper()} operation on {path}"
 
+    def _render_description_prompts(self, method: str, path: str, operation: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        Render the system and user prompts for an operation description from prompt.yaml.
+
+        Returns:
+            (system_prompt, user_prompt), or None if the prompts are not loaded
+        """
+        # Get prompts from declarative configuration
+        op_desc_prompts = self.prompts.get('operation_description', {})
+        system_prompt = op_desc_prompts.get('system_prompt', '')
+        user_template = op_desc_prompts.get('user_prompt_template', '')
+
+        # Fallback to default if prompts not loaded
+        if not system_prompt:
+            logger.warning("No system prompt loaded from prompt.yaml, using fallback")
+            return None
+
+        # Extract operation details
+        original_desc = operation.get('description', '')
+        summary = operation.get('summary', '')
+        operation_id = operation.get('operationId', '')
+        parameters = operation.get('parameters', [])
+        has_body = 'requestBody' in operation
+
+        # Separate path and query parameters
+        path_params = [p.get('name') for p in parameters if p.get('in') == 'path']
+        query_params = [p.get('name') for p in parameters if p.get('in') == 'query']
+
+        # Format user prompt with template variables
+        user_prompt = user_template.format(
+            method=method.upper(),
+            path=path,
+            operation_id=operation_id or 'None',
+            summary=summary or 'None',
+            description=original_desc[:200] if original_desc else 'None',
+            path_params=', '.join(path_params) if path_params else 'None',
+            query_params=', '.join(query_params) if query_params else 'None',
+            has_body='Yes' if has_body else 'No'
+        )
+        return system_prompt.strip(), user_prompt.strip()
+
+    def _description_cache_key(self, system_prompt: str, user_prompt: str) -> Optional[str]:
+        if self.llm_cache is None:
+            return None
+        return LLMCache.make_key(model_identifier(self.llm), system_prompt, user_prompt)
+
+    def _track_tokens(self, response, validator: Optional['OpenAPIValidator']) -> None:
+        # Track token usage if validator is provided
+        if validator:
+            input_tokens, output_tokens = validator.extract_token_usage(response)
+            validator.add_generation_tokens(input_tokens, output_tokens)
+            logger.debug(f"LLM tokens used: {input_tokens} input, {output_tokens} output")
+
     def _create_enhanced_description_with_llm(self, method: str, path: str, operation: Dict[str, Any], validator: Optional['OpenAPIValidator'] = None) -> str:
         """
         Create an enhanced description using LLM with declarative prompts from prompt.yaml.
@@ -189,50 +285,30 @@ class OpenAPIOverlayGenerator:
             return self._create_enhanced_description(method, path, operation)
 
         try:
-            # Get prompts from declarative configuration
-            op_desc_prompts = self.prompts.get('operation_description', {})
-            system_prompt = op_desc_prompts.get('system_prompt', '')
-            user_template = op_desc_prompts.get('user_prompt_template', '')
-
-            # Fallback to default if prompts not loaded
-            if not system_prompt:
-                logger.warning("No system prompt loaded from prompt.yaml, using fallback")
+            prompts = self._render_description_prompts(method, path, operation)
+            if prompts is None:
                 return self._create_enhanced_description(method, path, operation)
+            system_prompt, user_prompt = prompts
 
-            # Extract operation details
-            original_desc = operation.get('description', '')
-            summary = operation.get('summary', '')
-            operation_id = operation.get('operationId', '')
-            parameters = operation.get('parameters', [])
-            has_body = 'requestBody' in operation
-
-            # Separate path and query parameters
-            path_params = [p.get('name') for p in parameters if p.get('in') == 'path']
-            query_params = [p.get('name') for p in parameters if p.get('in') == 'query']
-
-            # Format user prompt with template variables
-            user_prompt = user_template.format(
-                method=method.upper(),
-                path=path,
-                operation_id=operation_id or 'None',
-                summary=summary or 'None',
-                description=original_desc[:200] if original_desc else 'None',
-                path_params=', '.join(path_params) if path_params else 'None',
-                query_params=', '.join(query_params) if query_params else 'None',
-                has_body='Yes' if has_body else 'No'
-            )
+            # Reuse the description from an earlier run if prompts and model are unchanged
+            cache_key = self._description_cache_key(system_prompt, user_prompt)
+            if cache_key is not None:
+                cached_desc = self.llm_cache.get(cache_key)
+                if cached_desc is not None:
+                    logger.debug(f"Cached LLM description for {method.upper()} {path}")
+                    return cached_desc
 
             # Call LLM
-            system_msg = SystemMessage(content=system_prompt.strip())
-            user_msg = SystemMessage(content=user_prompt.strip())
-            response = self.llm.invoke([system_msg, user_msg])
+            from langchain_core.messages import SystemMessage
+
+            system_msg = SystemMessage(content=system_prompt)
+            user_msg = SystemMessage(content=user_prompt)
+            response = self._get_llm_runner().invoke([system_msg, user_msg])
             enhanced_desc = response.content.strip()
+            if cache_key is not None:
+                self.llm_cache.put(cache_key, enhanced_desc)
 
-            # Track token usage if validator is provided
-            if validator:
-                input_tokens, output_tokens = validator.extract_token_usage(response)
-                validator.add_generation_tokens(input_tokens, output_tokens)
-                logger.debug(f"LLM tokens used: {input_tokens} input, {output_tokens} output")
+            self._track_tokens(response, validator)
 
             # Note: We preserve full LLM-enhanced descriptions for AI agents
             # No truncation - AI agents need complete context
@@ -244,6 +320,99 @@ class OpenAPIOverlayGenerator:
             logger.warning(f"LLM enhancement failed for {method} {path}: {e}, falling back to rule-based")
             return self._create_enhanced_description(method, path, operation)
 
+    def _batch_description_operations(self, operations: List[Operation]) -> List[List[Operation]]:
+        """
+        Split operations into batches of at most ``llm_batch_size`` operations whose
+        user prompts fit in ``llm_batch_token_budget`` (estimated at 4 characters per token).
+        """
+        has_prompts = bool(self.prompts.get('operation_description', {}).get('system_prompt'))
+        batches, current, current_tokens = [], [], 0
+        for op in operations:
+            tokens = 0
+            if has_prompts:
+                try:
+                    tokens = len(self._render_description_prompts(op.method, op.path, op.raw)[1]) // 4
+                except (KeyError, IndexError, ValueError):
+                    pass
+            if current and (len(current) >= self.llm_batch_size or current_tokens + tokens > self.llm_batch_token_budget):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(op)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _parse_batch_response(content: str) -> Dict[str, Any]:
+        """Parse a batched JSON response, tolerating a Markdown code fence around it."""
+        return parse_json_object(content)
+
+    def _create_enhanced_descriptions_batch_with_llm(self, operations: List[Operation], validator: Optional['OpenAPIValidator'] = None) -> List[str]:
+        """
+        Create enhanced descriptions for several operations with one LLM request.
+
+        The system prompt is sent once, followed by the user prompt of every operation
+        that is not cached yet. The LLM answers with a JSON object mapping each
+        operation key (``"METHOD /path"``) to its description. Operations missing from a
+        malformed or partial response fall back to one request per operation.
+
+        Args:
+            operations: Operations to describe
+            validator: Validator that tracks token usage
+
+        Returns:
+            One description per operation, in the order of ``operations``
+        """
+        if not self.llm or len(operations) == 1:
+            return [self._create_enhanced_description_with_llm(op.method, op.path, op.raw, validator) for op in operations]
+
+        descriptions: List[Optional[str]] = [None] * len(operations)
+        pending = {}
+        system_prompt = ''
+        try:
+            for idx, op in enumerate(operations):
+                prompts = self._render_description_prompts(op.method, op.path, op.raw)
+                if prompts is None:
+                    break
+                system_prompt, user_prompt = prompts
+                cache_key = self._description_cache_key(system_prompt, user_prompt)
+                cached_desc = self.llm_cache.get(cache_key) if cache_key is not None else None
+                if cached_desc is not None:
+                    descriptions[idx] = cached_desc
+                else:
+                    pending[f"{op.http_method} {op.path}"] = (idx, user_prompt, cache_key)
+
+            if len(pending) > 1:
+                from langchain_core.messages import SystemMessage
+
+                batch_instructions = self.prompts.get('operation_description', {}).get(
+                    'batch_instructions', BATCH_DESCRIPTION_INSTRUCTIONS)
+                user_prompt = '\n\n'.join(
+                    [batch_instructions.strip()]
+                    + [f"### {key}\n{prompt}" for key, (_, prompt, _) in pending.items()]
+                )
+                response = self._get_llm_runner().invoke(
+                    [SystemMessage(content=system_prompt), SystemMessage(content=user_prompt)]
+                )
+                self._track_tokens(response, validator)
+                for key, value in self._parse_batch_response(response.content).items():
+                    if key not in pending or not isinstance(value, str) or not value.strip():
+                        continue
+                    idx, _, cache_key = pending.pop(key)
+                    descriptions[idx] = value.strip()
+                    if cache_key is not None:
+                        self.llm_cache.put(cache_key, descriptions[idx])
+                logger.debug(f"Batched LLM request described {len(operations) - len(pending)} of {len(operations)} operations")
+        except Exception as e:
+            logger.warning(f"Batched LLM enhancement failed: {e}, falling back to one request per operation")
+
+        # Fall back per operation for anything the batch did not answer
+        for idx, op in enumerate(operations):
+            if descriptions[idx] is None:
+                descriptions[idx] = self._create_enhanced_description_with_llm(op.method, op.path, op.raw, validator)
+        return descriptions
+
     def _create_enhanced_description(self, method: str, path: str, operation: Dict[str, Any]) -> str:
         """
         Create an enhanced, agent-friendly description for an API operation (rule-based fallback).
@@ -411,93 +580,164 @@ class OpenAPIOverlayGenerator:
         }
 
         # Process all paths and operations
-        paths = self.spec.get('paths', {})
-        operations_count = 0
-
-        for path, path_item in paths.items():
-            for method in ['get', 'post', 'put', 'patch', 'delete', 'options', 'head']:
-                if method not in path_item:
-                    continue
+        overlay_operations = [op for op in SpecIR(self.spec).operations if op.method in OVERLAY_METHODS]
+        operations_count = len(overlay_operations)
+
+        # Enhance operation descriptions. LLM requests run concurrently; results
+        # come back in spec order so the actions do not depend on completion order.
+        if self.use_llm and self.llm_batch_size > 1:
+            batches = self._batch_description_operations(overlay_operations)
+            logger.info(f"Describing {operations_count} operations in {len(batches)} batched LLM requests")
+            descriptions = [
+                desc
+                for batch_descs in self._get_llm_runner().map(
+                    lambda batch: self._create_enhanced_descriptions_batch_with_llm(batch, validator), batches
+                )
+                for desc in batch_descs
+            ]
+        elif self.use_llm:
+            descriptions = self._get_llm_runner().map(
+                lambda op: self._create_enhanced_description_with_llm(op.method, op.path, op.raw, validator),
+                overlay_operations,
+            )
+        else:
+            descriptions = [
+                self._create_enhanced_description(op.method, op.path, op.raw) for op in overlay_operations
+            ]
 
-                operation = path_item[method]
-                operations_count += 1
+        for spec_operation, enhanced_desc in zip(overlay_operations, descriptions):
+            path, method, operation = spec_operation.path, spec_operation.method, spec_operation.raw
 
-                # Enhance operation description
-                if self.use_llm:
-                    enhanced_desc = self._create_enhanced_description_with_llm(method, path, operation, validator)
-                else:
-                    enhanced_desc = self._create_enhanced_description(method, path, operation)
+            overlay['actions'].append({
+                'target': f"$.paths['{path}'].{method}.description",
+                'update': enhanced_desc
+            })
 
+            # Enhance operation summary if missing or too brief
+            summary = operation.get('summary', '')
+            if not summary or len(summary) < 20:
+                purpose = self._get_operation_purpose(method, path, operation)
                 overlay['actions'].append({
-                    'target': f"$.paths['{path}'].{method}.description",
-                    'update': enhanced_desc
+                    'target': f"$.paths['{path}'].{method}.summary",
+                    'update': purpose
                 })
 
-                # Enhance operation summary if missing or too brief
-                summary = operation.get('summary', '')
-                if not summary or len(summary) < 20:
-                    purpose = self._get_operation_purpose(method, path, operation)
-                    overlay['actions'].append({
-                        'target': f"$.paths['{path}'].{method}.summary",
-                        'update': purpose
-                    })
-
-                # Enhance parameter descriptions for AI agents
-                parameters = operation.get('parameters', [])
-                for idx, param in enumerate(parameters):
-                    if '$ref' in param:
-                        continue  # Skip refs for now
-
-                    enhanced_param_desc = self._enhance_parameter_description(param)
-                    overlay['actions'].append({
-                        'target': f"$.paths['{path}'].{method}.parameters[{idx}].description",
-                        'update': enhanced_param_desc
-                    })
+            # Enhance parameter descriptions for AI agents
+            parameters = operation.get('parameters', [])
+            for idx, param in enumerate(parameters):
+                if '$ref' in param:
+                    continue  # Skip refs for now
+
+                enhanced_param_desc = self._enhance_parameter_description(param)
+                overlay['actions'].append({
+                    'target': f"$.paths['{path}'].{method}.parameters[{idx}].description",
+                    'update': enhanced_param_desc
+                })
 
         # Update validator metrics if provided
         if validator:
             validator.metrics.operations_processed = operations_count
             validator.metrics.overlay_actions_applied = len(overlay['actions'])
 
+        if self.llm_cache is not None and self.use_llm:
+            logger.info(f"LLM description cache: {self.llm_cache.hits} hits, {self.llm_cache.misses} misses")
+            profiler = profiling.active_profiler()
+            if profiler is not None:
+                profiler.record_cache("descriptions", self.llm_cache.hits, self.llm_cache.misses)
+
         logger.info(f"Generated {len(overlay['actions'])} overlay actions")
         return overlay
 
 
+# One segment of a simple overlay target: .name, ['key'], ["key"] or [index]
+_TARGET_SEGMENT_RE = re.compile(
+    r"""\.(?P<name>[A-Za-z0-9_$\-]+)|\['(?P<sq>[^']*)'\]|\["(?P<dq>[^"]*)"\]|\[(?P<index>\d+)\]"""
+)
+
+TargetPart = Union[str, int]
+
+
+@lru_cache(maxsize=4096)
+def parse_simple_target(target: str) -> Optional[Tuple[TargetPart, ...]]:
+    """
+    Parse a JSONPath target made only of child names, quoted keys and array indices.
+
+    These are the targets the overlay generator emits, e.g.
+    ``$.paths['/pets/{id}'].get.parameters[0].description``.
+
+    Returns:
+        Path parts (``str`` keys, ``int`` list indices), or None if the target
+        uses wildcards, filters, recursive descent or other JSONPath features
+    """
+    if not target.startswith('$'):
+        return None
+    parts: List[TargetPart] = []
+    pos = 1
+    while pos < len(target):
+        m = _TARGET_SEGMENT_RE.match(target, pos)
+        if m is None:
+            return None
+        if m.group('index') is not None:
+            parts.append(int(m.group('index')))
+        else:
+            parts.append(next(g for g in (m.group('name'), m.group('sq'), m.group('dq')) if g is not None))
+        pos = m.end()
+    return tuple(parts)
+
+
+@lru_cache(maxsize=1024)
+def _compile_jsonpath(target: str):
+    from jsonpath_ng.ext import parse as jsonpath_parse
+
+    return jsonpath_parse(target)
+
+
+def _jsonpath_parts(path) -> List[TargetPart]:
+    """Convert the ``full_path`` of a jsonpath-ng match into path parts."""
+    from jsonpath_ng import Child, Fields, Index
+
+    if isinstance(path, Child):
+        return _jsonpath_parts(path.left) + _jsonpath_parts(path.right)
+    if isinstance(path, Fields):
+        return list(path.fields)
+    if isinstance(path, Index):
+        return [path.index]
+    return []  # Root / This
+
+
 class OverlayApplier:
     """
     Applies OpenAPI Overlay specifications to OpenAPI documents.
     Implements the Overlay Specification 1.0.0.
     """
 
-    def __init__(self, openapi_path: str, overlay_path: str):
+    def __init__(self, openapi_path: Optional[str], overlay_path: Optional[str],
+                 openapi: Optional[Dict[str, Any]] = None, overlay: Optional[Dict[str, Any]] = None):
         """
         Initialize the overlay applier.
 
         Args:
             openapi_path: Path to the OpenAPI specification file
             overlay_path: Path to the overlay specification file
+            openapi: OpenAPI document to modify in place instead of loading openapi_path
+            overlay: Overlay document to apply instead of loading overlay_path
         """
         self.openapi_path = openapi_path
         self.overlay_path = overlay_path
-        self.openapi = self._load_file(openapi_path)
-        self.overlay = self._load_file(overlay_path)
+        self.openapi = openapi if openapi is not None else self._load_file(openapi_path)
+        self.overlay = overlay if overlay is not None else self._load_file(overlay_path)
 
     def _load_file(self, path: str) -> Dict[str, Any]:
-        """Load a YAML or JSON file."""
-        with open(path, 'r') as f:
-            if path.endswith('.json'):
-                return json.load(f)
-            else:
-                yaml = YAML(typ='safe', pure=True)
-                return yaml.load(f)
+        """Load a YAML or JSON file as a private copy, since overlays modify it in place."""
+        return load_spec(path, copy=True)
 
-    def _set_nested_value(self, obj: Any, path_parts: List[str], value: Any) -> None:
+    def _set_nested_value(self, obj: Any, path_parts: List[TargetPart], value: Any) -> None:
         """
-        Set a nested value in a dictionary/list structure.
+        Set a nested value in a dictionary/list structure, creating missing containers.
 
         Args:
             obj: The object to modify
-            path_parts: List of path components
+            path_parts: List of path components (``int`` parts index into lists)
             value: The value to set
         """
         if not path_parts:
@@ -506,31 +746,37 @@ class OverlayApplier:
         current = obj
         for i, part in enumerate(path_parts[:-1]):
             # Handle array index
-            if part.isdigit():
+            if isinstance(current, list):
                 idx = int(part)
-                if isinstance(current, list):
-                    while len(current) <= idx:
-                        current.append({})
-                    current = current[idx]
+                while len(current) <= idx:
+                    current.append({})
+                current = current[idx]
             else:
                 # Handle dictionary key
                 if part not in current:
                     # Determine if next part is an array index
-                    next_part = path_parts[i + 1]
-                    current[part] = [] if next_part.isdigit() else {}
+                    current[part] = [] if isinstance(path_parts[i + 1], int) else {}
                 current = current[part]
 
         # Set the final value
         last_part = path_parts[-1]
-        if last_part.isdigit():
+        if isinstance(current, list):
             idx = int(last_part)
-            if isinstance(current, list):
-                while len(current) <= idx:
-                    current.append(None)
-                current[idx] = value
+            while len(current) <= idx:
+                current.append(None)
+            current[idx] = value
         else:
             current[last_part] = value
 
+    @staticmethod
+    def _split_target(target: str) -> List[TargetPart]:
+        """Split a target into path parts without evaluating it (used to create missing paths)."""
+        parts = parse_simple_target(target)
+        if parts is not None:
+            return list(parts)
+        simple_path = target.replace('$.', '').replace('[', '.').replace(']', '').replace("'", "").replace('"', '')
+        return [p for p in simple_path.split('.') if p]
+
     def _parse_jsonpath_target(self, target: str) -> List[tuple]:
         """
         Parse a JSONPath target and return matching paths.
@@ -543,38 +789,12 @@ class OverlayApplier:
         """
         try:
             # Use jsonpath-ng for more complex expressions
-            expr = jsonpath_parse(target)
-            matches = expr.find(self.openapi)
-            results = []
-
-            for match in matches:
-                # Convert the path to a list of parts
-                path_str = str(match.full_path)
-                # Parse the path string into components
-                parts = []
-                for component in path_str.split('.'):
-                    # Handle array indices
-                    if '[' in component and ']' in component:
-                        key = component.split('[')[0]
-                        if key:
-                            parts.append(key)
-                        # Extract indices
-                        indices = component.split('[')[1:]
-                        for idx_str in indices:
-                            idx = idx_str.rstrip(']').strip('"').strip("'")
-                            parts.append(idx)
-                    else:
-                        parts.append(component)
-
-                results.append((parts, match.value))
-
-            return results
+            expr = _compile_jsonpath(target)
+            return [(_jsonpath_parts(match.full_path), match.value) for match in expr.find(self.openapi)]
         except Exception as e:
             logger.warning(f"Failed to parse JSONPath '{target}': {e}")
             # Fallback to simple path parsing
-            simple_path = target.replace('$.', '').replace('[', '.').replace(']', '').replace("'", "").replace('"', '')
-            parts = [p for p in simple_path.split('.') if p]
-            return [(parts, None)]
+            return [(self._split_target(target), None)]
 
     def apply_action(self, action: Dict[str, Any]) -> None:
         """
@@ -591,19 +811,25 @@ class OverlayApplier:
         # Handle update action
         if 'update' in action:
             update_value = action['update']
+
+            # Plain child/index targets (everything the overlay generator emits)
+            # are applied by direct indexing instead of evaluating JSONPath
+            simple_parts = parse_simple_target(target)
+            if simple_parts is not None:
+                self._set_nested_value(self.openapi, list(simple_parts), update_value)
+                return
+
             matches = self._parse_jsonpath_target(target)
 
             if matches:
                 # Update existing paths
                 for path_parts, current_value in matches:
-                    logger.debug(f"Updating {'.'.join(path_parts)} with new value")
+                    logger.debug("Updating %s with new value", '.'.join(map(str, path_parts)))
                     self._set_nested_value(self.openapi, path_parts, update_value)
             else:
                 # Path doesn't exist, create it
-                # Parse the target as a simple path
-                simple_path = target.replace('$.', '').replace('[', '.').replace(']', '').replace("'", "").replace('"', '')
-                parts = [p for p in simple_path.split('.') if p]
-                logger.debug(f"Creating new path {'.'.join(parts)} with value")
+                parts = self._split_target(target)
+                logger.debug("Creating new path %s with value", '.'.join(map(str, parts)))
                 self._set_nested_value(self.openapi, parts, update_value)
 
     def apply_overlay(self) -> Dict[str, Any]:
@@ -636,16 +862,21 @@ class OpenAPIEnhancer:
     Combines overlay generation, application, and MCP code generation.
     """
 
-    def __init__(self, spec_path: str, config_path: Optional[str] = None):
+    def __init__(self, spec_path: str, config_path: Optional[str] = None,
+                 use_llm_cache: bool = True, refresh_llm_cache: bool = False):
         """
         Initialize the OpenAPI enhancer.
 
         Args:
             spec_path: Path to the OpenAPI specification file
             config_path: Path to configuration file (optional)
+            use_llm_cache: Reuse LLM descriptions cached by earlier runs
+            refresh_llm_cache: Ignore cached LLM descriptions and replace them with new ones
         """
         self.spec_path = spec_path
         self.config_path = config_path
+        self.use_llm_cache = use_llm_cache
+        self.refresh_llm_cache = refresh_llm_cache
         self.config = self._load_config() if config_path else {}
         self.validator = OpenAPIValidator()
 
@@ -661,7 +892,26 @@ class OpenAPIEnhancer:
 
     def _fix_openapi_parameters(self, spec_path: str) -> int:
         """
-        Fix OpenAPI parameters that are missing schema or content fields.
+        Fix OpenAPI parameters in a specification file, rewriting it if anything changed.
+
+        See :meth:`_fix_openapi_parameters_in_spec`.
+
+        Args:
+            spec_path: Path to the OpenAPI specification file to fix
+
+        Returns:
+            Number of parameters that were fixed
+        """
+        spec = load_spec(spec_path, copy=True)
+        total_fixes = self._fix_openapi_parameters_in_spec(spec)
+        if total_fixes > 0:
+            with open(spec_path, 'w', encoding='utf-8') as f:
+                json.dump(spec, f, indent=2)
+        return total_fixes
+
+    def _fix_openapi_parameters_in_spec(self, spec: Dict[str, Any]) -> int:
+        """
+        Fix OpenAPI parameters that are missing schema or content fields, in place.
 
         According to OpenAPI 3.x spec, parameters must have either a 'schema' or
         'content' field to define their type. This function adds default schemas
@@ -673,16 +923,12 @@ class OpenAPIEnhancer:
         Additionally, converts Swagger 2.0 specs to OpenAPI 3.x format.
 
         Args:
-            spec_path: Path to the OpenAPI specification file to fix
+            spec: OpenAPI specification to fix (modified in place)
 
         Returns:
             Number of parameters that were fixed
         """
         try:
-            # Load the OpenAPI spec
-            with open(spec_path, 'r', encoding='utf-8') as f:
-                spec = json.load(f)
-
             # Check if this is a Swagger 2.0 spec and convert to OpenAPI 3.x
             if 'swagger' in spec and spec.get('swagger') == '2.0':
                 logger.info("Detected Swagger 2.0 spec, converting to OpenAPI 3.0")
@@ -747,11 +993,8 @@ class OpenAPIEnhancer:
                                     fixed_count += 1
                                     logger.debug(f"Fixed parameter '{param.get('name')}' in {method.upper()} {path}")
 
-            # Save the fixed spec
             total_fixes = fixed_count + removed_body_params
             if total_fixes > 0:
-                with open(spec_path, 'w', encoding='utf-8') as f:
-                    json.dump(spec, f, indent=2)
                 if fixed_count > 0:
                     logger.info(f"Fixed {fixed_count} parameters missing schema definitions")
                 if removed_body_params > 0:
@@ -776,7 +1019,7 @@ class OpenAPIEnhancer:
 
             # Get template directory
             template_dir = Path(__file__).parent / 'templates'
-            env = Environment(loader=FileSystemLoader(str(template_dir)))
+            env = get_template_env(str(template_dir))
 
             # Load template
             template = env.get_template('example_makefile.tpl')
@@ -800,13 +1043,15 @@ class OpenAPIEnhancer:
             logger.warning(f"Failed to generate Makefile: {e}")
             # Don't fail the whole process if Makefile generation fails
 
-    def _generate_agentgateway_config(self, enhanced_spec_path: str, output_dir: str):
+    def _generate_agentgateway_config(self, enhanced_spec_path: str, output_dir: str,
+                                      enhanced_spec: Optional[Dict[str, Any]] = None):
         """
         Generate agent gateway configuration YAML file.
 
         Args:
             enhanced_spec_path: Path to the enhanced OpenAPI specification
             output_dir: Directory where MCP server code was generated
+            enhanced_spec: Enhanced specification, if already in memory
         """
         try:
             spec_dir = Path(self.spec_path).parent
@@ -816,13 +1061,7 @@ class OpenAPIEnhancer:
             # Determine the host from the enhanced spec
             host = "localhost:8080"  # Default
             try:
-                yaml_loader = YAML(typ='safe', pure=True)
-                with open(enhanced_spec_path, 'r') as f:
-                    if enhanced_spec_path.endswith('.json'):
-                        import json
-                        spec_data = json.load(f)
-                    else:
-                        spec_data = yaml_loader.load(f)
+                spec_data = enhanced_spec if enhanced_spec is not None else load_spec(enhanced_spec_path)
 
                 # Extract host from servers or fallback to info
                 if 'servers' in spec_data and spec_data['servers']:
@@ -901,10 +1140,13 @@ class OpenAPIEnhancer:
         try:
             # Initialize validation session
             self.validator.start_validation_session(self.spec_path)
-            original_spec = load_spec_file(self.spec_path)
+            with profiling.phase("parse"):
+                original_spec = load_spec_file(self.spec_path)
 
-            enhanced_spec_path = self.spec_path
-            overlay_path = None
+            # The stages below pass one in-memory document along; files are only
+            # written for --save-overlay / --save-enhanced-spec
+            enhanced_spec_path = save_enhanced_spec or self.spec_path
+            enhanced_spec = None
 
             # Step 1: Generate overlay (unless skipped)
             if not skip_overlay:
@@ -918,31 +1160,23 @@ class OpenAPIEnhancer:
 
                 generator = OpenAPIOverlayGenerator(
                     spec_path=self.spec_path,
-                    overlay_config=overlay_config
+                    overlay_config=overlay_config,
+                    use_llm_cache=self.use_llm_cache,
+                    refresh_llm_cache=self.refresh_llm_cache
                 )
 
-                # Save overlay to specified path or temporary file
+                with profiling.phase("overlay"):
+                    overlay = generator.generate_overlay(self.validator)
                 if save_overlay:
-                    overlay_path = save_overlay
+                    with open(save_overlay, 'w') as f:
+                        if format == 'json':
+                            json.dump(overlay, f, indent=2)
+                        else:
+                            yaml = YAML()
+                            yaml.dump(overlay, f)
+                    print(f"✓ Generated overlay: {save_overlay}")
                 else:
-                    # Create temporary overlay file
-                    temp_overlay = tempfile.NamedTemporaryFile(
-                        mode='w',
-                        suffix='.yaml',
-                        delete=False
-                    )
-                    overlay_path = temp_overlay.name
-                    temp_overlay.close()
-
-                overlay = generator.generate_overlay(self.validator)
-                with open(overlay_path, 'w') as f:
-                    if format == 'json':
-                        json.dump(overlay, f, indent=2)
-                    else:
-                        yaml = YAML()
-                        yaml.dump(overlay, f)
-
-                print(f"✓ Generated overlay: {overlay_path}")
+                    print(f"✓ Generated overlay with {len(overlay['actions'])} actions")
 
                 # Step 2: Apply overlay
                 logger.info("")
@@ -950,26 +1184,10 @@ class OpenAPIEnhancer:
                 logger.info("STEP 2: Applying Overlay to OpenAPI Spec")
                 logger.info("=" * 70)
 
-                # Save enhanced spec to specified path or temporary file
-                if save_enhanced_spec:
-                    enhanced_spec_path = save_enhanced_spec
-                else:
-                    # Create temporary enhanced spec file
-                    temp_spec = tempfile.NamedTemporaryFile(
-                        mode='w',
-                        suffix='.json',
-                        delete=False
-                    )
-                    enhanced_spec_path = temp_spec.name
-                    temp_spec.close()
-
-                applier = OverlayApplier(self.spec_path, overlay_path)
-                enhanced_spec = applier.apply_overlay()
-
-                with open(enhanced_spec_path, 'w') as f:
-                    json.dump(enhanced_spec, f, indent=2)
-
-                print(f"✓ Applied overlay, enhanced spec: {enhanced_spec_path}")
+                applier = OverlayApplier(self.spec_path, None, overlay=overlay)
+                with profiling.phase("apply"):
+                    enhanced_spec = applier.apply_overlay()
+                print("✓ Applied overlay")
 
                 # Fix OpenAPI parameters that may be missing schema definitions
                 logger.info("")
@@ -977,15 +1195,17 @@ class OpenAPIEnhancer:
                 logger.info("STEP 2.1: Validating and Fixing OpenAPI Parameters")
                 logger.info("=" * 70)
 
-                fixed_count = self._fix_openapi_parameters(enhanced_spec_path)
+                with profiling.phase("fix"):
+                    fixed_count = self._fix_openapi_parameters_in_spec(enhanced_spec)
                 if fixed_count > 0:
                     print(f"✓ Fixed {fixed_count} parameters with missing schema definitions")
                 else:
                     print(f"✓ All parameters are valid")
 
-                # Clean up temporary overlay if not saved
-                if not save_overlay:
-                    Path(overlay_path).unlink(missing_ok=True)
+                if save_enhanced_spec:
+                    with open(save_enhanced_spec, 'w') as f:
+                        json.dump(enhanced_spec, f, indent=2)
+                    print(f"✓ Saved enhanced spec: {save_enhanced_spec}")
 
                 # Step 2.2: Run ADR-005 Compliance Validation
                 logger.info("")
@@ -993,14 +1213,14 @@ class OpenAPIEnhancer:
                 logger.info("STEP 2.2: ADR-005 Compliance Validation")
                 logger.info("=" * 70)
 
-                enhanced_spec = load_spec_file(enhanced_spec_path)
-                self.validator.end_validation_session(enhanced_spec_path)
+                with profiling.phase("validate"):
+                    self.validator.end_validation_session(save_enhanced_spec, enhanced_spec=enhanced_spec)
 
-                # Run validation suite
-                validation_results = self.validator.run_full_validation_suite(original_spec, enhanced_spec)
+                    # Run validation suite
+                    validation_results = self.validator.run_full_validation_suite(original_spec, enhanced_spec)
 
-                # Generate and display report
-                validation_report = self.validator.generate_validation_report(validation_results)
+                    # Generate and display report
+                    validation_report = self.validator.generate_validation_report(validation_results)
                 print(validation_report)
 
                 # Check if all validations passed
@@ -1021,6 +1241,8 @@ class OpenAPIEnhancer:
                 generate_eval = self.config.get('generate_eval', False)
                 enable_slim = self.config.get('enable_slim', False)
                 with_a2a_proxy = self.config.get('with_a2a_proxy', False)
+                tool_mode = self.config.get('tool_mode', 'function')
+                lazy_tools = self.config.get('lazy_tools', False)
 
                 script_dir = Path(__file__).parent.parent / 'openapi_mcp_codegen'
 
@@ -1052,7 +1274,12 @@ class OpenAPIEnhancer:
                     generate_agent=generate_agent,
                     generate_eval=generate_eval,
                     enable_slim=enable_slim,
-                    with_a2a_proxy=with_a2a_proxy
+                    with_a2a_proxy=with_a2a_proxy,
+                    tool_mode=tool_mode,
+                    lazy_tools=lazy_tools,
+                    use_llm_cache=self.use_llm_cache,
+                    refresh_llm_cache=self.refresh_llm_cache,
+                    spec=enhanced_spec
                 )
                 mcp_generator.generate()
                 print(f"✓ Generated MCP server code in: {output_dir}")
@@ -1061,24 +1288,23 @@ class OpenAPIEnhancer:
                 self._generate_example_makefile(mcp_generator)
 
                 # Generate agent gateway configuration
-                self._generate_agentgateway_config(enhanced_spec_path, output_dir)
-
-                # Clean up temporary enhanced spec if not saved
-                if not skip_overlay and not save_enhanced_spec:
-                    Path(enhanced_spec_path).unlink(missing_ok=True)
+                self._generate_agentgateway_config(enhanced_spec_path, output_dir, enhanced_spec)
 
             logger.info("")
             logger.info("=" * 70)
             logger.info("✓ ALL STEPS COMPLETED SUCCESSFULLY")
             logger.info("=" * 70)
 
-            if overlay_only:
+            if overlay_only and enhanced_spec is not None and not save_enhanced_spec:
+                print("\nNote: The enhanced spec was not written.")
+                print("      Use --save-enhanced-spec to save it for review and code generation.")
+            elif overlay_only:
                 print("\nNext steps:")
                 print(f"  1. Review the enhanced spec: {enhanced_spec_path}")
                 print(f"  2. Generate MCP code with: python -m openapi_mcp_codegen.openapi_enhancer enhance \\")
                 print(f"       {enhanced_spec_path} {output_dir} --config {self.config_path}")
-            elif not save_enhanced_spec:
-                print("\nNote: Intermediate enhanced spec was cleaned up.")
+            elif enhanced_spec is not None and not save_enhanced_spec:
+                print("\nNote: The enhanced spec was kept in memory only.")
                 print("      Use --save-enhanced-spec to keep it for inspection.")
 
             return True
@@ -1128,6 +1354,10 @@ Examples:
     enhance_parser.add_argument('--skip-overlay', action='store_true', help='Skip overlay generation')
     enhance_parser.add_argument('--overlay-only', action='store_true', help='Only generate overlay')
     enhance_parser.add_argument('--format', choices=['yaml', 'json'], default='yaml', help='Overlay format')
+    enhance_parser.add_argument('--no-llm-cache', action='store_true', help='Do not read or write cached LLM descriptions')
+    enhance_parser.add_argument('--refresh-llm-cache', action='store_true', help='Ignore cached LLM descriptions and store new ones')
+    enhance_parser.add_argument('--profile', metavar='PATH', help='Write a JSON timing report of the pipeline phases to path')
+    enhance_parser.add_argument('--cprofile', metavar='PATH', help='Dump cProfile statistics of the run to path')
 
     # Generate overlay command
     overlay_parser = subparsers.add_parser('generate-overlay', help='Generate overlay only')
@@ -1136,6 +1366,8 @@ Examples:
     overlay_parser.add_argument('--config', help='Path to configuration file')
     overlay_parser.add_argument('--format', choices=['yaml', 'json'], default='yaml', help='Output format')
     overlay_parser.add_argument('--use-llm', action='store_true', help='Use LLM for enhanced descriptions')
+    overlay_parser.add_argument('--no-llm-cache', action='store_true', help='Do not read or write cached LLM descriptions')
+    overlay_parser.add_argument('--refresh-llm-cache', action='store_true', help='Ignore cached LLM descriptions and store new ones')
 
     # Apply overlay command
     apply_parser = subparsers.add_parser('apply-overlay', help='Apply overlay only')
@@ -1165,15 +1397,21 @@ Examples:
 
     try:
         if args.command == 'enhance':
-            enhancer = OpenAPIEnhancer(args.spec_path, args.config)
-            success = enhancer.enhance_and_generate(
-                output_dir=args.output_dir,
-                save_overlay=args.save_overlay,
-                save_enhanced_spec=args.save_enhanced_spec,
-                skip_overlay=args.skip_overlay,
-                overlay_only=args.overlay_only,
-                format=args.format
-            )
+            with profiling.profile('enhance', args.profile, args.cprofile):
+                enhancer = OpenAPIEnhancer(
+                    args.spec_path,
+                    args.config,
+                    use_llm_cache=not args.no_llm_cache,
+                    refresh_llm_cache=args.refresh_llm_cache
+                )
+                success = enhancer.enhance_and_generate(
+                    output_dir=args.output_dir,
+                    save_overlay=args.save_overlay,
+                    save_enhanced_spec=args.save_enhanced_spec,
+                    skip_overlay=args.skip_overlay,
+                    overlay_only=args.overlay_only,
+                    format=args.format
+                )
             return 0 if success else 1
 
         elif args.command == 'generate-overlay':
@@ -1186,7 +1424,9 @@ Examples:
             generator = OpenAPIOverlayGenerator(
                 spec_path=args.spec_path,
                 use_llm=args.use_llm,
-                overlay_config=config
+                overlay_config=config,
+                use_llm_cache=not args.no_llm_cache,
+                refresh_llm_cache=args.refresh_llm_cache
             )
 
             overlay = generator.generate_overlay()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Phase-level profiling of code generation (``--profile`` / ``--cprofile``).
+
+While a :class:`Profiler` is active, the generator and enhancer report to it:
+
+* wall and CPU time of each pipeline phase (nested phases are named
+  ``parent/child``);
+* wall and CPU time per template, with the slowest outputs of each template
+  (for the tool module templates these are the slowest tool modules);
+* files written or left unchanged and bytes written;
+* Ruff runs, files and time;
+* LLM calls, latency and token usage;
+* hits and misses of the LLM response caches.
+
+The report is written as JSON. Optionally the whole run is also recorded with
+:mod:`cProfile` and dumped in :mod:`pstats` format.
+
+Instrumented code calls :func:`phase` and :func:`active_profiler`; with no
+profiler active they cost a global lookup and a ``None`` check. Templates
+rendered by ``--jobs N`` worker processes are recorded per batch, and their CPU
+time is not included in the report.
+"""
+
+import contextlib
+import cProfile
+import heapq
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("profiling")
+
+REPORT_FORMAT = 1
+DEFAULT_TOP = 10
+# Templates rendering one tool module each (per --tool-mode)
+TOOL_TEMPLATES = ("tools/tool.tpl", "tools/tool_table.tpl")
+
+_active: Optional["Profiler"] = None
+_NO_PHASE = contextlib.nullcontext()
+
+
+def active_profiler() -> Optional["Profiler"]:
+    """Return the running profiler, or None."""
+    return _active
+
+
+def phase(name: str):
+    """Context manager timing a phase on the running profiler (a no-op without one)."""
+    profiler = _active
+    if profiler is None:
+        return _NO_PHASE
+    return profiler.phase(name)
+
+
+def _token_usage(response: Any) -> Tuple[int, int]:
+    """Input and output tokens reported on a chat model response, if any."""
+    usage = getattr(response, "usage_metadata", None)
+    if isinstance(usage, dict):
+        return int(usage.get("input_tokens") or 0), int(usage.get("output_tokens") or 0)
+    if usage is not None:
+        return int(getattr(usage, "input_tokens", 0) or 0), int(getattr(usage, "output_tokens", 0) or 0)
+    metadata = getattr(response, "response_metadata", None)
+    if isinstance(metadata, dict) and isinstance(metadata.get("token_usage"), dict):
+        token_usage = metadata["token_usage"]
+        return int(token_usage.get("prompt_tokens") or 0), int(token_usage.get("completion_tokens") or 0)
+    return 0, 0
+
+
+def invoke_llm(llm: Any, messages: Any) -> Any:
+    """Invoke a chat model, recording latency and token usage on the running profiler."""
+    profiler = _active
+    if profiler is None:
+        return llm.invoke(messages)
+    start = time.perf_counter()
+    try:
+        response = llm.invoke(messages)
+    except Exception:
+        profiler.record_llm_call(time.perf_counter() - start, failed=True)
+        raise
+    profiler.record_llm_call(time.perf_counter() - start, response)
+    return response
+
+
+class Profiler:
+    """
+    Collects timings and counters for one generator run.
+
+    Attributes:
+        command (str): Command being profiled, stored in the report.
+        top (int): Number of slowest outputs reported per template.
+        cprofile_path (str): Where to dump cProfile statistics, or None.
+    """
+
+    def __init__(self, command: str, top: int = DEFAULT_TOP, cprofile_path: Optional[str] = None):
+        self.command = command
+        self.top = top
+        self.cprofile_path = cprofile_path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._wall = self._cpu = 0.0
+        self._started: Tuple[float, float] = (0.0, 0.0)
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.templates: Dict[str, Dict[str, float]] = {}
+        self._renders: Dict[str, List[Tuple[float, str]]] = {}
+        self.files = {"written": 0, "unchanged": 0, "bytes_written": 0}
+        self.ruff = {"runs": 0, "files": 0, "wall_seconds": 0.0}
+        self.llm = {"calls": 0, "failures": 0, "latency_seconds": 0.0, "max_latency_seconds": 0.0,
+                    "input_tokens": 0, "output_tokens": 0}
+        self.caches: Dict[str, Dict[str, int]] = {}
+
+    def start(self) -> None:
+        global _active
+        _active = self
+        self._started = (time.perf_counter(), time.process_time())
+        if self.cprofile_path:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        global _active
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.cprofile_path)
+            logger.info(f"Wrote cProfile statistics: {self.cprofile_path}")
+            self._cprofile = None
+        self._wall = time.perf_counter() - self._started[0]
+        self._cpu = time.process_time() - self._started[1]
+        if _active is self:
+            _active = None
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(name)
+        key = "/".join(stack)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            stack.pop()
+            with self._lock:
+                entry = self.phases.setdefault(key, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0})
+                entry["calls"] += 1
+                entry["wall_seconds"] += wall
+                entry["cpu_seconds"] += cpu
+
+    def record_render(self, template_name: str, output_path: Optional[str], wall: float, cpu: float,
+                      count: int = 1) -> None:
+        """Record ``count`` renders of a template (a parallel batch has no single output path)."""
+        with self._lock:
+            entry = self.templates.setdefault(template_name, {"renders": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0})
+            entry["renders"] += count
+            entry["wall_seconds"] += wall
+            entry["cpu_seconds"] += cpu
+            if output_path is not None:
+                self._renders.setdefault(template_name, []).append((wall, output_path))
+
+    def record_file(self, written: bool, size: int = 0) -> None:
+        with self._lock:
+            if written:
+                self.files["written"] += 1
+                self.files["bytes_written"] += size
+            else:
+                self.files["unchanged"] += 1
+
+    def record_ruff(self, files: int, wall: float) -> None:
+        with self._lock:
+            self.ruff["runs"] += 1
+            self.ruff["files"] += files
+            self.ruff["wall_seconds"] += wall
+
+    def record_llm_call(self, latency: float, response: Any = None, failed: bool = False) -> None:
+        input_tokens, output_tokens = _token_usage(response) if response is not None else (0, 0)
+        with self._lock:
+            self.llm["calls"] += 1
+            self.llm["failures"] += int(failed)
+            self.llm["latency_seconds"] += latency
+            self.llm["max_latency_seconds"] = max(self.llm["max_latency_seconds"], latency)
+            self.llm["input_tokens"] += input_tokens
+            self.llm["output_tokens"] += output_tokens
+
+    def record_cache(self, name: str, hits: int, misses: int) -> None:
+        with self._lock:
+            entry = self.caches.setdefault(name, {"hits": 0, "misses": 0})
+            entry["hits"] += hits
+            entry["misses"] += misses
+
+    def report(self) -> Dict[str, Any]:
+        """Return the collected measurements as a JSON-serializable dict."""
+        with self._lock:
+            templates = {}
+            for name, entry in sorted(self.templates.items(), key=lambda item: -item[1]["wall_seconds"]):
+                templates[name] = dict(entry)
+                renders = self._renders.get(name)
+                if renders:
+                    templates[name]["slowest"] = [
+                        {"output": output, "wall_seconds": wall}
+                        for wall, output in heapq.nlargest(self.top, renders)
+                    ]
+            tool_renders = [render for name in TOOL_TEMPLATES for render in self._renders.get(name, [])]
+            llm = dict(self.llm)
+            llm["mean_latency_seconds"] = llm["latency_seconds"] / llm["calls"] if llm["calls"] else 0.0
+            return {
+                "format": REPORT_FORMAT,
+                "command": self.command,
+                "wall_seconds": self._wall,
+                "cpu_seconds": self._cpu,
+                "phases": {name: dict(entry) for name, entry in self.phases.items()},
+                "templates": templates,
+                "slowest_tool_modules": [
+                    {"output": output, "wall_seconds": wall} for wall, output in heapq.nlargest(self.top, tool_renders)
+                ],
+                "files": dict(self.files),
+                "ruff": dict(self.ruff),
+                "llm": llm,
+                "caches": {name: dict(entry) for name, entry in self.caches.items()},
+                "cprofile": self.cprofile_path,
+            }
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
+        logger.info(f"Wrote profile report: {path}")
+
+
+@contextlib.contextmanager
+def profile(command: str, report_path: Optional[str] = None, cprofile_path: Optional[str] = None,
+            top: int = DEFAULT_TOP) -> Iterator[Optional[Profiler]]:
+    """
+    Profile the enclosed block when a report or cProfile path is given.
+
+    Args:
+        command: Command name stored in the report.
+        report_path: Where to write the JSON report.
+        cprofile_path: Where to dump cProfile statistics.
+        top: Number of slowest outputs reported per template.
+
+    Yields:
+        The running profiler, or None when profiling is off.
+    """
+    if not report_path and not cprofile_path:
+        yield None
+        return
+    profiler = Profiler(command, top=top, cprofile_path=cprofile_path)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        if report_path:
+            profiler.write(report_path)
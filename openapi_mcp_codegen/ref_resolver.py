@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Local ``$ref`` resolution for OpenAPI documents.
+
+:class:`RefResolver` is built once per loaded spec. Component definitions
+(``#/components/<section>/<name>`` and Swagger 2 ``#/definitions/<name>``) are
+indexed up front, every other JSON pointer is walked once and memoized.
+Pointers are decoded per RFC 6901 (``~1`` -> ``/``, ``~0`` -> ``~``, after
+percent-decoding the URI fragment).
+
+Recursive schemas are handled by passing the set of references currently being
+expanded: resolving a reference that is already in that set returns
+:data:`RECURSIVE_REF` instead of the target, so callers stop descending.
+"""
+
+import logging
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+from urllib.parse import unquote
+
+logger = logging.getLogger("ref_resolver")
+
+# Returned in place of a schema that is already being expanded. It is an object
+# without properties, so callers map it to ``Dict[str, Any]``. Do not mutate.
+RECURSIVE_REF: Dict[str, Any] = {
+    "type": "object",
+    "description": "Recursive reference",
+}
+
+_MISSING = object()
+
+
+def unescape_pointer_token(token: str) -> str:
+    """Decode a single JSON pointer reference token (RFC 6901, section 4)."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def pointer_tokens(ref: str) -> list:
+    """
+    Split a local reference such as ``#/components/schemas/Pet`` into decoded tokens.
+
+    Args:
+        ref: Reference string; must be a fragment starting with ``#``.
+
+    Returns:
+        List of decoded tokens, empty for the document root.
+    """
+    pointer = unquote(ref[1:]) if ref.startswith("#") else unquote(ref)
+    if not pointer:
+        return []
+    return [unescape_pointer_token(token) for token in pointer.lstrip("/").split("/")]
+
+
+def resolve_pointer(document: Any, ref: str) -> Any:
+    """
+    Walk a JSON pointer through a document.
+
+    Args:
+        document: Parsed OpenAPI document.
+        ref: Local reference string.
+
+    Returns:
+        The referenced node, or None if the pointer does not resolve.
+    """
+    node = document
+    for token in pointer_tokens(ref):
+        if isinstance(node, dict):
+            node = node.get(token, _MISSING)
+        elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+            node = node[int(token)]
+        else:
+            return None
+        if node is _MISSING:
+            return None
+    return node
+
+
+class RefResolver:
+    """
+    Memoizing resolver for local references of a single OpenAPI document.
+
+    Attributes:
+        spec (dict): The document references are resolved against.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self._cache: Dict[str, Any] = self._build_index(spec)
+        self._chains: Dict[str, Tuple[FrozenSet[str], Any]] = {}
+
+    @staticmethod
+    def _build_index(spec: Dict[str, Any]) -> Dict[str, Any]:
+        index: Dict[str, Any] = {}
+        if not isinstance(spec, dict):
+            return index
+        for section_name, section in (spec.get("components") or {}).items():
+            if not isinstance(section, dict):
+                continue
+            for name, node in section.items():
+                escaped = name.replace("~", "~0").replace("/", "~1")
+                index[f"#/components/{section_name}/{escaped}"] = node
+        for name, node in (spec.get("definitions") or {}).items():
+            escaped = name.replace("~", "~0").replace("/", "~1")
+            index[f"#/definitions/{escaped}"] = node
+        return index
+
+    def lookup(self, ref: str) -> Optional[Any]:
+        """
+        Return the node a reference points to without following further references.
+
+        Args:
+            ref: Local reference string.
+
+        Returns:
+            The referenced node, or None if it does not exist.
+        """
+        node = self._cache.get(ref, _MISSING)
+        if node is _MISSING:
+            node = resolve_pointer(self.spec, ref)
+            self._cache[ref] = node
+        return node
+
+    def resolve(self, ref: str, seen: FrozenSet[str] = frozenset()) -> Any:
+        """
+        Resolve a reference, following chains of references to references.
+
+        Args:
+            ref: Local reference string, e.g. ``#/components/schemas/Pet``.
+            seen: References currently being expanded by the caller.
+
+        Returns:
+            The resolved node, :data:`RECURSIVE_REF` if ``ref`` (or a reference it
+            chains to) is already being expanded, or an empty dict if it does not resolve.
+        """
+        cached = self._chains.get(ref)
+        if cached is None:
+            cached = self._follow(ref)
+            self._chains[ref] = cached
+        members, node = cached
+        if seen and not seen.isdisjoint(members):
+            logger.debug(f"Recursive reference detected: {ref}")
+            return RECURSIVE_REF
+        return node
+
+    def _follow(self, ref: str):
+        chain = []
+        node: Any = {"$ref": ref}
+        while isinstance(node, dict) and isinstance(node.get("$ref"), str):
+            current = node["$ref"]
+            if current in chain:
+                logger.debug(f"Reference cycle detected: {' -> '.join(chain + [current])}")
+                return frozenset(chain), RECURSIVE_REF
+            chain.append(current)
+            node = self.lookup(current)
+        if node is None:
+            logger.debug(f"Unresolvable reference: {ref}")
+            node = {}
+        return frozenset(chain), node
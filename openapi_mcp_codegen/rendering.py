@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Jinja environment setup and parallel template rendering.
+
+All generators share one Jinja environment per template directory
+(:func:`get_template_env`). Compiled templates are stored in a persistent
+bytecode cache under the generator cache directory, so short-lived processes
+(batch runs, ``--jobs N`` render workers) load compiled templates instead of
+parsing and compiling them again. Jinja keys cache entries by template source
+checksum, so edited templates are recompiled automatically.
+
+This module is deliberately light (it only imports Jinja2) because it is
+imported by the worker processes used for ``--jobs N`` rendering. Each worker
+builds its own environment once and renders ``(template_name, context)``
+tasks; the parent process writes the results in submission order, so the
+output is identical to serial rendering.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from .cache import get_cache_dir
+
+logger = logging.getLogger("rendering")
+
+RenderTask = Tuple[str, Dict[str, Any]]
+
+
+def truncate_description(text, max_length=9000):
+    """Truncate descriptions to prevent MCP tool registration failures (10024 char limit)"""
+    if not text or len(text) <= max_length:
+        return text
+    # Find a good break point near the limit (end of sentence or paragraph)
+    truncated = text[:max_length]
+    # Look for sentence endings near the limit
+    for break_char in ['. ', '.\n', '\n\n']:
+        last_break = truncated.rfind(break_char)
+        if last_break > max_length * 0.8:  # Within 80% of limit
+            return truncated[:last_break + 1] + "\n\n[Description truncated for MCP compatibility]"
+    # Fallback: hard truncate with ellipsis
+    return truncated + "...\n\n[Description truncated for MCP compatibility]"
+
+
+class _BytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that never fails rendering when the cache directory is not writable."""
+
+    def dump_bytecode(self, bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Could not write template bytecode cache: {e}")
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    try:
+        return _BytecodeCache(str(get_cache_dir("jinja")))
+    except OSError as e:
+        logger.debug(f"Template bytecode cache disabled: {e}")
+        return None
+
+
+def create_template_env(templates_dir: str, bytecode_cache: bool = True) -> Environment:
+    """
+    Create a Jinja2 environment used to render generated code.
+
+    Args:
+        templates_dir: Directory containing the ``.tpl`` templates.
+        bytecode_cache: Store compiled templates in the on-disk cache.
+
+    Returns:
+        Environment with the generator's custom filters registered.
+    """
+    env = Environment(
+        loader=FileSystemLoader(templates_dir),
+        bytecode_cache=_bytecode_cache() if bytecode_cache else None,
+    )
+    # Add custom filters for MCP compatibility
+    env.filters['truncate_description'] = truncate_description
+    return env
+
+
+_shared_envs: Dict[str, Environment] = {}
+_shared_envs_lock = threading.Lock()
+
+
+def get_template_env(templates_dir: str) -> Environment:
+    """
+    Return the environment shared by every generator in this process for a template directory.
+
+    Args:
+        templates_dir: Directory containing the ``.tpl`` templates.
+    """
+    key = os.path.abspath(templates_dir)
+    with _shared_envs_lock:
+        env = _shared_envs.get(key)
+        if env is None:
+            env = create_template_env(key)
+            _shared_envs[key] = env
+    return env
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Translate a ``--jobs`` value into a worker count (0 or None means one per CPU)."""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+_worker_env: Optional[Environment] = None
+
+
+def _init_worker(templates_dir: str) -> None:
+    global _worker_env
+    _worker_env = get_template_env(templates_dir)
+
+
+def _render_task(task: RenderTask) -> str:
+    template_name, context = task
+    return _worker_env.get_template(template_name).render(**context)
+
+
+class RenderPool:
+    """
+    Process pool that renders templates with one Jinja environment per worker.
+
+    Attributes:
+        templates_dir (str): Directory the workers load templates from.
+        jobs (int): Number of worker processes.
+    """
+
+    def __init__(self, templates_dir: str, jobs: int):
+        self.templates_dir = templates_dir
+        self.jobs = jobs
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info(f"Starting {self.jobs} render worker(s)")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.jobs,
+                mp_context=multiprocessing.get_context(),
+                initializer=_init_worker,
+                initargs=(self.templates_dir,),
+            )
+        return self._executor
+
+    def render(self, tasks: Sequence[RenderTask]) -> List[str]:
+        """
+        Render tasks in parallel.
+
+        Args:
+            tasks: ``(template_name, context)`` pairs.
+
+        Returns:
+            Rendered text for each task, in the order of ``tasks``.
+        """
+        if not tasks:
+            return []
+        chunksize = max(1, len(tasks) // (self.jobs * 4))
+        return list(self._get_executor().map(_render_task, tasks, chunksize=chunksize))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
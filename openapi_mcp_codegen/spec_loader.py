@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Single entry point for loading OpenAPI specifications.
+
+Every stage (CLI, generator, overlay generator/applier, validators) loads specs
+through :func:`load_spec`, which
+
+* parses with the fastest available parser: ``orjson`` (falling back to the
+  standard library) for ``.json`` files and PyYAML's libyaml-backed
+  ``CSafeLoader`` (falling back to ``SafeLoader``) for everything else;
+* memoizes parsed documents in-process by content hash, so every stage that
+  loads the same file receives the same document;
+* keeps a pickled copy of each parsed document in the on-disk cache
+  (see :func:`openapi_mcp_codegen.cache.get_cache_dir`), keyed by content hash,
+  so repeat runs skip parsing entirely. Unpickling runs code, so the disk cache
+  is only used while its directory is private to the current user (owned by
+  them, mode ``0700``) and each entry was written by them and is not writable
+  by anyone else.
+
+YAML is resolved with YAML 1.2 core-schema booleans (``yes``/``no``/``on``/``off``
+stay strings) and timestamps are kept as strings, so YAML and JSON specs load
+to the same values and can be re-serialized as JSON.
+
+Callers that modify the returned document must pass ``copy=True``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import threading
+from typing import Any, Dict, Tuple
+
+import yaml
+
+from .cache import get_cache_dir
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger("spec_loader")
+
+# Bump when parsing semantics change so stale cache entries are ignored
+CACHE_FORMAT = 1
+MAX_DISK_CACHE_ENTRIES = 64
+
+_BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class SpecYAMLLoader(_BaseLoader):
+    """Safe YAML loader with YAML 1.2 booleans and string timestamps."""
+
+
+SpecYAMLLoader.yaml_implicit_resolvers = {
+    first: [
+        (tag, regexp)
+        for tag, regexp in resolvers
+        if tag not in ("tag:yaml.org,2002:bool", "tag:yaml.org,2002:timestamp")
+    ]
+    for first, resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+}
+SpecYAMLLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:bool",
+    re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+    list("tTfF"),
+)
+
+_memo: Dict[str, Tuple[Any, bytes]] = {}
+_memo_lock = threading.Lock()
+
+
+def _parser_name(path: str) -> str:
+    if path.endswith(".json"):
+        return "orjson" if orjson is not None else "json"
+    return "libyaml" if _BaseLoader is not yaml.SafeLoader else "pyyaml"
+
+
+def parse_spec_bytes(data: bytes, path: str) -> Any:
+    """
+    Parse raw spec content, choosing the parser from the file extension.
+
+    Args:
+        data: File content.
+        path: File name, used only to pick JSON or YAML.
+
+    Returns:
+        The parsed document.
+    """
+    if path.endswith(".json"):
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    return yaml.load(data, Loader=SpecYAMLLoader)
+
+
+def _private_cache_dir():
+    """
+    Return the spec cache directory, or None if another user could write to it.
+
+    A directory owned by the current user is restricted to mode ``0700``. Platforms
+    without POSIX ownership (Windows) rely on the per-user cache location.
+    """
+    path = get_cache_dir("specs")
+    if not hasattr(os, "getuid"):
+        return path
+    st = path.stat()
+    if st.st_uid != os.getuid():
+        logger.warning(f"Spec cache {path} is not owned by the current user; not using it")
+        return None
+    if st.st_mode & 0o077:
+        os.chmod(path, 0o700)
+    return path
+
+
+def _read_disk_cache(digest: str):
+    try:
+        directory = _private_cache_dir()
+        if directory is None:
+            return None
+        path = directory / f"{digest}.pickle"
+        with open(path, "rb") as f:
+            if hasattr(os, "getuid"):
+                st = os.fstat(f.fileno())
+                if st.st_uid != os.getuid() or st.st_mode & 0o022:
+                    logger.warning(f"Ignoring spec cache entry {path} writable by another user")
+                    return None
+            blob = f.read()
+        os.utime(path)
+        return blob
+    except OSError:
+        return None
+
+
+def _write_disk_cache(digest: str, blob: bytes) -> None:
+    try:
+        directory = _private_cache_dir()
+        if directory is None:
+            return
+        path = directory / f"{digest}.pickle"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        # Private regardless of the umask, so the entry passes the ownership check when read
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+        entries = sorted(path.parent.glob("*.pickle"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in entries[MAX_DISK_CACHE_ENTRIES:]:
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not write spec cache entry: {e}")
+
+
+def load_spec(path: str, copy: bool = False, use_cache: bool = True) -> Any:
+    """
+    Load an OpenAPI specification (or any JSON/YAML document).
+
+    Args:
+        path: Path to a ``.json``, ``.yaml`` or ``.yml`` file.
+        copy: Return a private copy that the caller may modify. Without it the
+            returned document is shared with every other caller and must be
+            treated as read-only.
+        use_cache: Read and write the on-disk parse cache.
+
+    Returns:
+        The parsed document.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(
+        f"{CACHE_FORMAT}:{_parser_name(path)}:".encode("utf-8") + data
+    ).hexdigest()
+
+    with _memo_lock:
+        entry = _memo.get(digest)
+    if entry is None:
+        blob = _read_disk_cache(digest) if use_cache else None
+        if blob is not None:
+            logger.debug(f"Loaded parsed spec for {path} from cache")
+            document = pickle.loads(blob)
+        else:
+            logger.debug(f"Parsing {path} with {_parser_name(path)}")
+            document = parse_spec_bytes(data, path)
+            blob = pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL)
+            if use_cache:
+                _write_disk_cache(digest, blob)
+        entry = (document, blob)
+        with _memo_lock:
+            entry = _memo.setdefault(digest, entry)
+
+    if copy:
+        return pickle.loads(entry[1])
+    return entry[0]
+
+
+def clear_memory_cache() -> None:
+    """Forget all documents memoized in this process."""
+    with _memo_lock:
+        _memo.clear()
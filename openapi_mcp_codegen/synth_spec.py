@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Seeded, deterministic synthesizer of large OpenAPI 3.0 specifications.
+
+Used for scaling tests of the generator (``synth-spec`` command and
+``benchmarks/bench_scaling.py``). The same parameters and seed always produce
+the same document. The shape of the spec is controlled by:
+
+* ``operations``: CRUD operations spread over resources (five per resource:
+  list, create, get, replace, delete). Operation ids follow the long
+  ``<Group>Service_<Verb><Resource>`` style of gRPC gateway specs, so function
+  name truncation and deduplication get exercised.
+* ``schemas``: number of entity schemas. Each entity is the head of an
+  ``allOf`` chain ``schema_depth`` levels deep, so the spec holds
+  ``schemas * (schema_depth + 1)`` components.
+* ``ref_fanout``: ``$ref`` properties from each entity to other entities.
+* ``enum_size``: values of the enum property of every entity.
+* ``recursive``: add self references and allow reference cycles.
+"""
+
+import random
+from typing import Any, Dict, List
+
+# Words that trigger the function name abbreviation rules
+_GROUPS = [
+    "Workflow", "WorkflowTemplate", "ClusterWorkflowTemplate", "CronWorkflow", "EventSource",
+    "Sensor", "Artifact", "Namespace", "Account", "Configuration", "Project", "Repository",
+]
+_NOUNS = [
+    "Workflows", "Templates", "Artifacts", "Selectors", "Permissions", "Metadata", "Clusters",
+    "Applications", "Certificates", "Repositories", "Sessions", "Accounts", "Projects",
+]
+_METHODS = [
+    ("get", "List", False),
+    ("post", "Create", False),
+    ("get", "Get", True),
+    ("put", "Update", True),
+    ("delete", "Delete", True),
+]
+
+
+def _entity(index: int) -> str:
+    return f"Entity{index}"
+
+
+def _ref(name: str) -> Dict[str, str]:
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def _entity_schemas(
+    rng: random.Random, index: int, count: int, depth: int, ref_fanout: int, enum_size: int, recursive: bool
+) -> Dict[str, Dict[str, Any]]:
+    """Build one entity and the levels of its allOf chain."""
+    name = _entity(index)
+    properties: Dict[str, Any] = {
+        "name": {"type": "string", "description": f"Name of the {name.lower()}"},
+        "count": {"type": "integer", "format": "int32"},
+        "enabled": {"type": "boolean"},
+        "created": {"type": "string", "format": "date-time"},
+    }
+    if enum_size:
+        properties["status"] = {
+            "type": "string",
+            "description": f"Status of the {name.lower()}",
+            "enum": [f"STATUS_{index}_{value}" for value in range(enum_size)],
+        }
+    # Without recursion only entities with a higher index are referenced, so there are no cycles
+    candidates = range(count) if recursive else range(index + 1, count)
+    if candidates:
+        for slot in range(ref_fanout):
+            properties[f"related{slot}"] = _ref(_entity(rng.choice(candidates)))
+    if recursive:
+        properties["parent"] = _ref(name)
+        properties["children"] = {"type": "array", "items": _ref(name)}
+
+    schemas: Dict[str, Dict[str, Any]] = {}
+    base = None
+    for level in range(depth):
+        level_name = f"{name}Level{level}"
+        level_schema: Dict[str, Any] = {
+            "type": "object",
+            "properties": {f"level{level}Field": {"type": "string"}},
+        }
+        schemas[level_name] = {"allOf": [_ref(base), level_schema]} if base else level_schema
+        base = level_name
+    own = {"type": "object", "required": ["name"], "properties": properties}
+    schemas[name] = {"allOf": [_ref(base), own]} if base else own
+    return schemas
+
+
+def _operation(
+    rng: random.Random, group: str, noun: str, resource: int, verb: str, has_id: bool, entity: str, enum_size: int
+) -> Dict[str, Any]:
+    operation: Dict[str, Any] = {
+        "operationId": f"{group}Service_{verb}{noun}{resource}",
+        "summary": f"{verb} {noun.lower()} of resource {resource}",
+        "description": f"{verb} {noun.lower()} in the {group} service (resource {resource}).",
+        "tags": [f"{group}Service"],
+        "responses": {
+            "200": {
+                "description": "A successful response.",
+                "content": {"application/json": {"schema": _ref(entity)}},
+            },
+            "default": {"description": "An unexpected error response."},
+        },
+    }
+    parameters: List[Dict[str, Any]] = []
+    if has_id:
+        parameters.append({"name": "id", "in": "path", "required": True, "schema": {"type": "string"}})
+    if verb == "List":
+        parameters.extend([
+            {"name": "limit", "in": "query", "schema": {"type": "integer", "format": "int32"}},
+            {"name": "continue", "in": "query", "schema": {"type": "string"}},
+        ])
+        if enum_size:
+            parameters.append({
+                "name": "status",
+                "in": "query",
+                "schema": {"type": "string", "enum": [f"STATUS_{value}" for value in range(enum_size)]},
+            })
+        for extra in range(rng.randint(0, 3)):
+            parameters.append({"name": f"filter.field{extra}", "in": "query", "schema": {"type": "string"}})
+    if parameters:
+        operation["parameters"] = parameters
+    if verb in ("Create", "Update"):
+        operation["requestBody"] = {
+            "required": True,
+            "content": {"application/json": {"schema": _ref(entity)}},
+        }
+    return operation
+
+
+def synthesize_spec(
+    operations: int = 100,
+    schemas: int = 50,
+    schema_depth: int = 2,
+    ref_fanout: int = 2,
+    enum_size: int = 10,
+    recursive: bool = True,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Generate a synthetic OpenAPI 3.0 document.
+
+    Args:
+        operations: Number of operations.
+        schemas: Number of entity schemas (at least one).
+        schema_depth: Length of each entity's allOf chain (0 for plain objects).
+        ref_fanout: References from each entity to other entities.
+        enum_size: Values of each entity's enum property (0 for none).
+        recursive: Add self references and allow reference cycles between entities.
+        seed: Random seed; equal arguments always give an equal document.
+
+    Returns:
+        The OpenAPI document.
+    """
+    rng = random.Random(seed)
+    schemas = max(1, schemas)
+    components: Dict[str, Any] = {}
+    for index in range(schemas):
+        components.update(_entity_schemas(rng, index, schemas, schema_depth, ref_fanout, enum_size, recursive))
+
+    paths: Dict[str, Dict[str, Any]] = {}
+    resource = 0
+    while resource * len(_METHODS) < operations:
+        group = _GROUPS[resource % len(_GROUPS)]
+        noun = _NOUNS[rng.randrange(len(_NOUNS))]
+        entity = _entity(rng.randrange(schemas))
+        base_path = f"/api/v1/{group.lower()}s/{noun.lower()}{resource}"
+        for position, (method, verb, has_id) in enumerate(_METHODS):
+            if resource * len(_METHODS) + position >= operations:
+                break
+            path = f"{base_path}/{{id}}" if has_id else base_path
+            paths.setdefault(path, {})[method] = _operation(rng, group, noun, resource, verb, has_id, entity, enum_size)
+        resource += 1
+
+    return {
+        "openapi": "3.0.3",
+        "info": {
+            "title": "Synthetic API",
+            "version": "1.0.0",
+            "description": (
+                f"Synthetic spec: {operations} operations, {schemas} entities, allOf depth {schema_depth}, "
+                f"ref fan-out {ref_fanout}, enum size {enum_size}, recursive={recursive}, seed {seed}."
+            ),
+        },
+        "servers": [{"url": "https://synthetic.example.com"}],
+        "paths": paths,
+        "components": {"schemas": components},
+    }
+
+
+def synthetic_config(title: str = "synthetic") -> Dict[str, Any]:
+    """Minimal generator config for a synthetic spec (no LLM enhancement)."""
+    return {
+        "title": title,
+        "description": "Synthetic MCP server for scaling tests",
+        "version": "0.1.0",
+        "overlay_enhancements": {"enabled": True, "use_llm": False},
+    }
@@ -134,6 +134,9 @@ Run the agent/A2A server as usual (make run-a2a). Visit Langfuse UI to see trace
 | `{{ mcp_name | upper }}_TOKEN` | Yes | Authentication token for the service |
 | `{{ mcp_name | upper }}_VERIFY_SSL` | No | Enable/disable SSL certificate verification (default: `true`). Falls back to `VERIFY_SSL` if not set. |
 | `{{ mcp_name | upper }}_CA_BUNDLE` | No | Path to custom CA bundle for SSL verification |
+| `{{ mcp_name | upper }}_HTTP_MAX_CONNECTIONS` | No | Maximum connections in the shared HTTP pool (default: `100`) |
+| `{{ mcp_name | upper }}_HTTP_MAX_KEEPALIVE_CONNECTIONS` | No | Maximum idle keep-alive connections kept in the pool (default: `20`) |
+| `{{ mcp_name | upper }}_HTTP_KEEPALIVE_EXPIRY` | No | Seconds an idle keep-alive connection is kept open (default: `30`) |
 
 ### Usage Examples
 ```bash
@@ -6,6 +6,11 @@
 # Authentication token / key for the service
 {{ mcp_name | upper }}_TOKEN=PASTE_YOUR_TOKEN_HERE
 
+# HTTP connection pool used by the MCP server's API client (optional)
+# {{ mcp_name | upper }}_HTTP_MAX_CONNECTIONS=100
+# {{ mcp_name | upper }}_HTTP_MAX_KEEPALIVE_CONNECTIONS=20
+# {{ mcp_name | upper }}_HTTP_KEEPALIVE_EXPIRY=30
+
 # A2A Agent server configuration
 A2A_HOST=0.0.0.0
 A2A_PORT=8000
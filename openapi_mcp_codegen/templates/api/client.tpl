@@ -7,7 +7,9 @@
 
 import os
 import ssl
+import asyncio
 import logging
+import weakref
 from typing import Optional, Dict, Tuple, Any
 import httpx
 
@@ -23,6 +25,11 @@ VERIFY_SSL = verify_ssl_env.lower() == 'true'
 
 CA_BUNDLE = os.getenv("{{ mcp_name | upper }}_CA_BUNDLE")
 
+# Connection pool configuration (shared by all tool calls on the same event loop)
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("{{ mcp_name | upper }}_HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("{{ mcp_name | upper }}_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("{{ mcp_name | upper }}_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+
 if not API_URL:
     raise ValueError("{{ mcp_name | upper }}_API_URL environment variable is not set.")
 if not API_TOKEN:
@@ -32,7 +39,52 @@ if not API_TOKEN:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mcp_{{ mcp_name }}")
 
-from typing import Dict, Any   # (if not already imported)
+# One pooled client per event loop; httpx clients must not be shared across loops
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _client_verify():
+    """Return the ``verify`` argument for httpx based on the SSL configuration."""
+    if VERIFY_SSL:
+        if CA_BUNDLE:
+            logger.debug(f"Using custom CA bundle: {CA_BUNDLE}")
+            return CA_BUNDLE
+        return True
+    logger.warning("SSL verification is disabled. This is not recommended for production environments.")
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the pooled HTTP client for the running event loop, creating it on first use.
+
+    The client keeps TCP/TLS connections alive between tool calls. Pool limits are
+    read from {{ mcp_name | upper }}_HTTP_MAX_CONNECTIONS, {{ mcp_name | upper }}_HTTP_MAX_KEEPALIVE_CONNECTIONS
+    and {{ mcp_name | upper }}_HTTP_KEEPALIVE_EXPIRY.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        limits = httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        )
+        client = httpx.AsyncClient(verify=_client_verify(), limits=limits)
+        _clients[loop] = client
+        logger.debug("Created pooled HTTP client")
+    return client
+
+
+async def aclose_client() -> None:
+    """Close the pooled HTTP client of the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.debug("Closed pooled HTTP client")
 
 def assemble_nested_body(flat_body: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -103,72 +155,59 @@ async def make_api_request(
         if data:
             logger.debug(f"Request data: {data}")
 
-        # Configure SSL verification
-        if VERIFY_SSL:
-            if CA_BUNDLE:
-                logger.debug(f"Using custom CA bundle: {CA_BUNDLE}")
-                async_client_kwargs = {"timeout": timeout, "verify": CA_BUNDLE}
-            else:
-                async_client_kwargs = {"timeout": timeout}
+        client = get_client()
+        url = f"{API_URL}{path}"
+        logger.debug(f"Full request URL: {url}")
+
+        method_map = {
+            "GET": client.get,
+            "POST": client.post,
+            "PUT": client.put,
+            "PATCH": client.patch,
+            "DELETE": client.delete,
+        }
+
+        if method not in method_map:
+            logger.error(f"Unsupported HTTP method: {method}")
+            return (False, {"error": f"Unsupported method: {method}"})
+
+        request_kwargs = {
+            "headers": headers,
+            "params": params,
+            "timeout": timeout,
+        }
+        if method in ["POST", "PUT", "PATCH"]:
+            request_kwargs["json"] = data
+
+        response = await method_map[method](url, **request_kwargs)
+        logger.debug(f"Response status code: {response.status_code}")
+
+        if response.status_code in [200, 201, 202, 204]:
+            if response.status_code == 204:
+                logger.debug("Request successful (204 No Content)")
+                return (True, {"status": "success"})
+            try:
+                response_data = response.json()
+                logger.debug("Request successful, parsed JSON response")
+                return (True, response_data)
+            except ValueError:
+                logger.warning("Request successful but could not parse JSON response")
+                return (True, {"status": "success", "raw_response": response.text})
         else:
-            logger.warning("SSL verification is disabled. This is not recommended for production environments.")
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            async_client_kwargs = {"timeout": timeout, "verify": ssl_context}
-
-        async with httpx.AsyncClient(**async_client_kwargs) as client:
-            url = f"{API_URL}{path}"
-            logger.debug(f"Full request URL: {url}")
-
-            method_map = {
-                "GET": client.get,
-                "POST": client.post,
-                "PUT": client.put,
-                "PATCH": client.patch,
-                "DELETE": client.delete,
-            }
-
-            if method not in method_map:
-                logger.error(f"Unsupported HTTP method: {method}")
-                return (False, {"error": f"Unsupported method: {method}"})
-
-            request_kwargs = {
-                "headers": headers,
-                "params": params,
-            }
-            if method in ["POST", "PUT", "PATCH"]:
-                request_kwargs["json"] = data
-
-            response = await method_map[method](url, **request_kwargs)
-            logger.debug(f"Response status code: {response.status_code}")
-
-            if response.status_code in [200, 201, 202, 204]:
-                if response.status_code == 204:
-                    logger.debug("Request successful (204 No Content)")
-                    return (True, {"status": "success"})
-                try:
-                    response_data = response.json()
-                    logger.debug("Request successful, parsed JSON response")
-                    return (True, response_data)
-                except ValueError:
-                    logger.warning("Request successful but could not parse JSON response")
-                    return (True, {"status": "success", "raw_response": response.text})
-            else:
-                error_message = f"API request failed: {response.status_code}"
-                logger.error(error_message)
-                try:
-                    error_data = response.json()
-                    if "error" in error_data:
-                        error_message = f"{error_message} - {error_data['error']}"
-                    elif "message" in error_data:
-                        error_message = f"{error_message} - {error_data['message']}"
-                    logger.error(f"Error details: {error_data}")
-                    return (False, {"error": error_message, "details": error_data})
-                except ValueError:
-                    error_text = response.text[:200] if response.text else ""
-                    logger.error(f"Error response (not JSON): {error_text}")
-                    return (False, {"error": f"{error_message} - {error_text}"})
+            error_message = f"API request failed: {response.status_code}"
+            logger.error(error_message)
+            try:
+                error_data = response.json()
+                if "error" in error_data:
+                    error_message = f"{error_message} - {error_data['error']}"
+                elif "message" in error_data:
+                    error_message = f"{error_message} - {error_data['message']}"
+                logger.error(f"Error details: {error_data}")
+                return (False, {"error": error_message, "details": error_data})
+            except ValueError:
+                error_text = response.text[:200] if response.text else ""
+                logger.error(f"Error response (not JSON): {error_text}")
+                return (False, {"error": f"{error_message} - {error_text}"})
     except httpx.TimeoutException:
         logger.error(f"Request timed out after {timeout} seconds")
         return (False, {"error": f"Request timed out after {timeout} seconds"})
@@ -187,3 +226,40 @@ async def make_api_request(
             error_message = error_message.replace(token, "[REDACTED]")
         logger.error(f"Unexpected error: {error_message}")
         return (False, {"error": f"Unexpected error: {error_message}"})
+
+async def call_operation(operation: Tuple[str, str, Tuple, Tuple], arguments: Dict[str, Any]) -> Any:
+    """
+    Execute an operation described by a table entry of a tool module.
+
+    Used by tool modules generated with ``--tool-mode table``, whose functions pass
+    their arguments here instead of building the request themselves.
+
+    Args:
+        operation: (method, path template, query parameters, body fields), where query
+            parameters are (argument, query key) pairs and body fields are
+            (argument, key path) pairs into the nested JSON body
+        arguments: Arguments of the tool call by name; path placeholders name arguments too
+
+    Returns:
+        The JSON response, or a dict with an "error" key if the request failed
+    """
+    method, path, query, body = operation
+    params = {}
+    for name, key in query:
+        value = arguments[name]
+        if value is not None:
+            params[key] = str(value).lower() if isinstance(value, bool) else value
+    data: Dict[str, Any] = {}
+    for name, keys in body:
+        value = arguments[name]
+        if value is not None:
+            cursor = data
+            for key in keys[:-1]:
+                cursor = cursor.setdefault(key, {})
+            cursor[keys[-1]] = value
+
+    success, response = await make_api_request(path.format_map(arguments), method=method, params=params, data=data)
+    if not success:
+        logger.error(f"Request failed: {response.get('error')}")
+        return {"error": response.get('error', 'Request failed')}
+    return response
@@ -12,12 +12,62 @@ allowing large language models and AI assistants to interact with the service.
 """
 import logging
 import os
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
-from fastmcp import FastMCP
+from fastmcp import FastMCP{% if lazy_tools %}
+import importlib
+import json
+from typing import Any, Dict, Optional
+from fastmcp.tools import Tool
+from pydantic import PrivateAttr{% endif %}
 
-{% for module in modules %}
+from {{ mcp_package }}mcp_{{ mcp_name }}.api.client import aclose_client
+{% if lazy_tools %}
+TOOLS_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools_manifest.json")
+
+
+class LazyTool(Tool):
+    """Tool registered from the tool manifest; its module is imported on the first call."""
+
+    module: str
+    function: str
+    _tool: Optional[Tool] = PrivateAttr(default=None)
+
+    async def run(self, arguments: Dict[str, Any]) -> Any:
+        if self._tool is None:
+            module = importlib.import_module(f"{{ mcp_package }}mcp_{{ mcp_name }}.tools.{self.module}")
+            self._tool = Tool.from_function(getattr(module, self.function), name=self.name)
+        return await self._tool.run(arguments)
+
+
+def register_tools(mcp: FastMCP) -> None:
+    """Register every tool of the manifest without importing the tool modules."""
+    with open(TOOLS_MANIFEST, encoding="utf-8") as f:
+        manifest = json.load(f)
+    for entry in manifest["tools"]:
+        mcp.add_tool(LazyTool(**entry))
+
+{% else %}{% for module in modules %}
 from {{ mcp_package }}mcp_{{ mcp_name }}.tools import {{ module }}
-{% endfor %}
+{% endfor %}{% endif %}
+
+# In SSE/HTTP mode FastMCP may enter the lifespan once per client session. All
+# sessions share the event loop, and with it the pooled HTTP client, so the pool
+# is only closed when the last session ends.
+_active_lifespans = 0
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """Release pooled HTTP connections when the last MCP session ends."""
+    global _active_lifespans
+    _active_lifespans += 1
+    try:
+        yield
+    finally:
+        _active_lifespans -= 1
+        if _active_lifespans == 0:
+            await aclose_client()
 
 def main():
     # Load environment variables
@@ -41,15 +91,17 @@ def main():
 
     # Create server instance
     if MCP_MODE.lower() in ["sse", "http"]:
-        mcp = FastMCP(f"{SERVER_NAME} MCP Server", host=MCP_HOST, port=MCP_PORT)
+        mcp = FastMCP(f"{SERVER_NAME} MCP Server", host=MCP_HOST, port=MCP_PORT, lifespan=lifespan)
     else:
-        mcp = FastMCP(f"{SERVER_NAME} MCP Server")
+        mcp = FastMCP(f"{SERVER_NAME} MCP Server", lifespan=lifespan)
 
-{% for module, ops in registrations.items() %}
+{% if lazy_tools %}    # Register tools from the manifest; tool modules are imported on first use
+    register_tools(mcp)
+{% else %}{% for module, ops in registrations.items() %}
     # Register {{ module }} tools
 {% for op in ops %}
     mcp.tool()({{ module }}.{{ op | replace('{', '') | replace('}', '') }})
-{% endfor %}{% endfor %}
+{% endfor %}{% endfor %}{% endif %}
 
     # Run the MCP server
     mcp.run(transport=MCP_MODE.lower())
@@ -0,0 +1,40 @@
+{% if file_headers %}
+# {{ file_headers_copyright }}
+# {{ file_headers_license }}
+# {{ file_headers_message }}
+{% endif %}
+"""Tools for {{ path }} operations"""
+
+from typing import Dict, Any, Optional, List, Literal
+from pydantic import BaseModel
+from {{ mcp_server_base_package }}mcp_{{ mcp_name }}.api.client import call_operation
+
+# Function name: (method, path template, (argument, query key) pairs, (argument, body key path) pairs)
+OPERATIONS = {
+{%- for func in functions %}
+    "{{ func.operation_id }}": ("{{ func.method.upper() }}", {{ func.formatted_path | tojson }}, {{ func.query_fields }}, {{ func.body_paths }}),
+{%- endfor %}
+}
+{% for func in functions %}
+
+async def {{ func.operation_id }}({{ func.params | join(', ') }}) -> Any:
+    """
+    {{ func.summary }}
+
+    OpenAPI Description:
+        {{ func.description | truncate_description }}
+
+    Args:
+    {{ newline }}
+    {%- for param in func.params_info %}
+        {{ param.name }} ({{ param.type }}):{% if param.description %} {{ param.description }}{% else %} OpenAPI parameter corresponding to '{{ param.name }}'{% endif %}
+    {% endfor %}
+
+    Returns:
+        Any: The JSON response from the API call.
+
+    Raises:
+        Exception: If the API request fails or returns an error.
+    """
+    return await call_operation(OPERATIONS["{{ func.operation_id }}"], locals())
+{% endfor %}
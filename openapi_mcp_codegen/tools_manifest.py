@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Copyright 2025 CNOE
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tool manifest for lazily registered MCP servers (``--lazy-tools``).
+
+The manifest lists every tool of a generated server with its name, description,
+JSON input schema, module and function. A server generated with
+``--lazy-tools`` registers its tools from this file at startup and imports a
+tool module only when one of its tools is first called, so cold start no longer
+grows with the size of the API.
+
+The manifest is built from the final (enhanced and formatted) tool modules with
+:mod:`ast`, without importing them. Descriptions are the cleaned function
+docstrings, and schemas follow what FastMCP derives from the type annotations.
+Arguments are still validated by FastMCP against the real function signature
+on every call.
+"""
+
+import ast
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("tools_manifest")
+
+MANIFEST_FILE_NAME = "tools_manifest.json"
+# Bump when the manifest layout changes
+MANIFEST_FORMAT = 1
+
+_PRIMITIVE_TYPES = {"int": "integer", "float": "number", "bool": "boolean", "str": "string"}
+
+
+def annotation_schema(node: Optional[ast.expr]) -> Dict[str, Any]:
+    """
+    Return the JSON schema of a generated parameter annotation.
+
+    Covers the annotations the generator emits: ``int``, ``float``, ``bool``,
+    ``str``, ``Any``, ``List[...]``, ``Dict[...]`` and ``Literal[...]``. Anything
+    else accepts any value.
+    """
+    if isinstance(node, ast.Name):
+        if node.id in _PRIMITIVE_TYPES:
+            return {"type": _PRIMITIVE_TYPES[node.id]}
+        return {}
+    if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name):
+        container = node.value.id
+        if container == "List":
+            return {"type": "array", "items": annotation_schema(node.slice)}
+        if container == "Dict":
+            return {"type": "object", "additionalProperties": True}
+        if container == "Literal":
+            elements = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+            try:
+                values = [ast.literal_eval(element) for element in elements]
+            except ValueError:
+                return {}
+            schema: Dict[str, Any] = {"enum": values}
+            kinds = {type(value).__name__ for value in values}
+            if len(kinds) == 1 and values and type(values[0]).__name__ in _PRIMITIVE_TYPES:
+                schema["type"] = _PRIMITIVE_TYPES[type(values[0]).__name__]
+            return schema
+    return {}
+
+
+def function_schema(node: ast.AsyncFunctionDef) -> Dict[str, Any]:
+    """Return the JSON input schema of a tool function."""
+    args = node.args.args
+    defaults = [None] * (len(args) - len(node.args.defaults)) + list(node.args.defaults)
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    for arg, default in zip(args, defaults):
+        schema = annotation_schema(arg.annotation)
+        if default is None:
+            required.append(arg.arg)
+        else:
+            try:
+                schema["default"] = ast.literal_eval(default)
+            except ValueError:
+                pass
+        properties[arg.arg] = schema
+    schema = {"type": "object", "properties": properties, "additionalProperties": False}
+    if required:
+        schema["required"] = required
+    return schema
+
+
+def module_tools(source: str, module: str, functions: List[str]) -> List[Dict[str, Any]]:
+    """
+    Return the manifest entries of the given functions of a tool module.
+
+    Args:
+        source: Source of the tool module.
+        module: Module name within the ``tools`` package.
+        functions: Names of the functions registered as tools, in registration order.
+    """
+    nodes = {
+        node.name: node for node in ast.parse(source).body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+    entries = []
+    for function in functions:
+        node = nodes.get(function)
+        if node is None:
+            raise ValueError(f"Tool function '{function}' not found in module '{module}'")
+        entries.append({
+            "name": function,
+            "description": ast.get_docstring(node) or "",
+            "parameters": function_schema(node),
+            "module": module,
+            "function": function,
+        })
+    return entries
+
+
+def build_tools_manifest(tools_dir: str, tools_map: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Build the tool manifest of a generated server.
+
+    Args:
+        tools_dir: Directory of the generated tool modules.
+        tools_map: Module names mapped to the functions registered from them.
+
+    Returns:
+        The manifest document.
+    """
+    tools = []
+    for module, functions in tools_map.items():
+        with open(os.path.join(tools_dir, f"{module}.py"), encoding="utf-8") as f:
+            tools.extend(module_tools(f.read(), module, functions))
+    logger.info(f"Built tool manifest with {len(tools)} tools from {len(tools_map)} modules")
+    return {"format": MANIFEST_FORMAT, "tools": tools}
+
+
+def manifest_json(manifest: Dict[str, Any]) -> str:
+    return json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
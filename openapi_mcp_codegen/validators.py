@@ -10,14 +10,22 @@ and OpenAPI 3.x standards. Provides auto-validation during enhancement pipeline.
 """
 
 import json
+import threading
+from abc import ABC, abstractmethod
 import time
 from typing import Dict, Any, List, Tuple, Optional
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from openapi_mcp_codegen.ir import Operation, SpecIR
+from openapi_mcp_codegen.spec_loader import load_spec
+
 logger = logging.getLogger("validators")
 
+# Operations covered by parameter validation
+VALIDATED_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'options', 'head')
+
 
 @dataclass
 class ValidationResult:
@@ -54,104 +62,55 @@ class EnhancementMetrics:
     validation_tokens_total: int = 0
     total_tokens_used: int = 0
 
+    # Seconds spent in each validation rule, keyed by rule name
+    rule_timings: Dict[str, float] = field(default_factory=dict)
 
-class OpenAPIValidator:
-    """
-    Comprehensive OpenAPI validation suite ensuring ADR-005 compliance.
+
+class ValidationRule(ABC):
     """
+    A check fed by :class:`ValidationEngine` during its single walk over a spec.
 
-    def __init__(self):
-        self.metrics = EnhancementMetrics()
-        self.adr_requirements = {
-            'conversion_success_rate': 95.0,  # >95%
-            'parameter_fix_rate': 100.0,      # 100%
-            'body_param_conversion_rate': 100.0,  # 100%
-            'llm_accuracy': 90.0,             # >90%
-            'performance_increase_limit': 25.0,  # <25%
-        }
+    Subclasses override the hooks they need and must build their result in :meth:`finish`.
+    Hooks a rule does not override are never called, so they cost nothing.
 
-    def start_validation_session(self, original_spec_path: str) -> None:
-        """Start a validation session with baseline metrics."""
-        self.metrics.start_time = time.time()
-        if Path(original_spec_path).exists():
-            self.metrics.original_size = Path(original_spec_path).stat().st_size
-        logger.info("🔍 Starting validation session")
+    Attributes:
+        name (str): Key of the rule's result in the validation suite.
+        validator (OpenAPIValidator): Validator providing ADR thresholds and metrics.
+    """
 
-    def end_validation_session(self, enhanced_spec_path: str = None) -> None:
-        """End validation session and calculate final metrics."""
-        self.metrics.end_time = time.time()
-        if enhanced_spec_path and Path(enhanced_spec_path).exists():
-            self.metrics.enhanced_size = Path(enhanced_spec_path).stat().st_size
+    name = ""
 
-        # Calculate total tokens
-        self.metrics.total_tokens_used = (
-            self.metrics.generation_tokens_total +
-            self.metrics.validation_tokens_total
-        )
+    def __init__(self, validator: 'OpenAPIValidator'):
+        self.validator = validator
 
-        logger.info("✅ Validation session completed")
+    def start(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> None:
+        """Called once before the walk."""
 
-    def add_generation_tokens(self, input_tokens: int, output_tokens: int) -> None:
-        """Add token usage from generation phase."""
-        self.metrics.generation_tokens_input += input_tokens
-        self.metrics.generation_tokens_output += output_tokens
-        self.metrics.generation_tokens_total += (input_tokens + output_tokens)
+    def visit_path(self, path: str, path_item: Any) -> None:
+        """Called for every entry of the enhanced spec's ``paths``."""
 
-    def add_validation_tokens(self, input_tokens: int, output_tokens: int) -> None:
-        """Add token usage from validation phase."""
-        self.metrics.validation_tokens_input += input_tokens
-        self.metrics.validation_tokens_output += output_tokens
-        self.metrics.validation_tokens_total += (input_tokens + output_tokens)
+    def visit_operation(self, operation: Operation) -> None:
+        """Called for every operation with a method in ``VALIDATED_METHODS``."""
 
-    def extract_token_usage(self, llm_response) -> Tuple[int, int]:
-        """
-        Extract token usage from LLM response if available.
+    def visit_parameter(self, operation: Operation, param: Dict[str, Any]) -> None:
+        """Called for every parameter declared directly on a visited operation."""
 
-        Returns:
-            Tuple of (input_tokens, output_tokens)
-        """
-        try:
-            # Try to extract tokens from response metadata
-            if hasattr(llm_response, 'usage_metadata'):
-                usage = llm_response.usage_metadata
-                input_tokens = getattr(usage, 'input_tokens', 0)
-                output_tokens = getattr(usage, 'output_tokens', 0)
-                return input_tokens, output_tokens
+    @abstractmethod
+    def finish(self) -> ValidationResult:
+        """Called once after the walk; returns the rule's result."""
 
-            # Try alternative attribute names
-            elif hasattr(llm_response, 'token_usage'):
-                usage = llm_response.token_usage
-                input_tokens = getattr(usage, 'prompt_tokens', 0)
-                output_tokens = getattr(usage, 'completion_tokens', 0)
-                return input_tokens, output_tokens
 
-            # Try response_metadata
-            elif hasattr(llm_response, 'response_metadata'):
-                metadata = llm_response.response_metadata
-                if 'token_usage' in metadata:
-                    usage = metadata['token_usage']
-                    input_tokens = usage.get('prompt_tokens', 0)
-                    output_tokens = usage.get('completion_tokens', 0)
-                    return input_tokens, output_tokens
+class SwaggerConversionRule(ValidationRule):
+    """Swagger 2.0 to OpenAPI 3.x conversion (document level only)."""
 
-            # Estimate tokens based on content length (rough approximation)
-            content = getattr(llm_response, 'content', '')
-            estimated_output = len(content.split()) // 0.75  # Rough token estimate
-            return 0, int(estimated_output)
-
-        except Exception as e:
-            logger.debug(f"Could not extract token usage: {e}")
-            return 0, 0
+    name = 'swagger_conversion'
 
-    def validate_swagger_conversion(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> ValidationResult:
-        """
-        Validate Swagger 2.0 to OpenAPI 3.x conversion according to ADR-005.
+    def start(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> None:
+        self.original_spec = original_spec
+        self.enhanced_spec = enhanced_spec
 
-        Checks:
-        - Proper version conversion (swagger: 2.0 → openapi: 3.x)
-        - Schema structure compliance
-        - Reference path updates
-        """
+    def finish(self) -> ValidationResult:
+        original_spec, enhanced_spec = self.original_spec, self.enhanced_spec
         errors = []
         warnings = []
         score = 0.0
@@ -196,7 +155,7 @@ class OpenAPIValidator:
             else:
                 score += 15.0  # 15% each for required fields
 
-        passed = len(errors) == 0 and score >= self.adr_requirements['conversion_success_rate']
+        passed = len(errors) == 0 and score >= self.validator.adr_requirements['conversion_success_rate']
 
         return ValidationResult(
             passed=passed,
@@ -211,57 +170,59 @@ class OpenAPIValidator:
             warnings=warnings
         )
 
-    def validate_parameter_schemas(self, enhanced_spec: Dict[str, Any]) -> ValidationResult:
-        """
-        Validate that all parameters have proper schemas according to OpenAPI 3.x.
 
-        ADR Requirement: 100% of parameters have valid schemas
-        """
-        errors = []
-        warnings = []
-        total_params = 0
-        invalid_params = 0
-
-        paths = enhanced_spec.get('paths', {})
-
-        for path, path_obj in paths.items():
-            for method, operation in path_obj.items():
-                if method.lower() in ['get', 'post', 'put', 'patch', 'delete', 'options', 'head']:
-                    parameters = operation.get('parameters', [])
-
-                    for param in parameters:
-                        total_params += 1
-                        param_name = param.get('name', f'param_{total_params}')
-
-                        # Check for required schema or content field
-                        has_schema = 'schema' in param
-                        has_content = 'content' in param
-                        has_type_directly = 'type' in param  # Old Swagger 2.0 style
-
-                        if not (has_schema or has_content):
-                            if has_type_directly:
-                                warnings.append(f"Parameter '{param_name}' in {method.upper()} {path} uses direct 'type' (Swagger 2.0 style)")
-                            else:
-                                errors.append(f"Parameter '{param_name}' in {method.upper()} {path} missing schema/content")
-                                invalid_params += 1
-
-                        # Validate schema structure if present
-                        if has_schema:
-                            schema = param['schema']
-                            if not isinstance(schema, dict) or 'type' not in schema:
-                                errors.append(f"Invalid schema for parameter '{param_name}' in {method.upper()} {path}")
-                                invalid_params += 1
+class ParameterSchemaRule(ValidationRule):
+    """
+    Every parameter has a proper OpenAPI 3.x schema.
+
+    ADR Requirement: 100% of parameters have valid schemas
+    """
+
+    name = 'parameter_schemas'
+
+    def start(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> None:
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.total_params = 0
+        self.invalid_params = 0
+
+    def visit_parameter(self, operation: Operation, param: Dict[str, Any]) -> None:
+        self.total_params += 1
+        method, path = operation.method, operation.path
+        param_name = param.get('name', f'param_{self.total_params}')
+
+        # Check for required schema or content field
+        has_schema = 'schema' in param
+        has_content = 'content' in param
+        has_type_directly = 'type' in param  # Old Swagger 2.0 style
+
+        if not (has_schema or has_content):
+            if has_type_directly:
+                self.warnings.append(f"Parameter '{param_name}' in {method.upper()} {path} uses direct 'type' (Swagger 2.0 style)")
+            else:
+                self.errors.append(f"Parameter '{param_name}' in {method.upper()} {path} missing schema/content")
+                self.invalid_params += 1
+
+        # Validate schema structure if present
+        if has_schema:
+            schema = param['schema']
+            if not isinstance(schema, dict) or 'type' not in schema:
+                self.errors.append(f"Invalid schema for parameter '{param_name}' in {method.upper()} {path}")
+                self.invalid_params += 1
+
+    def finish(self) -> ValidationResult:
+        total_params, invalid_params = self.total_params, self.invalid_params
+        valid_params = total_params - invalid_params
 
         # Calculate score based on ADR requirement (100% valid schemas)
         if total_params > 0:
-            valid_params = total_params - invalid_params
             score = (valid_params / total_params) * 100.0
         else:
             score = 100.0  # No parameters to validate
 
-        passed = score >= self.adr_requirements['parameter_fix_rate']
+        passed = score >= self.validator.adr_requirements['parameter_fix_rate']
 
-        self.metrics.parameters_fixed = total_params - invalid_params
+        self.validator.metrics.parameters_fixed = valid_params
 
         return ValidationResult(
             passed=passed,
@@ -272,50 +233,45 @@ class OpenAPIValidator:
                 'valid_parameters': valid_params,
                 'invalid_parameters': invalid_params,
             },
-            errors=errors,
-            warnings=warnings
+            errors=self.errors,
+            warnings=self.warnings
         )
 
-    def validate_body_parameter_conversion(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> ValidationResult:
-        """
-        Validate that all Swagger 2.0 body parameters were properly converted to requestBody.
 
-        ADR Requirement: 100% converted to proper requestBody
-        """
-        errors = []
-        warnings = []
+class BodyParameterConversionRule(ValidationRule):
+    """
+    Every Swagger 2.0 body parameter was converted to a requestBody.
+
+    ADR Requirement: 100% converted to proper requestBody
+    """
+
+    name = 'body_parameter_conversion'
+
+    def start(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> None:
+        self.errors: List[str] = []
+        self.remaining_body_params = 0
+        self.converted_to_request_body = 0
 
         # Count body parameters in original spec
-        original_body_params = 0
-        remaining_body_params = 0
-        converted_to_request_body = 0
-
-        original_paths = original_spec.get('paths', {})
-        enhanced_paths = enhanced_spec.get('paths', {})
-
-        # Count original body parameters
-        for path, path_obj in original_paths.items():
-            for method, operation in path_obj.items():
-                if method.lower() in ['post', 'put', 'patch']:  # Methods that can have body
-                    parameters = operation.get('parameters', [])
-                    body_params = [p for p in parameters if p.get('in') == 'body']
-                    original_body_params += len(body_params)
-
-        # Check enhanced spec for remaining body parameters (should be 0)
-        for path, path_obj in enhanced_paths.items():
-            for method, operation in path_obj.items():
-                if method.lower() in ['get', 'post', 'put', 'patch', 'delete', 'options', 'head']:
-                    parameters = operation.get('parameters', [])
-                    body_params = [p for p in parameters if p.get('in') == 'body']
-                    remaining_body_params += len(body_params)
-
-                    if body_params:
-                        for param in body_params:
-                            errors.append(f"Body parameter '{param.get('name', 'unknown')}' not converted in {method.upper()} {path}")
-
-                    # Check if requestBody exists for operations that had body params
-                    if method.lower() in ['post', 'put', 'patch'] and 'requestBody' in operation:
-                        converted_to_request_body += 1
+        self.original_body_params = 0
+        for operation in SpecIR(original_spec).operations:
+            if operation.method in ['post', 'put', 'patch']:  # Methods that can have body
+                parameters = operation.raw.get('parameters', [])
+                self.original_body_params += sum(1 for p in parameters if p.get('in') == 'body')
+
+    def visit_operation(self, operation: Operation) -> None:
+        # Check if requestBody exists for operations that had body params
+        if operation.method in ['post', 'put', 'patch'] and 'requestBody' in operation.raw:
+            self.converted_to_request_body += 1
+
+    def visit_parameter(self, operation: Operation, param: Dict[str, Any]) -> None:
+        # Body parameters remaining in the enhanced spec were not converted
+        if param.get('in') == 'body':
+            self.remaining_body_params += 1
+            self.errors.append(f"Body parameter '{param.get('name', 'unknown')}' not converted in {operation.method.upper()} {operation.path}")
+
+    def finish(self) -> ValidationResult:
+        original_body_params, remaining_body_params = self.original_body_params, self.remaining_body_params
 
         # Calculate conversion success rate
         if original_body_params > 0:
@@ -324,9 +280,9 @@ class OpenAPIValidator:
         else:
             score = 100.0  # No body parameters to convert
 
-        passed = remaining_body_params == 0 and score >= self.adr_requirements['body_param_conversion_rate']
+        passed = remaining_body_params == 0 and score >= self.validator.adr_requirements['body_param_conversion_rate']
 
-        self.metrics.body_params_converted = original_body_params - remaining_body_params
+        self.validator.metrics.body_params_converted = original_body_params - remaining_body_params
 
         return ValidationResult(
             passed=passed,
@@ -336,16 +292,53 @@ class OpenAPIValidator:
                 'original_body_params': original_body_params,
                 'remaining_body_params': remaining_body_params,
                 'converted_body_params': original_body_params - remaining_body_params,
-                'operations_with_request_body': converted_to_request_body,
+                'operations_with_request_body': self.converted_to_request_body,
             },
-            errors=errors,
-            warnings=warnings
+            errors=self.errors,
+            warnings=[]
         )
 
-    def validate_openapi_compliance(self, enhanced_spec: Dict[str, Any]) -> ValidationResult:
-        """
-        Validate overall OpenAPI 3.x compliance of enhanced specification.
-        """
+
+class OpenAPIComplianceRule(ValidationRule):
+    """
+    Overall OpenAPI 3.x compliance of the enhanced specification.
+
+    Every path, operation and parameter is checked; operations without
+    ``responses`` and parameters without ``name``/``in`` are reported as warnings.
+    """
+
+    name = 'openapi_compliance'
+
+    def start(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> None:
+        self.enhanced_spec = enhanced_spec
+        self.warnings: List[str] = []
+        self.total_operations = 0
+        self.valid_operations = 0
+        self.operations_checked = 0
+        self.parameters_checked = 0
+
+    def visit_path(self, path: str, path_item: Any) -> None:
+        if not isinstance(path_item, dict):
+            self.warnings.append(f"Path item for {path} is not an object")
+            return
+        for method, operation in path_item.items():
+            if method.lower() in ['get', 'post', 'put', 'patch', 'delete']:
+                self.total_operations += 1
+                if isinstance(operation, dict):
+                    self.valid_operations += 1
+
+    def visit_operation(self, operation: Operation) -> None:
+        self.operations_checked += 1
+        if 'responses' not in operation.raw:
+            self.warnings.append(f"Operation {operation.method.upper()} {operation.path} has no responses")
+
+    def visit_parameter(self, operation: Operation, param: Dict[str, Any]) -> None:
+        self.parameters_checked += 1
+        if '$ref' not in param and not ('name' in param and 'in' in param):
+            self.warnings.append(f"Parameter in {operation.method.upper()} {operation.path} missing 'name' or 'in'")
+
+    def finish(self) -> ValidationResult:
+        enhanced_spec = self.enhanced_spec
         errors = []
         warnings = []
         score = 0.0
@@ -376,23 +369,12 @@ class OpenAPIValidator:
             paths = enhanced_spec['paths']
             if isinstance(paths, dict) and len(paths) > 0:
                 score += 10.0
-
-                # Sample validation of a few operations
-                valid_operations = 0
-                total_operations = 0
-
-                for path, path_obj in list(paths.items())[:5]:  # Sample first 5 paths
-                    for method, operation in path_obj.items():
-                        if method.lower() in ['get', 'post', 'put', 'patch', 'delete']:
-                            total_operations += 1
-                            if isinstance(operation, dict):
-                                valid_operations += 1
-
-                if total_operations > 0 and (valid_operations / total_operations) > 0.8:
+                if self.total_operations > 0 and (self.valid_operations / self.total_operations) > 0.8:
                     score += 10.0
             else:
                 warnings.append("Paths object is empty or invalid")
 
+        warnings.extend(self.warnings)
         passed = len(errors) == 0 and score >= 80.0
 
         return ValidationResult(
@@ -403,11 +385,216 @@ class OpenAPIValidator:
                 'openapi_version': enhanced_spec.get('openapi'),
                 'paths_count': len(enhanced_spec.get('paths', {})),
                 'has_components': 'components' in enhanced_spec,
+                'operations_checked': self.operations_checked,
+                'parameters_checked': self.parameters_checked,
             },
             errors=errors,
             warnings=warnings
         )
 
+
+class ValidationEngine:
+    """
+    Runs validation rules in a single walk over the enhanced spec.
+
+    Every path, operation and parameter is visited once and handed to each
+    rule that overrides the matching hook. The time spent in each rule's
+    hooks is recorded in ``timings`` (seconds, keyed by rule name).
+    """
+
+    def __init__(self, rules: List[ValidationRule]):
+        self.rules = list(rules)
+        self.timings: Dict[str, float] = {}
+
+    def _hooks(self, hook: str) -> List[Tuple[str, Any]]:
+        base = getattr(ValidationRule, hook)
+        return [(rule.name, getattr(rule, hook)) for rule in self.rules if getattr(type(rule), hook) is not base]
+
+    def run(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> Dict[str, ValidationResult]:
+        clock = time.perf_counter
+        timings = {rule.name: 0.0 for rule in self.rules}
+
+        for rule in self.rules:
+            started = clock()
+            rule.start(original_spec, enhanced_spec)
+            timings[rule.name] += clock() - started
+
+        path_hooks = self._hooks('visit_path')
+        operation_hooks = self._hooks('visit_operation')
+        parameter_hooks = self._hooks('visit_parameter')
+
+        paths = enhanced_spec.get('paths')
+        if path_hooks and isinstance(paths, dict):
+            for path, path_item in paths.items():
+                for name, hook in path_hooks:
+                    started = clock()
+                    hook(path, path_item)
+                    timings[name] += clock() - started
+
+        if (operation_hooks or parameter_hooks) and isinstance(paths, dict):
+            for operation in SpecIR(enhanced_spec).operations:
+                if operation.method not in VALIDATED_METHODS:
+                    continue
+                for name, hook in operation_hooks:
+                    started = clock()
+                    hook(operation)
+                    timings[name] += clock() - started
+                if not parameter_hooks:
+                    continue
+                for param in operation.raw.get('parameters', []):
+                    for name, hook in parameter_hooks:
+                        started = clock()
+                        hook(operation, param)
+                        timings[name] += clock() - started
+
+        results = {}
+        for rule in self.rules:
+            started = clock()
+            results[rule.name] = rule.finish()
+            timings[rule.name] += clock() - started
+
+        self.timings = timings
+        return results
+
+
+class OpenAPIValidator:
+    """
+    Comprehensive OpenAPI validation suite ensuring ADR-005 compliance.
+    """
+
+    def __init__(self):
+        self.metrics = EnhancementMetrics()
+        # Token counts are added from concurrent LLM worker threads
+        self._token_lock = threading.Lock()
+        self.adr_requirements = {
+            'conversion_success_rate': 95.0,  # >95%
+            'parameter_fix_rate': 100.0,      # 100%
+            'body_param_conversion_rate': 100.0,  # 100%
+            'llm_accuracy': 90.0,             # >90%
+            'performance_increase_limit': 25.0,  # <25%
+        }
+
+    def start_validation_session(self, original_spec_path: str) -> None:
+        """Start a validation session with baseline metrics."""
+        self.metrics.start_time = time.time()
+        if Path(original_spec_path).exists():
+            self.metrics.original_size = Path(original_spec_path).stat().st_size
+        logger.info("🔍 Starting validation session")
+
+    def end_validation_session(self, enhanced_spec_path: str = None, enhanced_spec: Optional[Dict[str, Any]] = None) -> None:
+        """
+        End validation session and calculate final metrics.
+
+        The enhanced size is taken from ``enhanced_spec_path`` if it exists, otherwise
+        from ``enhanced_spec`` serialized as the pipeline would save it (indented JSON).
+        """
+        self.metrics.end_time = time.time()
+        if enhanced_spec_path and Path(enhanced_spec_path).exists():
+            self.metrics.enhanced_size = Path(enhanced_spec_path).stat().st_size
+        elif enhanced_spec is not None:
+            self.metrics.enhanced_size = len(json.dumps(enhanced_spec, indent=2).encode('utf-8'))
+
+        # Calculate total tokens
+        self.metrics.total_tokens_used = (
+            self.metrics.generation_tokens_total +
+            self.metrics.validation_tokens_total
+        )
+
+        logger.info("✅ Validation session completed")
+
+    def add_generation_tokens(self, input_tokens: int, output_tokens: int) -> None:
+        """Add token usage from generation phase."""
+        with self._token_lock:
+            self.metrics.generation_tokens_input += input_tokens
+            self.metrics.generation_tokens_output += output_tokens
+            self.metrics.generation_tokens_total += (input_tokens + output_tokens)
+
+    def add_validation_tokens(self, input_tokens: int, output_tokens: int) -> None:
+        """Add token usage from validation phase."""
+        with self._token_lock:
+            self.metrics.validation_tokens_input += input_tokens
+            self.metrics.validation_tokens_output += output_tokens
+            self.metrics.validation_tokens_total += (input_tokens + output_tokens)
+
+    def extract_token_usage(self, llm_response) -> Tuple[int, int]:
+        """
+        Extract token usage from LLM response if available.
+
+        Returns:
+            Tuple of (input_tokens, output_tokens)
+        """
+        try:
+            # Try to extract tokens from response metadata
+            if hasattr(llm_response, 'usage_metadata'):
+                usage = llm_response.usage_metadata
+                input_tokens = getattr(usage, 'input_tokens', 0)
+                output_tokens = getattr(usage, 'output_tokens', 0)
+                return input_tokens, output_tokens
+
+            # Try alternative attribute names
+            elif hasattr(llm_response, 'token_usage'):
+                usage = llm_response.token_usage
+                input_tokens = getattr(usage, 'prompt_tokens', 0)
+                output_tokens = getattr(usage, 'completion_tokens', 0)
+                return input_tokens, output_tokens
+
+            # Try response_metadata
+            elif hasattr(llm_response, 'response_metadata'):
+                metadata = llm_response.response_metadata
+                if 'token_usage' in metadata:
+                    usage = metadata['token_usage']
+                    input_tokens = usage.get('prompt_tokens', 0)
+                    output_tokens = usage.get('completion_tokens', 0)
+                    return input_tokens, output_tokens
+
+            # Estimate tokens based on content length (rough approximation)
+            content = getattr(llm_response, 'content', '')
+            estimated_output = len(content.split()) // 0.75  # Rough token estimate
+            return 0, int(estimated_output)
+
+        except Exception as e:
+            logger.debug(f"Could not extract token usage: {e}")
+            return 0, 0
+
+    def _run_rules(self, rules: List[ValidationRule], original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> Dict[str, ValidationResult]:
+        engine = ValidationEngine(rules)
+        results = engine.run(original_spec, enhanced_spec)
+        self.metrics.rule_timings.update(engine.timings)
+        return results
+
+    def validate_swagger_conversion(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> ValidationResult:
+        """
+        Validate Swagger 2.0 to OpenAPI 3.x conversion according to ADR-005.
+
+        Checks:
+        - Proper version conversion (swagger: 2.0 → openapi: 3.x)
+        - Schema structure compliance
+        - Reference path updates
+        """
+        return self._run_rules([SwaggerConversionRule(self)], original_spec, enhanced_spec)[SwaggerConversionRule.name]
+
+    def validate_parameter_schemas(self, enhanced_spec: Dict[str, Any]) -> ValidationResult:
+        """
+        Validate that all parameters have proper schemas according to OpenAPI 3.x.
+
+        ADR Requirement: 100% of parameters have valid schemas
+        """
+        return self._run_rules([ParameterSchemaRule(self)], {}, enhanced_spec)[ParameterSchemaRule.name]
+
+    def validate_body_parameter_conversion(self, original_spec: Dict[str, Any], enhanced_spec: Dict[str, Any]) -> ValidationResult:
+        """
+        Validate that all Swagger 2.0 body parameters were properly converted to requestBody.
+
+        ADR Requirement: 100% converted to proper requestBody
+        """
+        return self._run_rules([BodyParameterConversionRule(self)], original_spec, enhanced_spec)[BodyParameterConversionRule.name]
+
+    def validate_openapi_compliance(self, enhanced_spec: Dict[str, Any]) -> ValidationResult:
+        """
+        Validate overall OpenAPI 3.x compliance of enhanced specification.
+        """
+        return self._run_rules([OpenAPIComplianceRule(self)], {}, enhanced_spec)[OpenAPIComplianceRule.name]
+
     def validate_performance_metrics(self, baseline_time: float = None) -> ValidationResult:
         """
         Validate performance metrics against ADR requirements.
@@ -450,23 +637,21 @@ class OpenAPIValidator:
         """
         Run complete validation suite according to ADR-005 requirements.
 
+        The spec checks run in a single pass over the enhanced spec (see
+        :class:`ValidationEngine`); the time spent in each is recorded in
+        ``metrics.rule_timings``.
+
         Returns dictionary of validation results for each check.
         """
         logger.info("🧪 Running full ADR-005 compliance validation suite")
 
-        results = {}
-
-        # 1. Swagger conversion validation
-        results['swagger_conversion'] = self.validate_swagger_conversion(original_spec, enhanced_spec)
-
-        # 2. Parameter schema validation
-        results['parameter_schemas'] = self.validate_parameter_schemas(enhanced_spec)
-
-        # 3. Body parameter conversion validation
-        results['body_parameter_conversion'] = self.validate_body_parameter_conversion(original_spec, enhanced_spec)
-
-        # 4. OpenAPI compliance validation
-        results['openapi_compliance'] = self.validate_openapi_compliance(enhanced_spec)
+        # 1-4. Swagger conversion, parameter schemas, body parameter conversion and OpenAPI compliance
+        results = self._run_rules([
+            SwaggerConversionRule(self),
+            ParameterSchemaRule(self),
+            BodyParameterConversionRule(self),
+            OpenAPIComplianceRule(self),
+        ], original_spec, enhanced_spec)
 
         # 5. Performance validation (if metrics available)
         results['performance'] = self.validate_performance_metrics()
@@ -570,6 +755,12 @@ class OpenAPIValidator:
                 ""
             ])
 
+            if self.metrics.rule_timings:
+                report_lines.append("⏱️  Validation Rule Timing:")
+                for rule_name, seconds in self.metrics.rule_timings.items():
+                    report_lines.append(f"   • {rule_name.replace('_', ' ').title()}: {seconds * 1000:.1f}ms")
+                report_lines.append("")
+
             # Show LLM token usage if any tokens were used
             if self.metrics.total_tokens_used > 0:
                 report_lines.extend([
@@ -687,13 +878,7 @@ class OpenAPIValidator:
 def load_spec_file(file_path: str) -> Dict[str, Any]:
     """Load an OpenAPI specification from JSON or YAML file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            if file_path.endswith('.json'):
-                return json.load(f)
-            else:
-                from ruamel.yaml import YAML
-                yaml = YAML(typ='safe', pure=True)
-                return yaml.load(f)
+        return load_spec(file_path)
     except Exception as e:
         logger.error(f"Failed to load spec file {file_path}: {e}")
         return {}
@@ -44,6 +44,11 @@ def setup_env():
     }
     shutil.rmtree(output_dir)
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(monkeypatch, tmp_path):
+    """Point the on-disk caches (specs, Jinja bytecode, LLM responses, ...) at a per-test directory."""
+    monkeypatch.setenv("OPENAPI_MCP_CODEGEN_CACHE_DIR", str(tmp_path / "cache"))
+
 def test_generator_init(setup_env):
     gen = MCPGenerator(**setup_env)
     assert "info" in gen.spec
@@ -82,6 +87,56 @@ def test_resolve_ref(setup_env):
     assert resolved.get("type") == "object"
     assert "properties" in resolved
 
+def test_resolve_ref_escaping_and_cycles(setup_env):
+    from openapi_mcp_codegen.ref_resolver import RECURSIVE_REF
+    gen = MCPGenerator(**setup_env)
+    gen.spec = {
+        "paths": {"/pets/{id}": {"get": {"parameters": [{"name": "id", "in": "path"}]}}},
+        "components": {
+            "schemas": {
+                "a/b~c": {"type": "integer"},
+                "Alias": {"$ref": "#/components/schemas/Node"},
+                "Loop": {"$ref": "#/components/schemas/Loop"},
+                "Node": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "parent": {"$ref": "#/components/schemas/Node"},
+                        "children": {"type": "array", "items": {"$ref": "#/components/schemas/Alias"}},
+                    },
+                },
+            }
+        },
+    }
+    assert gen._resolve_ref("#/components/schemas/a~1b~0c") == {"type": "integer"}
+    assert gen._resolve_ref("#/paths/~1pets~1%7Bid%7D/get/parameters/0")["name"] == "id"
+    assert gen._resolve_ref("#/components/schemas/Alias") is gen.spec["components"]["schemas"]["Node"]
+    assert gen._resolve_ref("#/components/schemas/Loop") is RECURSIVE_REF
+    assert gen._resolve_ref("#/components/schemas/Missing") == {}
+
+    params = dict(gen._extract_body_params({"$ref": "#/components/schemas/Node"}, prefix="body"))
+    assert set(params) == {
+        "body_name: str = None",
+        "body_parent: Dict[str, Any] = None",
+        "body_children: List[Dict[str, Any]] = None",
+    }
+
+def test_extract_body_params_cached_across_operations(monkeypatch, setup_env):
+    gen = MCPGenerator(**setup_env)
+    calls = []
+    original = MCPGenerator._flatten_body_schema
+    def counting(self, schema, prefix, max_params, _seen):
+        calls.append(prefix)
+        return original(self, schema, prefix, max_params, _seen)
+    monkeypatch.setattr(MCPGenerator, "_flatten_body_schema", counting)
+
+    first = gen._extract_body_params({"$ref": "#/components/schemas/Pet"}, prefix="body")
+    second = gen._extract_body_params({"$ref": "#/components/schemas/Pet"}, prefix="body")
+    assert first == second
+    assert calls.count("body") == 1
+    gen._extract_body_params({"$ref": "#/components/schemas/Pet"}, prefix="other")
+    assert calls.count("other") == 1
+
 def test_extract_body_params_simple(setup_env):
     gen = MCPGenerator(**setup_env)
     schema = {
@@ -152,6 +207,83 @@ def test_run_ruff_lint(monkeypatch, setup_env):
     # Verify that at least one call to "ruff" was made.
     assert any("ruff" in arg for call in calls for arg in call)
 
+def test_ruff_runs_once_per_generation(monkeypatch, setup_env):
+    calls = []
+    monkeypatch.setattr(MCPGenerator, "run_ruff_lint", lambda self, *files: calls.append(files))
+
+    gen = MCPGenerator(**setup_env)
+    gen.generate_model_base()
+    gen.generate_models()
+    gen.generate_tool_modules()
+    assert calls == []
+    assert gen.format_generated_files() > 1
+    assert len(calls) == 1
+    assert all(f.endswith(".py") for f in calls[0])
+
+    # A second run over an unchanged output directory rewrites and formats nothing.
+    gen2 = MCPGenerator(**setup_env)
+    gen2.generate_model_base()
+    gen2.generate_models()
+    gen2.generate_tool_modules()
+    assert gen2.format_generated_files() == 0
+    assert len(calls) == 1
+
+def test_format_cache_keyed_by_derivation_variant(tmp_path):
+    from openapi_mcp_codegen.formatter import RuffFormatter
+    path = str(tmp_path / "module.py")
+    formatter = RuffFormatter(str(tmp_path))
+    assert formatter.write(path, "derived = 1\n", source="rendered = 1\n", variant="enhance")
+    formatter.flush(lambda *files: None)
+
+    formatter = RuffFormatter(str(tmp_path))
+    assert formatter.is_unchanged(path, "rendered = 1\n", variant="enhance")
+    # Without the derivation (or with other settings) the derived file is rewritten
+    assert not formatter.is_unchanged(path, "rendered = 1\n")
+    assert not formatter.is_unchanged(path, "rendered = 1\n", variant="enhance+openapi")
+    assert formatter.write(path, "rendered = 1\n")
+    assert (tmp_path / "module.py").read_text() == "rendered = 1\n"
+
+    # Files never queued for Ruff are recorded by the hash of what was written
+    other = str(tmp_path / "other.py")
+    formatter.write(other, "other = 1\n", variant="enhance")
+    formatter.flush(lambda *files: None)
+    assert RuffFormatter(str(tmp_path)).is_unchanged(other, "other = 1\n", variant="enhance")
+
+def test_incremental_regeneration(monkeypatch, tmp_path, setup_env):
+    import json
+    monkeypatch.setattr(MCPGenerator, "run_ruff_lint", lambda self, *files: None)
+    monkeypatch.setattr(MCPGenerator, "_run_function_validation", lambda self: None)
+    spec_path = tmp_path / "openapi_petstore.json"
+    shutil.copy(setup_env["spec_path"], spec_path)
+    shutil.copy(setup_env["config_path"], tmp_path / "config.yaml")
+    out = tmp_path / "out"
+    cfg = {**setup_env, "spec_path": str(spec_path), "config_path": str(tmp_path / "config.yaml"), "output_dir": str(out)}
+
+    MCPGenerator(**cfg).generate()
+    tools_dir = out / "mcp_petstore" / "tools"
+    assert (tools_dir / "pet_findbystatus.py").exists()
+    assert (tools_dir / "store_inventory.py").exists()
+
+    spec = json.loads(spec_path.read_text())
+    del spec["paths"]["/store/inventory"]
+    spec["paths"]["/pet/findByStatus"]["get"]["summary"] = "Finds pets by status (changed)"
+    spec_path.write_text(json.dumps(spec))
+
+    rendered = []
+    original = MCPGenerator._write_rendered
+    def spy(self, output_path, content):
+        rendered.append(output_path)
+        return original(self, output_path, content)
+    monkeypatch.setattr(MCPGenerator, "_write_rendered", spy)
+    MCPGenerator(**cfg).generate()
+
+    tool_modules = {os.path.basename(p) for p in rendered if os.sep + "tools" + os.sep in p}
+    assert tool_modules == {"pet_findbystatus.py", "__init__.py"}
+    assert not any(os.sep + "models" + os.sep in p and not p.endswith(("base.py", "__init__.py")) for p in rendered)
+    assert not (tools_dir / "store_inventory.py").exists()
+    assert "changed" in (tools_dir / "pet_findbystatus.py").read_text()
+    assert "store_inventory" not in (out / "mcp_petstore" / "server.py").read_text()
+
 def test_get_python_type(setup_env):
     gen = MCPGenerator(**setup_env)
     assert gen._get_python_type({"type": "integer"}) == "int"
@@ -180,6 +312,8 @@ def test_generate_api_client(setup_env):
     gen = MCPGenerator(**setup_env)
     gen.generate_api_client()
     assert os.path.exists(os.path.join(gen.src_output_dir, "api", "client.py"))
+    with open(os.path.join(gen.src_output_dir, "api", "client.py"), encoding="utf-8") as f:
+        assert f.read().count("from typing import") == 1
 
 def test_generate_tool_modules(setup_env):
     gen = MCPGenerator(**setup_env)
@@ -371,3 +505,832 @@ def test_cli_accepts_enable_slim(monkeypatch, tmp_path):
     )
     # Ensure command exits cleanly
     assert result.exit_code == 0, result.output
+
+def test_api_client_reuses_pooled_client(setup_env, monkeypatch):
+    """
+    The generated API client keeps one pooled httpx client per event loop
+    and closes it through aclose_client().
+    """
+    import asyncio
+    import importlib.util
+
+    gen = MCPGenerator(**setup_env)
+    gen.generate_api_client()
+    prefix = gen.mcp_name.upper()
+    monkeypatch.setenv(f"{prefix}_API_URL", "http://localhost:1")
+    monkeypatch.setenv(f"{prefix}_TOKEN", "token")
+    monkeypatch.setenv(f"{prefix}_HTTP_MAX_CONNECTIONS", "7")
+
+    client_path = os.path.join(gen.src_output_dir, "api", "client.py")
+    spec = importlib.util.spec_from_file_location("generated_client", client_path)
+    client_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(client_module)
+    assert client_module.HTTP_MAX_CONNECTIONS == 7
+
+    async def exercise():
+        first = client_module.get_client()
+        second = client_module.get_client()
+        await client_module.aclose_client()
+        return first, second
+
+    first, second = asyncio.run(exercise())
+    assert first is second
+    assert first.is_closed
+    other, _ = asyncio.run(exercise())
+    assert other is not first
+
+def test_server_lifespan_keeps_pool_open_for_other_sessions(monkeypatch, tmp_path, setup_env):
+    import asyncio
+    import importlib
+    import sys
+    monkeypatch.setenv("PETSTORE_API_URL", "http://localhost:1")
+    monkeypatch.setenv("PETSTORE_TOKEN", "token")
+    out = tmp_path / "out"
+    gen = MCPGenerator(**{**setup_env, "output_dir": str(out)})
+    gen.generate_api_client()
+    gen.generate_tool_modules()
+    gen.generate_server()
+    for name in [name for name in sys.modules if name.split(".")[0] == "mcp_petstore"]:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(out))
+    server = importlib.import_module("mcp_petstore.server")
+    client = importlib.import_module("mcp_petstore.api.client")
+
+    async def sessions():
+        async with server.lifespan(None):
+            async with server.lifespan(None):
+                pooled = client.get_client()
+            # The second session ended while the first one is still active
+            assert not pooled.is_closed
+        return pooled
+
+    assert asyncio.run(sessions()).is_closed
+
+def test_spec_loader_shares_and_caches_documents(monkeypatch, tmp_path):
+    from openapi_mcp_codegen import spec_loader
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text("openapi: 3.0.0\ninfo:\n  title: Demo\n  version: 2024-01-01\npaths: {}\nx-mode: on\nx-flag: true\n")
+
+    first = spec_loader.load_spec(str(spec_file))
+    assert first is spec_loader.load_spec(str(spec_file))
+    assert first["x-mode"] == "on" and first["x-flag"] is True
+    assert first["info"]["version"] == "2024-01-01"
+
+    private = spec_loader.load_spec(str(spec_file), copy=True)
+    private["info"]["title"] = "Changed"
+    assert first["info"]["title"] == "Demo"
+
+    # A fresh process reads the pickled document instead of parsing again
+    assert list((tmp_path / "cache" / "specs").glob("*.pickle"))
+    spec_loader.clear_memory_cache()
+    original_parse = spec_loader.parse_spec_bytes
+    monkeypatch.setattr(spec_loader, "parse_spec_bytes", lambda data, path: pytest.fail("spec was parsed again"))
+    assert spec_loader.load_spec(str(spec_file)) == first
+
+    # Pickles are only loaded from a private directory, from entries nobody else can write
+    specs_dir = tmp_path / "cache" / "specs"
+    assert specs_dir.stat().st_mode & 0o777 == 0o700
+    entry = next(specs_dir.glob("*.pickle"))
+    assert entry.stat().st_mode & 0o777 == 0o600
+    parsed = []
+    monkeypatch.setattr(spec_loader, "parse_spec_bytes", lambda data, path: parsed.append(path) or original_parse(data, path))
+    entry.chmod(0o666)
+    spec_loader.clear_memory_cache()
+    assert spec_loader.load_spec(str(spec_file)) == first and len(parsed) == 1
+    # An own directory is made private again; one owned by another user is not used
+    specs_dir.chmod(0o777)
+    spec_loader.clear_memory_cache()
+    assert spec_loader.load_spec(str(spec_file)) == first and len(parsed) == 1
+    assert specs_dir.stat().st_mode & 0o777 == 0o700
+    monkeypatch.setattr(os, "getuid", lambda: specs_dir.stat().st_uid + 1)
+    spec_loader.clear_memory_cache()
+    assert spec_loader.load_spec(str(spec_file)) == first and len(parsed) == 2
+
+def test_spec_ir_indexes_operations(setup_env):
+    import copy
+    from openapi_mcp_codegen.validators import OpenAPIValidator
+    gen = MCPGenerator(**setup_env)
+    ir = gen.ir
+    assert ir is gen.ir
+
+    op = ir.by_operation_id["findPetsByStatus"]
+    assert op.path == "/pet/findByStatus" and op.http_method == "GET"
+    assert op in ir.by_tag["pet"]
+    assert [o.method for o in ir.by_path["/pet/{petId}"]] == ["get", "post", "delete"]
+    assert {p.location for p in ir.by_operation_id["getPetById"].parameters} == {"path"}
+
+    params, _ = gen._operation_params(ir.by_operation_id["addPet"])
+    assert ir.by_operation_id["addPet"].body_fields
+    assert [f.signature for f in ir.by_operation_id["addPet"].body_fields] == params
+
+    # A spec modified in place (as the in-memory enhancer pipeline does) is never served a stale IR
+    spec = copy.deepcopy(gen.spec)
+    checked = OpenAPIValidator().validate_openapi_compliance(spec).details["operations_checked"]
+    spec["paths"]["/extra"] = {"get": {"responses": {"200": {}}}}
+    assert OpenAPIValidator().validate_openapi_compliance(spec).details["operations_checked"] == checked + 1
+    gen.spec = spec
+    assert "/extra" in gen.ir.by_path
+
+def test_parallel_rendering_matches_serial(tmp_path, setup_env):
+    outputs = {}
+    for jobs in (1, 2):
+        out = tmp_path / f"jobs{jobs}"
+        gen = MCPGenerator(**{**setup_env, "output_dir": str(out)}, jobs=jobs)
+        gen.generate_model_base()
+        gen.generate_models()
+        gen.generate_tool_modules()
+        gen.generate_server()
+        gen.close_render_pool()
+        src = out / "mcp_petstore"
+        outputs[jobs] = {
+            str(p.relative_to(src)): p.read_text()
+            for p in sorted(src.rglob("*.py"))
+        }
+        outputs[jobs]["tools_map"] = repr(gen.tools_map)
+    assert len(outputs[1]) > 5
+    assert outputs[1] == outputs[2]
+
+
+def test_template_env_shared_with_bytecode_cache(monkeypatch, tmp_path, setup_env):
+    from openapi_mcp_codegen import rendering
+    from openapi_mcp_codegen.a2a_agent_codegen import A2AAgentGenerator
+
+    monkeypatch.setattr(rendering, "_shared_envs", {})
+    gen = MCPGenerator(**setup_env)
+    agent_gen = A2AAgentGenerator(**{**setup_env, "output_dir": str(tmp_path / "agent")}, dry_run=True)
+    assert gen.env is agent_gen.env
+    gen.generate_model_base()
+
+    cached = list((tmp_path / "cache" / "jinja").glob("*.cache"))
+    assert cached
+    # A fresh environment (e.g. a new worker process) loads from the cache
+    env = rendering.create_template_env(gen.env.loader.searchpath[0])
+    assert env.get_template("models/base_model.tpl").render(**gen.get_file_header_kwargs())
+    assert sorted((tmp_path / "cache" / "jinja").glob("*.cache")) == sorted(cached)
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["openapi_mcp_codegen.__main__", "openapi_mcp_codegen.openapi_enhancer", "openapi_mcp_codegen.function_validator"],
+)
+def test_cli_cold_start_skips_llm_imports(module):
+    """
+    Non-LLM commands must not import the LLM stack (it takes seconds to import).
+    Uses ``-X importtime`` in a fresh interpreter to record every imported module.
+    """
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                timings[name.strip()] = int(cumulative)
+    assert module in timings
+    heavy = {"cnoe_agent_utils", "langchain_core", "langchain", "jsonpath_ng"}
+    assert not heavy & {name.split(".")[0] for name in timings}
+    # Generous budget (microseconds); eager LLM imports took several seconds
+    assert timings[module] < 2_000_000
+
+
+def test_llm_runner_retries_transient_errors_in_order(monkeypatch):
+    from openapi_mcp_codegen import llm_client
+
+    monkeypatch.setattr(llm_client.time, "sleep", lambda s: None)
+
+    class RateLimited(Exception):
+        status_code = 429
+
+    class FlakyLLM:
+        def __init__(self):
+            self.failures = {}
+
+        def invoke(self, messages):
+            if self.failures.setdefault(messages, 0) < 2:
+                self.failures[messages] += 1
+                raise RateLimited("slow down")
+            return messages.upper()
+
+    llm = FlakyLLM()
+    runner = llm_client.LLMRunner(llm, max_concurrency=4, requests_per_second=1000, max_retries=2)
+    items = [f"op{i}" for i in range(20)]
+    assert runner.map(runner.invoke, items) == [i.upper() for i in items]
+
+    # Non-transient errors are raised without retrying
+    class BrokenLLM:
+        calls = 0
+
+        def invoke(self, messages):
+            BrokenLLM.calls += 1
+            raise ValueError(messages)
+
+    with pytest.raises(ValueError):
+        llm_client.LLMRunner(BrokenLLM()).invoke("bad")
+    assert BrokenLLM.calls == 1
+    assert not llm_client.is_retryable_error(ValueError("no status"))
+
+
+def test_overlay_llm_calls_concurrent_and_ordered():
+    import random
+    import threading
+    import time
+    from types import SimpleNamespace
+    from openapi_mcp_codegen.openapi_enhancer import OpenAPIOverlayGenerator
+    from openapi_mcp_codegen.validators import OpenAPIValidator
+
+    spec_path = os.path.join(os.getcwd(), "examples", "petstore", "openapi_petstore.json")
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    class SlowLLM:
+        def invoke(self, messages):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(random.uniform(0, 0.02))
+            with lock:
+                in_flight["now"] -= 1
+            prompt = messages[1].content
+            return SimpleNamespace(content=f"desc {len(prompt)}", usage_metadata=SimpleNamespace(input_tokens=3, output_tokens=2))
+
+    overlays, validators = {}, {}
+    for concurrency in (1, 4):
+        gen = OpenAPIOverlayGenerator(spec_path, overlay_config={"use_llm": False, "llm_concurrency": concurrency})
+        gen.use_llm, gen.llm = True, SlowLLM()
+        gen.prompts = {"operation_description": {"system_prompt": "Describe.", "user_prompt_template": "{method} {path} {operation_id}"}}
+        validators[concurrency] = OpenAPIValidator()
+        overlays[concurrency] = gen.generate_overlay(validators[concurrency])
+
+    assert overlays[1] == overlays[4]
+    assert in_flight["max"] > 1
+    ops = validators[4].metrics.operations_processed
+    assert ops > 1
+    assert validators[4].metrics.generation_tokens_total == 5 * ops == validators[1].metrics.generation_tokens_total
+
+
+def test_overlay_llm_descriptions_cached(monkeypatch, tmp_path):
+    from types import SimpleNamespace
+    from openapi_mcp_codegen.llm_cache import LLMCache
+    from openapi_mcp_codegen.openapi_enhancer import OpenAPIOverlayGenerator
+
+    calls = []
+
+    class CountingLLM:
+        model_name = "dummy-1"
+
+        def invoke(self, messages):
+            calls.append(messages)
+            return SimpleNamespace(content=f"desc {len(calls)}")
+
+    monkeypatch.setattr("cnoe_agent_utils.LLMFactory", lambda: SimpleNamespace(get_llm=CountingLLM))
+    spec_path = os.path.join(os.getcwd(), "examples", "petstore", "openapi_petstore.json")
+
+    def run(**kwargs):
+        gen = OpenAPIOverlayGenerator(spec_path, use_llm=True, overlay_config={"llm_concurrency": 2}, **kwargs)
+        gen.prompts = {"operation_description": {"system_prompt": "Describe.", "user_prompt_template": "{method} {path}"}}
+        return gen.generate_overlay()
+
+    first = run()
+    n_ops = len(calls)
+    assert n_ops > 1
+    assert run() == first
+    assert len(calls) == n_ops
+    run(refresh_llm_cache=True)
+    assert len(calls) == 2 * n_ops
+    run(use_llm_cache=False)
+    assert len(calls) == 3 * n_ops
+
+    cache = LLMCache(path=str(tmp_path / "evict.sqlite3"), max_entries=2)
+    for i in range(3):
+        cache.put(LLMCache.make_key("m", str(i)), str(i))
+    cache.get(LLMCache.make_key("m", "0"))
+    cache.prune()
+    assert cache.get(LLMCache.make_key("m", "0")) == "0"
+    assert cache.get(LLMCache.make_key("m", "1")) is None
+
+
+def test_overlay_batched_llm_descriptions_with_fallback():
+    import json
+    import re
+    from types import SimpleNamespace
+    from openapi_mcp_codegen.openapi_enhancer import OpenAPIOverlayGenerator
+
+    spec_path = os.path.join(os.getcwd(), "examples", "petstore", "openapi_petstore.json")
+
+    class BatchLLM:
+        def __init__(self, malformed=False):
+            self.malformed = malformed
+            self.batch_calls = 0
+            self.single_calls = 0
+
+        def invoke(self, messages):
+            keys = re.findall(r"^### (.+)$", messages[1].content, re.MULTILINE)
+            if not keys:
+                self.single_calls += 1
+                return SimpleNamespace(content="single")
+            self.batch_calls += 1
+            if self.malformed:
+                return SimpleNamespace(content="Sure! Here are your descriptions.")
+            # The first operation of every batch is left out and must fall back
+            return SimpleNamespace(content="```json\n" + json.dumps({k: f"batch {k}" for k in keys[1:]}) + "\n```")
+
+    def run(llm):
+        gen = OpenAPIOverlayGenerator(spec_path, overlay_config={"use_llm": False, "llm_batch_size": 4, "llm_concurrency": 2})
+        gen.use_llm, gen.llm = True, llm
+        gen.prompts = {"operation_description": {"system_prompt": "Describe.", "user_prompt_template": "{method} {path}"}}
+        overlay = gen.generate_overlay()
+        return [a for a in overlay["actions"] if a["target"].endswith(".description") and "parameters" not in a["target"]]
+
+    llm = BatchLLM()
+    actions = run(llm)
+    n_ops = len(actions)
+    assert llm.batch_calls == -(-n_ops // 4)
+    assert llm.single_calls == llm.batch_calls
+    for action in actions:
+        path, method = re.match(r"\$\.paths\['(.+)'\]\.(\w+)\.description", action["target"]).groups()
+        assert action["update"] in ("single", f"batch {method.upper()} {path}")
+
+    llm = BatchLLM(malformed=True)
+    assert all(a["update"] == "single" for a in run(llm))
+    assert llm.single_calls == n_ops
+
+
+def test_overlay_applier_target_resolution(tmp_path):
+    import json
+    from openapi_mcp_codegen.openapi_enhancer import OverlayApplier, parse_simple_target
+
+    assert parse_simple_target("$.paths['/a/{x.y}'].get.parameters[1].description") == (
+        "paths", "/a/{x.y}", "get", "parameters", 1, "description")
+    assert parse_simple_target('$.paths["/a"].get.responses["200"]') == ("paths", "/a", "get", "responses", "200")
+    assert parse_simple_target("$.paths[*].get.description") is None
+    assert parse_simple_target("$..description") is None
+
+    spec = {"openapi": "3.0.0", "paths": {
+        "/apps/{app.metadata.name}": {"get": {"description": "old", "parameters": [{"name": "a"}, {"name": "b"}],
+                                              "responses": {"200": {"description": "ok"}}}},
+        "/other": {"get": {"description": "old"}, "post": {"description": "old"}},
+    }}
+    overlay = {"overlay": "1.0.0", "actions": [
+        {"target": "$.paths['/apps/{app.metadata.name}'].get.description", "update": "new"},
+        {"target": "$.paths['/apps/{app.metadata.name}'].get.parameters[1].description", "update": "param b"},
+        {"target": "$.paths['/apps/{app.metadata.name}'].get.responses['200'].description", "update": "done"},
+        {"target": "$.paths['/other'].get.summary", "update": "created"},
+        {"target": "$.paths['/other'].*.description", "update": "wildcard"},
+    ]}
+    (tmp_path / "spec.json").write_text(json.dumps(spec))
+    (tmp_path / "overlay.json").write_text(json.dumps(overlay))
+
+    result = OverlayApplier(str(tmp_path / "spec.json"), str(tmp_path / "overlay.json")).apply_overlay()
+    assert set(result["paths"]) == {"/apps/{app.metadata.name}", "/other"}
+    op = result["paths"]["/apps/{app.metadata.name}"]["get"]
+    assert op["description"] == "new"
+    assert op["parameters"] == [{"name": "a"}, {"name": "b", "description": "param b"}]
+    assert op["responses"] == {"200": {"description": "done"}}
+    assert result["paths"]["/other"] == {
+        "get": {"description": "wildcard", "summary": "created"}, "post": {"description": "wildcard"}}
+
+
+def test_enhance_pipeline_runs_in_memory(monkeypatch, tmp_path):
+    import json
+    import yaml
+    from openapi_mcp_codegen import openapi_enhancer
+    from openapi_mcp_codegen.openapi_enhancer import OpenAPIEnhancer
+
+    petstore = os.path.join(os.getcwd(), "examples", "petstore")
+    shutil.copy(os.path.join(petstore, "openapi_petstore.json"), tmp_path / "spec.json")
+    with open(os.path.join(petstore, "config.yaml")) as f:
+        config = yaml.safe_load(f)
+    config["overlay_enhancements"] = {"use_llm": False}
+    (tmp_path / "config.yaml").write_text(yaml.safe_dump(config))
+    monkeypatch.setattr(MCPGenerator, "run_ruff_lint", lambda self, *files: None)
+    monkeypatch.setattr(MCPGenerator, "_run_function_validation", lambda self: None)
+    # Only the source spec is loaded; the overlay and enhanced spec stay in memory
+    loaded = []
+    original_load_file = openapi_enhancer.OverlayApplier._load_file
+    monkeypatch.setattr(openapi_enhancer.OverlayApplier, "_load_file",
+                        lambda self, path: loaded.append(path) or original_load_file(self, path))
+
+    def run(out, **kwargs):
+        enhancer = OpenAPIEnhancer(str(tmp_path / "spec.json"), str(tmp_path / "config.yaml"))
+        assert enhancer.enhance_and_generate(str(out), **kwargs)
+        return (out / "mcp_petstore" / "tools" / "pet.py").read_text()
+
+    before = set(os.listdir(tmp_path))
+    in_memory = run(tmp_path / "out1")
+    assert set(os.listdir(tmp_path)) - before == {"out1", "Makefile", "spec-agentgateway.yaml"}
+    assert "Update or replace a pet" in in_memory
+    assert loaded == [str(tmp_path / "spec.json")]
+
+    saved = run(tmp_path / "out2", save_overlay=str(tmp_path / "overlay.yaml"),
+                save_enhanced_spec=str(tmp_path / "enhanced.json"))
+    assert saved == in_memory
+    enhanced = json.loads((tmp_path / "enhanced.json").read_text())
+    assert enhanced["paths"]["/pet"]["put"]["description"].startswith("Update or replace a pet")
+    assert yaml.safe_load((tmp_path / "overlay.yaml").read_text())["actions"]
+
+
+def test_validation_suite_single_pass_covers_every_operation(monkeypatch):
+    from openapi_mcp_codegen.validators import OpenAPIValidator, ValidationEngine, ValidationRule
+
+    swagger = {"swagger": "2.0", "paths": {"/a": {"post": {"parameters": [{"in": "body", "name": "b"}]}}}}
+    paths = {f"/p{i}": {"get": {"responses": {"200": {}}, "parameters": [
+        {"name": "q", "in": "query", "schema": {"type": "string"}}]}} for i in range(10)}
+    paths["/a"] = {"post": {"requestBody": {}, "responses": {"200": {}}}}
+    # Beyond the first 5 paths: only found by a full walk
+    paths["/p9"]["get"] = {"parameters": [{"name": "bad", "in": "query"}, {"schema": {"type": "string"}}]}
+    enhanced = {"openapi": "3.0.0", "info": {"title": "t", "version": "1"}, "servers": [{"url": "/"}], "paths": paths}
+
+    walks = []
+    original_run = ValidationEngine.run
+    monkeypatch.setattr(ValidationEngine, "run", lambda self, *a: walks.append(self) or original_run(self, *a))
+    validator = OpenAPIValidator()
+    results = validator.run_full_validation_suite(swagger, enhanced)
+    assert len(walks) == 1
+
+    compliance = results["openapi_compliance"]
+    assert compliance.details["operations_checked"] == 11
+    assert compliance.details["parameters_checked"] == 11
+    assert "Operation GET /p9 has no responses" in compliance.warnings
+    assert "Parameter in GET /p9 missing 'name' or 'in'" in compliance.warnings
+    assert results["parameter_schemas"].details["invalid_parameters"] == 1
+    assert results["body_parameter_conversion"].passed
+    assert validator.metrics.body_params_converted == 1
+
+    # The single-check methods run the same rules on their own
+    for name, check in [("parameter_schemas", lambda v: v.validate_parameter_schemas(enhanced)),
+                        ("openapi_compliance", lambda v: v.validate_openapi_compliance(enhanced)),
+                        ("body_parameter_conversion", lambda v: v.validate_body_parameter_conversion(swagger, enhanced))]:
+        assert check(OpenAPIValidator()) == results[name]
+
+    assert set(validator.metrics.rule_timings) == {
+        "swagger_conversion", "parameter_schemas", "body_parameter_conversion", "openapi_compliance"}
+    validator.metrics.start_time, validator.metrics.end_time = 1.0, 2.0
+    assert "Validation Rule Timing" in validator.generate_validation_report(results)
+
+    class UnfinishedRule(ValidationRule):
+        name = "unfinished"
+    with pytest.raises(TypeError):
+        UnfinishedRule(validator)
+
+
+def test_function_validator_reuses_generator_and_cached_parses(monkeypatch, tmp_path, setup_env):
+    from pathlib import Path
+    from openapi_mcp_codegen import function_validator
+    from openapi_mcp_codegen.function_validator import FunctionValidator
+
+    monkeypatch.setattr(MCPGenerator, "run_ruff_lint", lambda self, *files: None)
+    monkeypatch.setattr(MCPGenerator, "_run_function_validation", lambda self: None)
+    gen = MCPGenerator(**{**setup_env, "output_dir": str(tmp_path / "out")})
+    gen.generate()
+    project = Path(gen.src_output_dir)
+
+    parsed = []
+    original_parse = function_validator._parse_tool_file
+    monkeypatch.setattr(function_validator, "_parse_tool_file", lambda path: parsed.append(path) or original_parse(path))
+
+    def summary(result):
+        return (result.passed, result.total_functions, result.errors,
+                sorted((f.name, f.module_name) for f in result.unregistered_functions + result.naming_violations))
+
+    # In-process: the generator's function list is used and nothing is parsed
+    validator = FunctionValidator(tmp_path)
+    in_memory = validator.validate_project(project, tool_functions=gen.tools_map)
+    assert parsed == [] and validator._cache is None
+
+    from_files = FunctionValidator(tmp_path).validate_project(project)
+    assert summary(from_files) == summary(in_memory) and from_files.total_functions > 0
+    tool_files = len(parsed)
+
+    # Unchanged files come from the on-disk cache; a modified file is parsed again
+    parsed.clear()
+    assert summary(FunctionValidator(tmp_path).validate_project(project)) == summary(from_files)
+    assert parsed == []
+    changed = project / "tools" / "pet.py"
+    changed.write_text(changed.read_text() + "\n\nasync def post_pet_extra():\n    pass\n")
+    result = FunctionValidator(tmp_path).validate_project(project)
+    assert parsed == [str(changed)]
+    assert result.total_functions == from_files.total_functions + 1
+    assert [f.name for f in result.unregistered_functions] == ["post_pet_extra"]
+
+    # A worker pool gives the same results as parsing in-process
+    monkeypatch.setattr(function_validator, "_parse_tool_file", original_parse)
+    monkeypatch.setattr(function_validator, "PARALLEL_MIN_FILES", 2)
+    pooled = FunctionValidator(tmp_path, jobs=2, use_cache=False).validate_project(project)
+    assert tool_files >= 2 and summary(pooled) == summary(result)
+
+
+def test_synth_spec_is_deterministic_and_generates(monkeypatch, tmp_path):
+    import json
+    from click.testing import CliRunner
+    from openapi_mcp_codegen.__main__ import cli
+    from openapi_mcp_codegen.synth_spec import synthesize_spec
+
+    spec = synthesize_spec(operations=23, schemas=7, schema_depth=3, ref_fanout=2, enum_size=5, seed=1)
+    assert spec == synthesize_spec(operations=23, schemas=7, schema_depth=3, ref_fanout=2, enum_size=5, seed=1)
+    assert spec != synthesize_spec(operations=23, schemas=7, schema_depth=3, ref_fanout=2, enum_size=5, seed=2)
+    assert sum(len(item) for item in spec["paths"].values()) == 23
+    schemas = spec["components"]["schemas"]
+    assert len(schemas) == 7 * 4
+    # Entity -> Level2 -> Level1 -> Level0
+    assert schemas["Entity0"]["allOf"][0] == {"$ref": "#/components/schemas/Entity0Level2"}
+    assert "allOf" not in schemas["Entity0Level0"]
+    assert len(schemas["Entity0"]["allOf"][1]["properties"]["status"]["enum"]) == 5
+    acyclic = synthesize_spec(operations=5, schemas=4, schema_depth=0, recursive=False)["components"]["schemas"]
+    assert "parent" not in acyclic["Entity0"]["properties"]
+    assert all(int(p["$ref"].rsplit("Entity", 1)[1]) > 1
+               for name, p in acyclic["Entity1"]["properties"].items() if name.startswith("related"))
+
+    out = tmp_path / "synth" / "spec.json"
+    result = CliRunner().invoke(cli, ["synth-spec", "-o", str(out), "--operations", "12", "--schemas", "4"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(out.read_text()) == synthesize_spec(operations=12, schemas=4)
+    monkeypatch.setattr(MCPGenerator, "run_ruff_lint", lambda self, *files: None)
+    gen = MCPGenerator(script_dir=os.path.join(os.getcwd(), "openapi_mcp_codegen"), spec_path=str(out),
+                       output_dir=str(tmp_path / "out"), config_path=str(out.parent / "config.yaml"))
+    gen.generate()
+    assert sum(len(names) for names in gen.tools_map.values()) == 12
+
+def test_profile_report_covers_phases_templates_and_files(monkeypatch, tmp_path, setup_env):
+    import json
+    import pstats
+    from openapi_mcp_codegen import mcp_codegen, profiling
+    monkeypatch.setattr(mcp_codegen, "run_ruff", lambda files: None)
+    monkeypatch.setattr(MCPGenerator, "_run_function_validation", lambda self: None)
+    report_path, cprofile_path = tmp_path / "profile.json", tmp_path / "generate.prof"
+
+    with profiling.profile("generate-mcp", str(report_path), str(cprofile_path), top=3):
+        gen = MCPGenerator(**{**setup_env, "output_dir": str(tmp_path / "out")})
+        gen.generate()
+    assert profiling.active_profiler() is None
+
+    report = json.loads(report_path.read_text())
+    assert report["command"] == "generate-mcp" and report["wall_seconds"] > 0
+    assert {"parse", "generate", "generate/tool_modules", "generate/ruff", "generate/validate"} <= set(report["phases"])
+    assert report["templates"]["tools/tool.tpl"]["renders"] == len(gen.tools_map)
+    slowest = report["slowest_tool_modules"]
+    assert len(slowest) == 3 and all(os.sep + "tools" + os.sep in item["output"] for item in slowest)
+    assert slowest == sorted(slowest, key=lambda item: -item["wall_seconds"])
+    assert report["files"]["written"] > len(gen.tools_map) and report["files"]["unchanged"] == 0
+    assert report["files"]["bytes_written"] > 0
+    assert report["ruff"]["runs"] == 1 and report["ruff"]["files"] > 1
+    assert report["llm"]["calls"] == 0
+    assert pstats.Stats(str(cprofile_path)).total_calls > 0
+
+    # Without a profiler nothing is recorded and no phases are timed
+    assert profiling.phase("generate") is profiling.phase("other")
+
+def test_docstring_enhancement_batches_per_module_with_fallback(monkeypatch, tmp_path, setup_env):
+    import ast
+    import json
+    import re
+    import threading
+    monkeypatch.setattr(MCPGenerator, "run_ruff_lint", lambda self, *files: None)
+    lock, requests, clients = threading.Lock(), [], []
+
+    class DummyLLM:
+        def invoke(self, messages):
+            prompt = messages[-1].content
+            names = re.findall(r"^### (\w+)$", prompt, re.MULTILINE)
+            with lock:
+                requests.append(names)
+            class DummyResponse:
+                # The batch leaves out its last function, which falls back to a single request
+                content = (json.dumps({name: f"Batched docstring for {name}" for name in names[:-1]})
+                           if names else '"""Single docstring"""')
+            return DummyResponse()
+
+    def factory():
+        clients.append(DummyLLM())
+        return type("Dummy", (), {"get_llm": lambda self: clients[-1]})()
+    monkeypatch.setattr("cnoe_agent_utils.LLMFactory", factory)
+
+    gen = MCPGenerator(**{**setup_env, "output_dir": str(tmp_path / "out")}, enhance_docstring_with_llm=True)
+    gen.generate_tool_modules()
+    assert len(clients) == 1
+
+    tools_dir = tmp_path / "out" / "mcp_petstore" / "tools"
+    counts = {path.name: sum(isinstance(node, ast.AsyncFunctionDef) for node in ast.walk(ast.parse(path.read_text())))
+              for path in tools_dir.glob("*.py") if path.name != "__init__.py"}
+    batched = [names for names in requests if names]
+    assert len(batched) == sum(1 for count in counts.values() if count > 1)
+    assert len(requests) - len(batched) == len(counts)
+    for path in tools_dir.glob("*.py"):
+        if path.name == "__init__.py":
+            continue
+        docs = [ast.get_docstring(node) for node in ast.walk(ast.parse(path.read_text()))
+                if isinstance(node, ast.AsyncFunctionDef)]
+        assert docs.count("Single docstring") == 1
+        assert all(doc.startswith(("Batched docstring for", "Single docstring")) for doc in docs)
+
+    # Enhancement happens before the write, so the enhanced modules are the ones formatted
+    queued = set(gen.formatter.pending)
+    assert {str(path) for path in tools_dir.glob("*.py") if path.name != "__init__.py"} <= queued
+    gen.format_generated_files()
+    # Unchanged renders are skipped before enhancement: no LLM requests, no writes
+    sent = len(requests)
+    gen2 = MCPGenerator(**{**setup_env, "output_dir": str(tmp_path / "out")}, enhance_docstring_with_llm=True)
+    gen2.generate_tool_modules()
+    assert len(requests) == sent
+    assert gen2.formatter.written == {}
+    assert "Single docstring" in (tools_dir / "pet_petid.py").read_text()
+
+def test_docstring_enhancement_matches_batch_answers_by_unique_key(monkeypatch, tmp_path, setup_env):
+    import ast
+    import json
+    import re
+    source = tmp_path / "nested.py"
+    source.write_text(
+        'def first():\n    """First."""\n    def wrapper():\n        """Inner."""\n    return wrapper\n\n'
+        'def second():\n    """Second."""\n    def wrapper():\n        """Inner."""\n    return wrapper\n\n'
+        'def dup():\n    """One."""\n\ndef dup():\n    """Two."""\n'
+    )
+    batches = []
+
+    class DummyLLM:
+        def invoke(self, messages):
+            keys = re.findall(r"^### (.+)$", messages[-1].content, re.MULTILINE)
+            batches.append(keys)
+            class DummyResponse:
+                # Answers for functions of other batches must be ignored
+                content = (json.dumps({**{key: "WRONG" for key in ("first", "second.wrapper", "dup@16")},
+                                       **{key: f"Doc for {key}" for key in keys}})
+                           if keys else '"""Single"""')
+            return DummyResponse()
+    monkeypatch.setattr("cnoe_agent_utils.LLMFactory", lambda: type("Dummy", (), {"get_llm": lambda self: DummyLLM()})())
+
+    gen = MCPGenerator(**setup_env, enhance_docstring_with_llm=True)
+    gen.config = {**gen.config, "docstring_enhancements": {"llm_batch_token_budget": 75, "llm_cache": False}}
+    gen.enhance_docstring_with_llm(str(source), str(source))
+    assert batches == [["first", "first.wrapper"], ["second", "second.wrapper"], ["dup@13", "dup@16"]]
+
+    nodes = [node for _, node in gen._docstring_function_keys(ast.parse(source.read_text()))]
+    assert [ast.get_docstring(node) for node in nodes] == [f"Doc for {key}" for keys in batches for key in keys]
+
+def test_docstring_enhancement_toggle_rewrites_unchanged_renders(monkeypatch, tmp_path, setup_env):
+    monkeypatch.setattr(MCPGenerator, "run_ruff_lint", lambda self, *files: None)
+    requests = []
+
+    class DummyLLM:
+        def invoke(self, messages):
+            requests.append(messages)
+            class DummyResponse:
+                content = '"""Enhanced docstring"""'
+            return DummyResponse()
+    monkeypatch.setattr("cnoe_agent_utils.LLMFactory", lambda: type("Dummy", (), {"get_llm": lambda self: DummyLLM()})())
+    module = tmp_path / "out" / "mcp_petstore" / "tools" / "pet_petid.py"
+
+    def generate(**flags):
+        gen = MCPGenerator(**{**setup_env, "output_dir": str(tmp_path / "out")}, **flags)
+        gen.generate_tool_modules()
+        gen.format_generated_files()
+        return module.read_text()
+
+    assert "Enhanced docstring" not in generate()
+    # Same renders, enhancement switched on: the modules are enhanced
+    assert "Enhanced docstring" in generate(enhance_docstring_with_llm=True)
+    sent = len(requests)
+    assert sent
+    assert "Enhanced docstring" in generate(enhance_docstring_with_llm=True)
+    assert len(requests) == sent
+    # The OpenAPI prompt variant enhances again
+    generate(enhance_docstring_with_llm_openapi=True)
+    assert len(requests) > sent
+    # Switched off again: the enhanced docstrings are replaced by the rendered ones
+    assert "Enhanced docstring" not in generate()
+
+def test_docstring_enhancement_cached_by_function_source(monkeypatch, tmp_path, setup_env):
+    import json
+    from openapi_mcp_codegen import profiling
+    requests = []
+
+    class DummyLLM:
+        model_name = "dummy-1"
+        def invoke(self, messages):
+            requests.append(messages[-1].content)
+            class DummyResponse:
+                content = json.dumps({"first": "Doc of first", "second": "Doc of second"})
+            return DummyResponse()
+    monkeypatch.setattr("cnoe_agent_utils.LLMFactory", lambda: type("Dummy", (), {"get_llm": lambda self: DummyLLM()})())
+
+    source = 'async def first(a):\n    """Old first"""\n    return a\n\nasync def second(b):\n    """Old second"""\n    return b\n'
+    def enhance(body=source, **kwargs):
+        gen = MCPGenerator(**setup_env, enhance_docstring_with_llm=True, **kwargs)
+        return gen.enhance_docstrings([("tool.py", body)])[0]
+
+    with profiling.profile("generate-mcp", str(tmp_path / "profile.json")):
+        enhanced = enhance()
+    assert len(requests) == 1 and "Doc of first" in enhanced and "Doc of second" in enhanced
+    assert json.loads((tmp_path / "profile.json").read_text())["caches"]["docstrings"] == {"hits": 0, "misses": 2}
+
+    # Unchanged functions are served from the cache by a new generator
+    assert enhance() == enhanced
+    assert len(requests) == 1
+    # A changed function body, the OpenAPI prompt variant and --refresh-llm-cache all miss
+    enhance(source.replace("return b", "return b + 1"))
+    assert len(requests) == 2 and "Function Name: second" in requests[-1] and "Function Name: first" not in requests[-1]
+    enhance(enhance_docstring_with_llm_openapi=True)
+    enhance(refresh_llm_cache=True)
+    enhance(use_llm_cache=False)
+    assert len(requests) == 5
+
+def test_table_tool_mode_sends_the_same_requests(monkeypatch, tmp_path, setup_env):
+    import asyncio
+    import importlib
+    import inspect
+    import sys
+    monkeypatch.setattr(MCPGenerator, "run_ruff_lint", lambda self, *files: None)
+    monkeypatch.setenv("PETSTORE_API_URL", "http://localhost:1")
+    monkeypatch.setenv("PETSTORE_TOKEN", "token")
+    samples = {int: 3, float: 1.5, bool: True, str: "value", list: ["a", "b"], dict: {"key": 1}}
+
+    def requests_made(tool_mode):
+        out = tmp_path / tool_mode
+        gen = MCPGenerator(**{**setup_env, "output_dir": str(out)}, tool_mode=tool_mode)
+        gen.generate_api_client()
+        gen.generate_tool_modules()
+        for name in [name for name in sys.modules if name.split(".")[0] == "mcp_petstore"]:
+            monkeypatch.delitem(sys.modules, name)
+        monkeypatch.syspath_prepend(str(out))
+        client = importlib.import_module("mcp_petstore.api.client")
+        calls = []
+        async def fake_request(path, method="GET", params={}, data={}, **kwargs):
+            calls.append((method, path, params, data))
+            return True, {"ok": True}
+        monkeypatch.setattr(client, "make_api_request", fake_request)
+        for module_name, functions in sorted(gen.tools_map.items()):
+            module = importlib.import_module(f"mcp_petstore.tools.{module_name}")
+            for function_name in functions:
+                function = getattr(module, function_name)
+                arguments = {name: samples.get(getattr(param.annotation, "__origin__", param.annotation), "value")
+                             for name, param in inspect.signature(function).parameters.items()}
+                assert asyncio.run(function(**arguments)) == {"ok": True}
+        return gen, calls
+
+    gen, function_calls = requests_made("function")
+    table_gen, table_calls = requests_made("table")
+    assert table_calls == function_calls
+    assert any(data for _, _, _, data in table_calls) and any(params for _, _, params, _ in table_calls)
+    tools = tmp_path / "table" / "mcp_petstore" / "tools"
+    assert "make_api_request" not in (tools / "pet.py").read_text()
+    assert sum(len(path.read_text()) for path in tools.glob("*.py")) < \
+        sum(len(path.read_text()) for path in (tmp_path / "function" / "mcp_petstore" / "tools").glob("*.py"))
+    with pytest.raises(ValueError):
+        MCPGenerator(**setup_env, tool_mode="compact")
+
+
+def test_lazy_tools_register_from_manifest_without_importing(monkeypatch, tmp_path, setup_env):
+    import asyncio
+    import importlib
+    import json
+    import sys
+    from fastmcp import FastMCP
+    from openapi_mcp_codegen.function_validator import FunctionValidator
+    from fastmcp.tools import Tool
+    monkeypatch.setattr(MCPGenerator, "run_ruff_lint", lambda self, *files: None)
+    monkeypatch.setattr(MCPGenerator, "_run_function_validation", lambda self: None)
+    monkeypatch.setenv("PETSTORE_API_URL", "http://localhost:1")
+    monkeypatch.setenv("PETSTORE_TOKEN", "token")
+    out = tmp_path / "lazy"
+    gen = MCPGenerator(**{**setup_env, "output_dir": str(out)}, lazy_tools=True)
+    gen.generate()
+    package = out / "mcp_petstore"
+    manifest = json.loads((package / "tools_manifest.json").read_text())
+    assert [(tool["module"], tool["function"]) for tool in manifest["tools"]] == \
+        [(module, function) for module, functions in gen.tools_map.items() for function in functions]
+    assert "from mcp_petstore.tools import" not in (package / "server.py").read_text()
+    assert FunctionValidator(out, use_cache=False).extract_registered_functions(package / "server.py") == \
+        {tool["function"] for tool in manifest["tools"]}
+
+    for name in [name for name in sys.modules if name.split(".")[0] == "mcp_petstore"]:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(out))
+    server = importlib.import_module("mcp_petstore.server")
+    mcp = FastMCP("petstore")
+    server.register_tools(mcp)
+    assert not [name for name in sys.modules if name.startswith("mcp_petstore.tools.")]
+    tools = {tool.name: tool for tool in asyncio.run(mcp.list_tools())}
+    assert set(tools) == {tool["name"] for tool in manifest["tools"]}
+
+    entry = next(tool for tool in manifest["tools"] if tool["parameters"].get("required"))
+    client = importlib.import_module("mcp_petstore.api.client")
+    async def fake_request(path, method="GET", params={}, data={}, **kwargs):
+        return True, {"ok": True}
+    monkeypatch.setattr(client, "make_api_request", fake_request)
+    function = getattr(importlib.import_module(f"mcp_petstore.tools.{entry['module']}"), entry["function"])
+    expected = Tool.from_function(function).parameters
+    assert entry["parameters"]["properties"].keys() == expected["properties"].keys()
+    assert set(entry["parameters"].get("required", [])) == set(expected.get("required", []))
+    for name, schema in expected["properties"].items():
+        assert entry["parameters"]["properties"][name].get("type") == schema.get("type")
+    samples = {"integer": 3, "number": 1.5, "boolean": True, "array": ["a"], "object": {"key": 1}}
+    arguments = {name: schema["enum"][0] if "enum" in schema else samples.get(schema.get("type"), "value")
+                 for name, schema in entry["parameters"]["properties"].items() if name in expected["required"]}
+    for name in [name for name in sys.modules if name.startswith("mcp_petstore.tools.")]:
+        monkeypatch.delitem(sys.modules, name)
+    assert asyncio.run(tools[entry["name"]].run(arguments)) is not None
+    assert f"mcp_petstore.tools.{entry['module']}" in sys.modules